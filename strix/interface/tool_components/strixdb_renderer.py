@@ -764,6 +764,48 @@ class StrixDBRepoStatusRenderer(BaseRenderer):
             console.print(f"[red]❌ Status Error: {error}[/red]")
 
 
+class StrixDBMetricsRenderer(BaseRenderer):
+    """Renderer for strixdb_metrics results."""
+
+    def render(self, result: dict[str, Any], console: Console | None = None) -> None:
+        console = console or Console()
+
+        if result.get("success"):
+            content = Text()
+            content.append("📈 StrixDB Metrics\n\n", style="bold cyan")
+            
+            content.append("Cache Hits: ", style="dim")
+            content.append(f"{result.get('cache_hits', 0)}\n", style="green")
+            
+            content.append("ETag 304s: ", style="dim")
+            content.append(f"{result.get('etag_304', 0)}\n", style="green")
+            
+            content.append("GraphQL Batches: ", style="dim")
+            content.append(f"{result.get('graphql_batches', 0)}\n", style="cyan")
+            
+            content.append("Search Cache Hit Rate: ", style="dim")
+            content.append(f"{result.get('search_cache_hit_rate', 0.0):.0%}\n", style="cyan")
+            
+            remaining = result.get("rate_limit_remaining")
+            content.append("Rate Limit Remaining: ", style="dim")
+            if remaining is None:
+                content.append("unknown\n", style="dim")
+            else:
+                content.append(f"{remaining}", style="bold white")
+                reset_in = result.get("rate_limit_reset_in", 0)
+                content.append(f" (resets in {reset_in}s)\n", style="dim")
+
+            panel = Panel(
+                content,
+                title="[bold cyan]📈 StrixDB Metrics",
+                border_style="cyan",
+            )
+            console.print(panel)
+        else:
+            error = result.get("error", "Failed to get metrics")
+            console.print(f"[red]❌ Metrics Error: {error}[/red]")
+
+
 class StrixDBRepoListRenderer(BaseRenderer):
     """Renderer for strixdb_repo_list results."""
 
@@ -838,9 +880,12 @@ STRIXDB_RENDERERS = {
     "strixdb_repo_extract_all": StrixDBRepoExtractAllRenderer,
     "strixdb_repo_extract_status": StrixDBRepoStatusRenderer,
     "strixdb_repo_list_extracted": StrixDBListRenderer,
+    "strixdb_repo_list_extracted_page": StrixDBListRenderer,
     "strixdb_repo_get_item": StrixDBGetRenderer,
+    "strixdb_repo_get_items": StrixDBListRenderer,
     "strixdb_repo_search": StrixDBSearchRenderer,
     "strixdb_repo_list": StrixDBRepoListRenderer,
+    "strixdb_metrics": StrixDBMetricsRenderer,
 }
 
 
@@ -6,6 +6,7 @@ with Cloudflared tunnels.
 
 import json
 import logging
+import os
 import time
 from typing import Any
 
@@ -17,10 +18,14 @@ from .retry_handler import retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
-import os
 
-# Default timeouts
-DEFAULT_TIMEOUT = float(os.getenv("STRIX_TOOL_TIMEOUT", "300.0"))
+def _default_timeout() -> float:
+    """Request timeout from STRIX_TOOL_TIMEOUT, read at call time (default: 300s)."""
+    return float(os.getenv("STRIX_TOOL_TIMEOUT", "300.0"))
+
+
+# Default timeouts (DEFAULT_TIMEOUT is the value at import; clients use _default_timeout())
+DEFAULT_TIMEOUT = _default_timeout()
 DEFAULT_CONNECT_TIMEOUT = 10.0
 
 
@@ -54,7 +59,7 @@ class HttpToolClient:
         
         self.server_url = server_url.rstrip("/")
         self.auth_token = auth_token
-        self.timeout = timeout or DEFAULT_TIMEOUT
+        self.timeout = timeout or _default_timeout()
         self._metrics = get_metrics()
         self._cache = get_cache()
         
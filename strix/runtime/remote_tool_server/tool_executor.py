@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
@@ -12,8 +13,15 @@ logger = logging.getLogger(__name__)
 
 # Default thread pool size for concurrent execution
 DEFAULT_POOL_SIZE = 10
-import os
-TOOL_EXECUTION_TIMEOUT = float(os.getenv("STRIX_TOOL_EXECUTION_TIMEOUT", "300.0"))  # seconds
+
+
+def _tool_execution_timeout() -> float:
+    """Per-tool timeout in seconds from STRIX_TOOL_EXECUTION_TIMEOUT, read at call time."""
+    return float(os.getenv("STRIX_TOOL_EXECUTION_TIMEOUT", "300.0"))
+
+
+# Value at import; execution reads _tool_execution_timeout()
+TOOL_EXECUTION_TIMEOUT = _tool_execution_timeout()  # seconds
 
 
 class ToolExecutor:
@@ -139,11 +147,12 @@ class ToolExecutor:
             return self.execute_tool(tool_name, kwargs, agent_state)
 
         # Execute all tools concurrently
+        timeout = _tool_execution_timeout()
         with concurrent.futures.ThreadPoolExecutor(max_workers=len(tools)) as executor:
             futures = [executor.submit(execute_single, tool_spec) for tool_spec in tools]
             for future in concurrent.futures.as_completed(futures):
                 try:
-                    results.append(future.result(timeout=TOOL_EXECUTION_TIMEOUT))
+                    results.append(future.result(timeout=timeout))
                 except Exception as e:
                     results.append({"error": f"Execution error: {e}"})
 
@@ -1,90 +1,128 @@
+import logging
 import os
-from typing import Any
+from collections.abc import Callable
+from typing import Any, Final
 
 from strix.tools.registry import register_tool
 
 
+logger = logging.getLogger(__name__)
+
 # Minimum percentage of allocated time that must be used before allowing finish
 # Default: 80% of allocated time must be used (e.g., for 4 hours, must use at least 3.2 hours)
 # Set STRIX_MIN_TIME_PERCENT=0 to disable this check
 MIN_TIME_USAGE_PERCENT = float(os.getenv("STRIX_MIN_TIME_PERCENT", "80"))
 
-
-def _check_minimum_time_elapsed(agent_state: Any) -> dict[str, Any] | None:
+# Completion messages indexed by int(not success)
+_MSG_OK = ("Scan completed successfully", "Scan completed with errors")
+_MSG_NOPERSIST = (
+    "Scan completed successfully (not persisted)",
+    "Scan completed with errors (not persisted)",
+)
+
+# Static instructional tails appended to finish_scan rejection messages
+_MIN_TIME_WHAT_TO_DO: Final = (
+    "WHAT TO DO:\n"
+    "1. Continue your security assessment - there are likely more vulnerabilities to find\n"
+    "2. Explore additional attack vectors you haven't tried yet\n"
+    "3. Go deeper on promising findings\n"
+    "4. Test with different payloads and techniques\n"
+    "5. Create subagents for parallel testing\n\n"
+    "Remember: Bug bounty hunters spend DAYS on single targets. "
+    "Use your time wisely and thoroughly!"
+)
+_ACTIVE_AGENTS_SUGGESTIONS: Final = (
+    "\n\nSuggested actions:\n"
+    "1. Use wait_for_message to wait for all agents to complete\n"
+    "2. Send messages to agents asking them to finish if urgent\n"
+    "3. Use view_agent_graph to monitor agent status"
+)
+
+
+def _check_minimum_time_elapsed(
+    agent_state: Any,
+    _min_pct: float = MIN_TIME_USAGE_PERCENT,
+) -> dict[str, Any] | None:
     """Check if the agent has used at least the minimum required time.
     
     This prevents agents from finishing too early when they have been allocated
     a specific timeframe for scanning. The agent should utilize most of the 
     allocated time for thorough testing.
     
+    ``_min_pct`` is bound from MIN_TIME_USAGE_PERCENT at definition time so the
+    threshold is a local lookup; callers should not pass it.
+    
     Returns:
         Error dict if minimum time hasn't elapsed, None otherwise.
     """
-    # Skip check if disabled
-    if MIN_TIME_USAGE_PERCENT <= 0:
-        return None
-    
     if agent_state is None:
         return None
     
     # Check if session timer is active
-    if not hasattr(agent_state, "session_start_time") or agent_state.session_start_time is None:
+    if getattr(agent_state, "session_start_time", None) is None:
         return None
     
-    if not hasattr(agent_state, "session_duration_minutes"):
+    total_minutes = getattr(agent_state, "session_duration_minutes", None)
+    if not isinstance(total_minutes, (int, float)) or total_minutes <= 0:
+        return None
+    
+    get_elapsed = getattr(agent_state, "get_elapsed_session_minutes", None)
+    get_remaining = getattr(agent_state, "get_remaining_session_minutes", None)
+    if get_elapsed is None or get_remaining is None:
         return None
     
     try:
-        elapsed_minutes = agent_state.get_elapsed_session_minutes()
-        total_minutes = agent_state.session_duration_minutes
-        remaining_minutes = agent_state.get_remaining_session_minutes()
+        elapsed_minutes = get_elapsed()
+        remaining_minutes = get_remaining()
         
         # Calculate usage percentage
-        usage_percent = (elapsed_minutes / total_minutes) * 100 if total_minutes > 0 else 100
-        
-        # Check if minimum time has been used
-        if usage_percent < MIN_TIME_USAGE_PERCENT:
-            min_required_minutes = (MIN_TIME_USAGE_PERCENT / 100) * total_minutes
-            additional_minutes_needed = min_required_minutes - elapsed_minutes
-            
-            return {
-                "success": False,
-                "message": (
-                    f"🚫 CANNOT FINISH YET: You have only used {elapsed_minutes:.1f} minutes "
-                    f"({usage_percent:.1f}%) of your allocated {total_minutes:.0f} minutes.\n\n"
-                    f"You must use at least {MIN_TIME_USAGE_PERCENT:.0f}% ({min_required_minutes:.0f} minutes) "
-                    f"of your allocated time before finishing.\n\n"
-                    f"⏰ You have {remaining_minutes:.1f} minutes remaining. "
-                    f"You need to work for at least {additional_minutes_needed:.1f} more minutes.\n\n"
-                    f"WHAT TO DO:\n"
-                    f"1. Continue your security assessment - there are likely more vulnerabilities to find\n"
-                    f"2. Explore additional attack vectors you haven't tried yet\n"
-                    f"3. Go deeper on promising findings\n"
-                    f"4. Test with different payloads and techniques\n"
-                    f"5. Create subagents for parallel testing\n\n"
-                    f"Remember: Bug bounty hunters spend DAYS on single targets. "
-                    f"Use your time wisely and thoroughly!"
-                ),
-                "time_stats": {
-                    "elapsed_minutes": elapsed_minutes,
-                    "total_minutes": total_minutes,
-                    "remaining_minutes": remaining_minutes,
-                    "usage_percent": usage_percent,
-                    "min_required_percent": MIN_TIME_USAGE_PERCENT,
-                    "min_required_minutes": min_required_minutes,
-                    "additional_minutes_needed": additional_minutes_needed,
-                },
-            }
-        
+        usage_percent = (elapsed_minutes / total_minutes) * 100
     except (AttributeError, TypeError, ZeroDivisionError) as e:
         # If we can't check time, allow finish (fail-safe)
-        import logging
-        logging.warning(f"Could not check minimum time elapsed: {e}")
+        logger.warning("Could not check minimum time elapsed: %s", e)
+        return None
+    
+    # Check if minimum time has been used
+    if usage_percent >= _min_pct:
         return None
     
+    min_required_minutes = (_min_pct / 100) * total_minutes
+    additional_minutes_needed = min_required_minutes - elapsed_minutes
+    
+    return {
+        "success": False,
+        "message": (
+            f"🚫 CANNOT FINISH YET: You have only used {elapsed_minutes:.1f} minutes "
+            f"({usage_percent:.1f}%) of your allocated {total_minutes:.0f} minutes.\n\n"
+            f"You must use at least {_min_pct:.0f}% ({min_required_minutes:.0f} minutes) "
+            f"of your allocated time before finishing.\n\n"
+            f"⏰ You have {remaining_minutes:.1f} minutes remaining. "
+            f"You need to work for at least {additional_minutes_needed:.1f} more minutes.\n\n"
+            f"{_MIN_TIME_WHAT_TO_DO}"
+        ),
+        "time_stats": {
+            "elapsed_minutes": elapsed_minutes,
+            "total_minutes": total_minutes,
+            "remaining_minutes": remaining_minutes,
+            "usage_percent": usage_percent,
+            "min_required_percent": _min_pct,
+            "min_required_minutes": min_required_minutes,
+            "additional_minutes_needed": additional_minutes_needed,
+        },
+    }
+
+
+def _skip_minimum_time_check(_agent_state: Any) -> dict[str, Any] | None:
     return None
 
 
+# Specialize the time check once at import: when STRIX_MIN_TIME_PERCENT <= 0 the
+# check is dead code, so finish_scan skips it and the name binds to a no-op.
+_MIN_TIME_CHECK_ENABLED = MIN_TIME_USAGE_PERCENT > 0
+if not _MIN_TIME_CHECK_ENABLED:
+    _check_minimum_time_elapsed = _skip_minimum_time_check
+
+
 def _validate_root_agent(agent_state: Any) -> dict[str, Any] | None:
     if (
         agent_state is not None
@@ -102,7 +140,8 @@ def _validate_root_agent(agent_state: Any) -> dict[str, Any] | None:
 
 
 def _validate_content(content: str) -> dict[str, Any] | None:
-    if not content or not content.strip():
+    # finish_scan strips content once up front, so an empty check suffices here
+    if not content:
         return {"success": False, "message": "Content cannot be empty"}
     return None
 
@@ -111,78 +150,71 @@ def _check_active_agents(agent_state: Any = None) -> dict[str, Any] | None:
     try:
         from strix.tools.agents_graph.agents_graph_actions import _agent_graph
 
-        current_agent_id = None
-        if agent_state and hasattr(agent_state, "agent_id"):
-            current_agent_id = agent_state.agent_id
+        nodes = _agent_graph.get("nodes")
+        if not nodes:
+            return None
+
+        current_agent_id = getattr(agent_state, "agent_id", None) if agent_state else None
 
-        running_agents = []
-        stopping_agents = []
+        running_agents: list[dict[str, Any]] = []
+        stopping_agents: list[dict[str, Any]] = []
+        append_running = running_agents.append
+        append_stopping = stopping_agents.append
 
-        for agent_id, node in _agent_graph.get("nodes", {}).items():
+        for agent_id, node in nodes.items():
             if agent_id == current_agent_id:
                 continue
 
-            status = node.get("status", "")
+            get = node.get
+            status = get("status", "")
             if status == "running":
-                running_agents.append(
+                append_running(
                     {
                         "id": agent_id,
-                        "name": node.get("name", "Unknown"),
-                        "task": node.get("task", "No task description"),
+                        "name": get("name", "Unknown"),
+                        "task": get("task", "No task description"),
                     }
                 )
             elif status == "stopping":
-                stopping_agents.append(
+                append_stopping(
                     {
                         "id": agent_id,
-                        "name": node.get("name", "Unknown"),
+                        "name": get("name", "Unknown"),
                     }
                 )
 
-        if running_agents or stopping_agents:
-            message_parts = ["Cannot finish scan while other agents are still active:"]
+        if not running_agents and not stopping_agents:
+            return None
 
-            if running_agents:
-                message_parts.append("\n\nRunning agents:")
-                message_parts.extend(
-                    [
-                        f"  - {agent['name']} ({agent['id']}): {agent['task']}"
-                        for agent in running_agents
-                    ]
-                )
+        message_parts = ["Cannot finish scan while other agents are still active:"]
 
-            if stopping_agents:
-                message_parts.append("\n\nStopping agents:")
-                message_parts.extend(
-                    [f"  - {agent['name']} ({agent['id']})" for agent in stopping_agents]
-                )
+        if running_agents:
+            message_parts.append("\n\nRunning agents:")
+            message_parts.extend(
+                f"  - {agent['name']} ({agent['id']}): {agent['task']}"
+                for agent in running_agents
+            )
 
+        if stopping_agents:
+            message_parts.append("\n\nStopping agents:")
             message_parts.extend(
-                [
-                    "\n\nSuggested actions:",
-                    "1. Use wait_for_message to wait for all agents to complete",
-                    "2. Send messages to agents asking them to finish if urgent",
-                    "3. Use view_agent_graph to monitor agent status",
-                ]
+                f"  - {agent['name']} ({agent['id']})" for agent in stopping_agents
             )
 
-            return {
-                "success": False,
-                "message": "\n".join(message_parts),
-                "active_agents": {
-                    "running": len(running_agents),
-                    "stopping": len(stopping_agents),
-                    "details": {
-                        "running": running_agents,
-                        "stopping": stopping_agents,
-                    },
-                },
-            }
+        message_parts.append(_ACTIVE_AGENTS_SUGGESTIONS)
 
-    except ImportError:
-        import logging
+        return {
+            "success": False,
+            "message": "\n".join(message_parts),
+            "active_agents": {
+                "running": len(running_agents),
+                "stopping": len(stopping_agents),
+                "details": {"running": running_agents, "stopping": stopping_agents},
+            },
+        }
 
-        logging.warning("Could not check agent graph status - agents_graph module unavailable")
+    except ImportError:
+        logger.warning("Could not check agent graph status - agents_graph module unavailable")
 
     return None
 
@@ -194,29 +226,23 @@ def _finalize_with_tracer(content: str, success: bool) -> dict[str, Any]:
         tracer = get_global_tracer()
         if tracer:
             tracer.set_final_scan_result(
-                content=content.strip(),
+                content=content,
                 success=success,
             )
 
             return {
                 "success": True,
                 "scan_completed": True,
-                "message": "Scan completed successfully"
-                if success
-                else "Scan completed with errors",
+                "message": _MSG_OK[not success],
                 "vulnerabilities_found": len(tracer.vulnerability_reports),
             }
 
-        import logging
-
-        logging.warning("Global tracer not available - final scan result not stored")
+        logger.warning("Global tracer not available - final scan result not stored")
 
         return {  # noqa: TRY300
             "success": True,
             "scan_completed": True,
-            "message": "Scan completed successfully (not persisted)"
-            if success
-            else "Scan completed with errors (not persisted)",
+            "message": _MSG_NOPERSIST[not success],
             "warning": "Final result could not be persisted - tracer unavailable",
         }
 
@@ -224,13 +250,22 @@ def _finalize_with_tracer(content: str, success: bool) -> dict[str, Any]:
         return {
             "success": True,
             "scan_completed": True,
-            "message": "Scan completed successfully (not persisted)"
-            if success
-            else "Scan completed with errors (not persisted)",
+            "message": _MSG_NOPERSIST[not success],
             "warning": "Final result could not be persisted - tracer module unavailable",
         }
 
 
+# Ordered finish_scan validators as (validator, argument name, bypassed by force_finish).
+# The first validator returning an error dict short-circuits the pipeline. The minimum
+# time check (which prevents agents from finishing too early) is only included when enabled.
+_FINISH_VALIDATORS: Final[tuple[tuple[Callable[[Any], dict[str, Any] | None], str, bool], ...]] = (
+    (_validate_root_agent, "agent_state", False),
+    (_validate_content, "content", False),
+    *(((_check_minimum_time_elapsed, "agent_state", True),) if _MIN_TIME_CHECK_ENABLED else ()),
+    (_check_active_agents, "agent_state", False),
+)
+
+
 @register_tool(sandbox_execution=False)
 def finish_scan(
     content: str,
@@ -254,26 +289,16 @@ def finish_scan(
         Dictionary with completion status and any error messages.
     """
     try:
-        validation_error = _validate_root_agent(agent_state)
-        if validation_error:
-            return validation_error
-
-        validation_error = _validate_content(content)
-        if validation_error:
-            return validation_error
-
-        # Check if minimum time has elapsed (unless force_finish is set)
-        # This prevents agents from finishing too early
-        if not force_finish:
-            time_error = _check_minimum_time_elapsed(agent_state)
-            if time_error:
-                return time_error
-
-        active_agents_error = _check_active_agents(agent_state)
-        if active_agents_error:
-            return active_agents_error
-
-        return _finalize_with_tracer(content, success)
+        stripped_content = content.strip() if content else ""
+        validator_args = {"agent_state": agent_state, "content": stripped_content}
+        for validator, arg_name, bypassed_by_force in _FINISH_VALIDATORS:
+            if bypassed_by_force and force_finish:
+                continue
+            validation_error = validator(validator_args[arg_name])
+            if validation_error:
+                return validation_error
+
+        return _finalize_with_tracer(stripped_content, success)
 
     except (ValueError, TypeError, KeyError) as e:
         return {"success": False, "message": f"Failed to complete scan: {e!s}"}
@@ -44,9 +44,12 @@ Extract EVERYTHING valuable from repositories into StrixDB:
 - strixdb_repo_extract_all() - Extract everything
 - strixdb_repo_extract_status() - Check extraction progress
 - strixdb_repo_list_extracted() - Browse extracted content
+- strixdb_repo_list_extracted_page() - Browse extracted content page by page
 - strixdb_repo_get_item() - Get specific extracted item
+- strixdb_repo_get_items() - Get several extracted items at once
 - strixdb_repo_search() - Search across extractions
 - strixdb_repo_list() - List all extracted repos
+- strixdb_metrics() - Cache, batching and rate-limit counters
 
 ### Use Cases:
 - Clone bug bounty resource repos and extract all tools/wordlists
@@ -77,48 +80,76 @@ Environment Variables:
 - STRIXDB_BRANCH: Branch to use (default: "main")
 """
 
-# Original StrixDB actions
-from .strixdb_actions import (
-    strixdb_create_category,
-    strixdb_delete,
-    strixdb_export,
-    strixdb_get,
-    strixdb_get_categories,
-    strixdb_get_config_status,
-    strixdb_get_stats,
-    strixdb_import_item,
-    strixdb_list,
-    strixdb_save,
-    strixdb_search,
-    strixdb_update,
-)
-
-# NEW: Target Tracking System
-from .strixdb_targets import (
-    strixdb_target_init,
-    strixdb_target_session_start,
-    strixdb_target_session_end,
-    strixdb_target_add_finding,
-    strixdb_target_add_endpoint,
-    strixdb_target_add_note,
-    strixdb_target_add_technology,
-    strixdb_target_update_progress,
-    strixdb_target_get,
-    strixdb_target_list,
-)
-
-# NEW: Repository Knowledge Extraction
-from .strixdb_repo_extract import (
-    strixdb_repo_extract_init,
-    strixdb_repo_extract_file,
-    strixdb_repo_extract_category,
-    strixdb_repo_extract_all,
-    strixdb_repo_extract_status,
-    strixdb_repo_list_extracted,
-    strixdb_repo_get_item,
-    strixdb_repo_search,
-    strixdb_repo_list,
-)
+import importlib
+from typing import Any
+
+
+# Submodules are imported on first attribute access (PEP 562) so that importing
+# this package does not pull in every StrixDB action module up front.
+_LAZY_SUBMODULES = {
+    # Original StrixDB actions
+    "strixdb_actions": (
+        "strixdb_create_category",
+        "strixdb_delete",
+        "strixdb_export",
+        "strixdb_get",
+        "strixdb_get_categories",
+        "strixdb_get_config_status",
+        "strixdb_get_stats",
+        "strixdb_import_item",
+        "strixdb_list",
+        "strixdb_save",
+        "strixdb_search",
+        "strixdb_update",
+    ),
+    # NEW: Target Tracking System
+    "strixdb_targets": (
+        "strixdb_target_init",
+        "strixdb_target_session_start",
+        "strixdb_target_session_end",
+        "strixdb_target_add_finding",
+        "strixdb_target_add_endpoint",
+        "strixdb_target_add_note",
+        "strixdb_target_add_technology",
+        "strixdb_target_update_progress",
+        "strixdb_target_get",
+        "strixdb_target_list",
+    ),
+    # NEW: Repository Knowledge Extraction
+    "strixdb_repo_extract": (
+        "strixdb_repo_extract_init",
+        "strixdb_repo_extract_file",
+        "strixdb_repo_extract_category",
+        "strixdb_repo_extract_all",
+        "strixdb_repo_extract_status",
+        "strixdb_repo_list_extracted",
+        "strixdb_repo_list_extracted_page",
+        "strixdb_repo_get_item",
+        "strixdb_repo_get_items",
+        "strixdb_repo_search",
+        "strixdb_repo_list",
+        "strixdb_metrics",
+    ),
+}
+
+_LAZY = {
+    name: module_name for module_name, names in _LAZY_SUBMODULES.items() for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
 
 
 __all__ = [
@@ -155,7 +186,10 @@ __all__ = [
     "strixdb_repo_extract_all",
     "strixdb_repo_extract_status",
     "strixdb_repo_list_extracted",
+    "strixdb_repo_list_extracted_page",
     "strixdb_repo_get_item",
+    "strixdb_repo_get_items",
     "strixdb_repo_search",
     "strixdb_repo_list",
+    "strixdb_metrics",
 ]
@@ -26,12 +26,18 @@ from datetime import datetime, timezone
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from strix.tools.registry import register_tool
 
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session: repeated GitHub API calls reuse pooled connections
+# instead of paying a TCP+TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
 # Default categories (can be extended dynamically by the AI)
 DEFAULT_CATEGORIES = [
     "scripts",
@@ -86,7 +92,7 @@ def _get_strixdb_config() -> dict[str, str]:
     owner = ""
     if token:
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 "https://api.github.com/user",
                 headers=_get_headers(token),
                 timeout=10,
@@ -191,7 +197,7 @@ def _ensure_category_exists(category: str, config: dict[str, str]) -> bool:
     try:
         # Check if directory exists
         url = f"{config['api_base']}/repos/{config['repo']}/contents/{category}"
-        response = requests.get(url, headers=_get_headers(config["token"]), timeout=30)
+        response = _SESSION.get(url, headers=_get_headers(config["token"]), timeout=30)
         
         if response.status_code == 200:
             return True  # Already exists
@@ -211,7 +217,7 @@ Items in this category will be listed here as they are added.
             readme_encoded = base64.b64encode(readme_content.encode()).decode()
             
             create_url = f"{config['api_base']}/repos/{config['repo']}/contents/{category}/README.md"
-            create_response = requests.put(
+            create_response = _SESSION.put(
                 create_url,
                 headers=_get_headers(config["token"]),
                 json={
@@ -371,7 +377,7 @@ def strixdb_save(
         url = f"{config['api_base']}/repos/{config['repo']}/contents/{content_path}"
         
         # Check if file exists
-        response = requests.get(url, headers=_get_headers(config["token"]), timeout=30)
+        response = _SESSION.get(url, headers=_get_headers(config["token"]), timeout=30)
         
         payload: dict[str, Any] = {
             "message": f"[StrixDB] Add {category}/{name}",
@@ -386,7 +392,7 @@ def strixdb_save(
             payload["message"] = f"[StrixDB] Update {category}/{name}"
             metadata["version"] = response.json().get("version", 1) + 1
         
-        response = requests.put(
+        response = _SESSION.put(
             url,
             headers=_get_headers(config["token"]),
             json=payload,
@@ -407,7 +413,7 @@ def strixdb_save(
         meta_url = f"{config['api_base']}/repos/{config['repo']}/contents/{metadata_path}"
         
         # Check if metadata exists
-        meta_response = requests.get(meta_url, headers=_get_headers(config["token"]), timeout=30)
+        meta_response = _SESSION.get(meta_url, headers=_get_headers(config["token"]), timeout=30)
         
         meta_payload: dict[str, Any] = {
             "message": f"[StrixDB] Add metadata for {category}/{name}",
@@ -420,7 +426,7 @@ def strixdb_save(
             meta_payload["sha"] = meta_sha
             meta_payload["message"] = f"[StrixDB] Update metadata for {category}/{name}"
         
-        requests.put(
+        _SESSION.put(
             meta_url,
             headers=_get_headers(config["token"]),
             json=meta_payload,
@@ -492,7 +498,7 @@ def strixdb_search(
             "per_page": min(limit, 100),
         }
         
-        response = requests.get(
+        response = _SESSION.get(
             url,
             headers=_get_headers(config["token"]),
             params=params,
@@ -526,7 +532,7 @@ def strixdb_search(
                 # Fetch metadata to check tags
                 meta_path = path.replace(item_name, f"{item_name.rsplit('.', 1)[0]}_meta.json")
                 meta_url = f"{config['api_base']}/repos/{config['repo']}/contents/{meta_path}"
-                meta_response = requests.get(
+                meta_response = _SESSION.get(
                     meta_url,
                     headers=_get_headers(config["token"]),
                     timeout=10,
@@ -592,7 +598,7 @@ def strixdb_get(
     try:
         # List files in category to find matching item
         list_url = f"{config['api_base']}/repos/{config['repo']}/contents/{category}"
-        list_response = requests.get(
+        list_response = _SESSION.get(
             list_url,
             headers=_get_headers(config["token"]),
             timeout=30,
@@ -627,7 +633,7 @@ def strixdb_get(
             }
         
         # Fetch content
-        content_response = requests.get(
+        content_response = _SESSION.get(
             content_file["url"],
             headers=_get_headers(config["token"]),
             timeout=30,
@@ -646,7 +652,7 @@ def strixdb_get(
         # Fetch metadata if available
         metadata = {}
         if meta_file:
-            meta_response = requests.get(
+            meta_response = _SESSION.get(
                 meta_file["url"],
                 headers=_get_headers(config["token"]),
                 timeout=30,
@@ -709,7 +715,7 @@ def strixdb_list(
         
         for cat in categories_to_list:
             url = f"{config['api_base']}/repos/{config['repo']}/contents/{cat}"
-            response = requests.get(
+            response = _SESSION.get(
                 url,
                 headers=_get_headers(config["token"]),
                 timeout=30,
@@ -833,7 +839,7 @@ def strixdb_delete(
         
         # Get SHA for content file
         content_url = f"{config['api_base']}/repos/{config['repo']}/contents/{path}"
-        content_response = requests.get(
+        content_response = _SESSION.get(
             content_url,
             headers=_get_headers(config["token"]),
             timeout=30,
@@ -848,7 +854,7 @@ def strixdb_delete(
         content_sha = content_response.json().get("sha")
         
         # Delete content file
-        delete_response = requests.delete(
+        delete_response = _SESSION.delete(
             content_url,
             headers=_get_headers(config["token"]),
             json={
@@ -867,7 +873,7 @@ def strixdb_delete(
         
         # Try to delete metadata file
         meta_url = f"{config['api_base']}/repos/{config['repo']}/contents/{meta_path}"
-        meta_response = requests.get(
+        meta_response = _SESSION.get(
             meta_url,
             headers=_get_headers(config["token"]),
             timeout=30,
@@ -875,7 +881,7 @@ def strixdb_delete(
         
         if meta_response.status_code == 200:
             meta_sha = meta_response.json().get("sha")
-            requests.delete(
+            _SESSION.delete(
                 meta_url,
                 headers=_get_headers(config["token"]),
                 json={
@@ -928,7 +934,7 @@ def strixdb_get_categories(agent_state: Any) -> dict[str, Any]:
         if config["repo"] and config["token"]:
             try:
                 url = f"{config['api_base']}/repos/{config['repo']}/contents/{cat}"
-                response = requests.get(
+                response = _SESSION.get(
                     url,
                     headers=_get_headers(config["token"]),
                     timeout=10,
@@ -977,7 +983,7 @@ def strixdb_get_stats(agent_state: Any) -> dict[str, Any]:
     try:
         # Get repository info
         url = f"{config['api_base']}/repos/{config['repo']}"
-        response = requests.get(
+        response = _SESSION.get(
             url,
             headers=_get_headers(config["token"]),
             timeout=30,
@@ -998,7 +1004,7 @@ def strixdb_get_stats(agent_state: Any) -> dict[str, Any]:
         
         for cat in _get_valid_categories():
             cat_url = f"{config['api_base']}/repos/{config['repo']}/contents/{cat}"
-            cat_response = requests.get(
+            cat_response = _SESSION.get(
                 cat_url,
                 headers=_get_headers(config["token"]),
                 timeout=10,
@@ -1059,7 +1065,7 @@ def strixdb_get_config_status(agent_state: Any) -> dict[str, Any]:
     if is_configured:
         try:
             url = f"{config['api_base']}/repos/{config['repo']}"
-            response = requests.get(
+            response = _SESSION.get(
                 url,
                 headers=_get_headers(config["token"]),
                 timeout=10,
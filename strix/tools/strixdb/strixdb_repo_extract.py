@@ -34,25 +34,345 @@ EXTRACTION CATEGORIES:
 
 from __future__ import annotations
 
+import atexit
 import base64
 import hashlib
 import json
 import logging
 import os
 import re
+import shutil
 import subprocess
+import threading
+import time
 import uuid
+from collections import Counter, OrderedDict, defaultdict, deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from operator import itemgetter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from strix.tools.registry import register_tool
 
 
 logger = logging.getLogger(__name__)
 
+ZSTD_LEVEL = 9
+# Text items at least this large in these categories are stored zstd-compressed
+ZSTD_MIN_BYTES = 64 * 1024
+ZSTD_CATEGORIES = frozenset(("wordlists", "payloads", "documentation"))
+
+# Optional zstd support for large text items: the stdlib module on Python 3.14+,
+# otherwise python-zstandard. Without either, items are stored uncompressed.
+_zstd_available = False
+try:
+    from compression import zstd as _zstd  # type: ignore[import-not-found]
+    
+    def _zstd_compress(data: bytes) -> bytes:
+        return _zstd.compress(data, level=ZSTD_LEVEL)
+    
+    def _zstd_decompress(data: bytes) -> bytes:
+        return _zstd.decompress(data)
+    
+    _zstd_available = True
+except ImportError:
+    try:
+        import zstandard
+        
+        def _zstd_compress(data: bytes) -> bytes:
+            return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+        
+        def _zstd_decompress(data: bytes) -> bytes:
+            return zstandard.ZstdDecompressor().decompress(data)
+        
+        _zstd_available = True
+    except ImportError:
+        pass
+
+# Large API bodies (code search pages, directory listings) parse with orjson
+# when it is installed; the stdlib parser is the fallback
+try:
+    import orjson
+    
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+
+
+def _response_json(response: requests.Response) -> Any:
+    """Parse a response body as JSON, with orjson when available."""
+    if _orjson_available:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Start spreading requests out once fewer than this many remain in the window,
+# or a tenth of the window for resources with smaller limits (search allows 30/min)
+RATE_LIMIT_THRESHOLD = 100
+# Longest proactive pause after one response while the budget is low
+RATE_LIMIT_MAX_DELAY = 2.0
+# Longest a single call will block waiting for an exhausted window to reset; past
+# this the rate-limit error is returned to the caller
+RATE_LIMIT_MAX_WAIT = 30
+
+
+# Process-wide counters for sizing the caches, batching and prefetching below;
+# reported by strixdb_metrics
+_METRICS: Counter[str] = Counter()
+_metrics_lock = threading.Lock()
+
+
+def _count(name: str, n: int = 1) -> None:
+    with _metrics_lock:
+        _METRICS[name] += n
+
+
+class _RateBudget:
+    """
+    GitHub rate-limit state, updated from the headers of every response.
+    
+    GitHub keeps a separate budget per X-RateLimit-Resource (core, search,
+    graphql, ...), so each resource is tracked on its own; a nearly spent
+    search window does not slow down core or GraphQL calls.
+    """
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # resource -> (remaining, reset epoch, window limit or None)
+        self._state: dict[str, tuple[int, float, int | None]] = {}
+    
+    def update(self, headers: Any) -> str | None:
+        """Record the budget a response reports; returns its resource, if any."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_at = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset_at is None:
+            return None
+        resource = headers.get("X-RateLimit-Resource") or "core"
+        limit = headers.get("X-RateLimit-Limit")
+        try:
+            state = (int(remaining), float(reset_at), int(limit) if limit is not None else None)
+        except (TypeError, ValueError):
+            return None
+        with self._lock:
+            self._state[resource] = state
+        return resource
+    
+    def remaining(self, resource: str = "core") -> int | None:
+        with self._lock:
+            state = self._state.get(resource)
+        return state[0] if state else None
+    
+    def seconds_until_reset(self, resource: str = "core") -> float:
+        with self._lock:
+            state = self._state.get(resource)
+        return state[1] - time.time() if state else 0.0
+    
+    def delay(self, resource: str = "core") -> float:
+        """Pause before the next call that spreads the remaining budget until reset."""
+        with self._lock:
+            state = self._state.get(resource)
+        if state is None:
+            return 0.0
+        remaining, reset_at, limit = state
+        threshold = RATE_LIMIT_THRESHOLD
+        if limit is not None:
+            threshold = min(threshold, limit // 10)
+        if remaining >= threshold:
+            return 0.0
+        window = reset_at - time.time()
+        if window <= 0:
+            return 0.0
+        return min(window / max(remaining, 1), RATE_LIMIT_MAX_DELAY)
+
+
+_RATE_BUDGET = _RateBudget()
+
+
+def _rate_limit_hook(response: requests.Response, *args: Any, **kwargs: Any) -> requests.Response:
+    """
+    Session response hook: track the rate-limit budget of the response's resource,
+    throttle proactively when it runs low, and on an exhausted-budget 403/429 wait
+    for a reset due within RATE_LIMIT_MAX_WAIT and re-send (a later reset returns
+    the rate-limit response as is). Transient errors and Retry-After are left to
+    the adapter's urllib3 Retry.
+    """
+    resource = _RATE_BUDGET.update(response.headers)
+    _count("http_requests")
+    if resource is None:
+        return response
+    
+    if (
+        response.status_code in (403, 429)
+        and response.headers.get("X-RateLimit-Remaining") == "0"
+    ):
+        wait = _RATE_BUDGET.seconds_until_reset(resource)
+        if 0 < wait <= RATE_LIMIT_MAX_WAIT:
+            _count("rate_limit_waits")
+            logger.warning(
+                f"[StrixDB] GitHub {resource} rate limit exhausted, waiting {wait:.0f}s for reset"
+            )
+            time.sleep(wait + 1)
+            return response.connection.send(response.request, **kwargs)
+        return response
+    
+    delay = _RATE_BUDGET.delay(resource)
+    if delay:
+        _count("rate_limit_throttles")
+        time.sleep(delay)
+    return response
+
+
+# Headers common to every GitHub API call, set once on the shared session;
+# per-request headers add the token and may override Accept
+_GITHUB_API_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+
+
+def _create_session() -> requests.Session:
+    """Create the shared HTTP session used for all GitHub API calls.
+    
+    Pooled keep-alive connections avoid a TCP+TLS handshake per request,
+    urllib3 retries transient failures and 429s, honoring Retry-After, and
+    _rate_limit_hook paces calls against the X-RateLimit-* budget.
+    """
+    session = requests.Session()
+    session.headers.update(_GITHUB_API_HEADERS)
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.hooks["response"].append(_rate_limit_hook)
+    return session
+
+
+_SESSION = _create_session()
+
+# Conditional-GET cache for repo files: (StrixDB repo, repo_slug, file_name) ->
+# (etag, decoded JSON text, sha, monotonic time last validated), kept in LRU
+# order and bounded by REPO_FILE_CACHE_SIZE. The text is re-parsed on every hit
+# so callers can mutate what they get back without corrupting the cache. Reads
+# with use_cache=True skip the request entirely while an entry is younger than
+# REPO_FILE_CACHE_TTL seconds.
+REPO_FILE_CACHE_TTL = 30.0
+REPO_FILE_CACHE_SIZE = 256
+_ETAG_CACHE: OrderedDict[tuple[str, str, str], tuple[str, str, str | None, float]] = (
+    OrderedDict()
+)
+
+# Manifest and index ETags survive restarts in this file (set STRIXDB_ETAG_CACHE=""
+# to disable). Item bodies are never written there, nor are files over
+# ETAG_PERSIST_MAX_BYTES. Restored entries count as never validated, so the TTL
+# never serves them blind.
+ETAG_CACHE_PATH = os.getenv(
+    "STRIXDB_ETAG_CACHE", str(Path.home() / ".strix" / "strixdb_etags.json")
+)
+PERSISTED_ETAG_FILES = frozenset({"manifest.json", "index.json"})
+ETAG_PERSIST_MAX_BYTES = 1024 * 1024
+_etag_cache_loaded = False
+_etag_cache_lock = threading.Lock()
+
+
+def _repo_cache_get(
+    key: tuple[str, str, str],
+) -> tuple[str, str, str | None, float] | None:
+    with _etag_cache_lock:
+        entry = _ETAG_CACHE.get(key)
+        if entry is not None:
+            _ETAG_CACHE.move_to_end(key)
+        return entry
+
+
+def _repo_cache_put(
+    key: tuple[str, str, str], entry: tuple[str, str, str | None, float]
+) -> None:
+    with _etag_cache_lock:
+        _ETAG_CACHE[key] = entry
+        _ETAG_CACHE.move_to_end(key)
+        while len(_ETAG_CACHE) > REPO_FILE_CACHE_SIZE:
+            _ETAG_CACHE.popitem(last=False)
+
+
+def _repo_cache_drop(key: tuple[str, str, str]) -> None:
+    with _etag_cache_lock:
+        _ETAG_CACHE.pop(key, None)
+
+
+# Blob shas of a repo's stored items: (StrixDB repo, repo_slug) ->
+# (monotonic time fetched, {"categories/<cat>/<file>.json": blob sha}).
+# Reused for REPO_FILE_CACHE_TTL seconds and dropped when the repo is written.
+_ITEM_TREE_CACHE: dict[tuple[str, str], tuple[float, dict[str, str]]] = {}
+_item_tree_lock = threading.Lock()
+
+
+def _item_tree_drop(key: tuple[str, str]) -> None:
+    with _item_tree_lock:
+        _ITEM_TREE_CACHE.pop(key, None)
+
+
+def _load_persisted_etags() -> None:
+    """Merge ETags persisted by a previous process into _ETAG_CACHE (once)."""
+    global _etag_cache_loaded
+    
+    if _etag_cache_loaded:
+        return
+    with _etag_cache_lock:
+        if _etag_cache_loaded:
+            return
+        _etag_cache_loaded = True
+        if not ETAG_CACHE_PATH:
+            return
+        try:
+            with open(ETAG_CACHE_PATH, encoding="utf-8") as f:
+                entries = json.load(f)
+            for repo, repo_slug, file_name, etag, text, sha in entries[-REPO_FILE_CACHE_SIZE:]:
+                if file_name in PERSISTED_ETAG_FILES:
+                    _ETAG_CACHE.setdefault((repo, repo_slug, file_name), (etag, text, sha, 0.0))
+        except (OSError, ValueError, TypeError):
+            logger.debug(f"[StrixDB] No usable ETag cache at {ETAG_CACHE_PATH}")
+
+
+def _persist_etags() -> None:
+    """Write manifest/index entries of _ETAG_CACHE to ETAG_CACHE_PATH; runs at exit."""
+    if not ETAG_CACHE_PATH:
+        return
+    with _etag_cache_lock:
+        items = list(_ETAG_CACHE.items())
+    entries = [
+        [*key, etag, text, sha]
+        for key, (etag, text, sha, _) in items
+        if key[2] in PERSISTED_ETAG_FILES and len(text) <= ETAG_PERSIST_MAX_BYTES
+    ]
+    if not entries:
+        return
+    try:
+        os.makedirs(os.path.dirname(ETAG_CACHE_PATH) or ".", exist_ok=True)
+        tmp_path = f"{ETAG_CACHE_PATH}.tmp"
+        # Private repo content: readable by the owner only
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump(entries, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp_path, ETAG_CACHE_PATH)
+    except OSError as e:
+        logger.debug(f"[StrixDB] Failed to persist ETag cache: {e}")
+
+
+atexit.register(_persist_etags)
+
 
 # File type mappings for automatic categorization
 FILE_TYPE_MAPPINGS = {
@@ -111,6 +431,41 @@ PATH_PATTERNS = {
     r"doc|wiki|guide|readme|manual": "documentation",
 }
 
+# Worker threads used to read and prepare files during category extraction
+EXTRACT_WORKERS = 8
+
+# Compiled once at import; order is preserved so the first matching pattern wins
+_PATH_PATTERNS_COMPILED = [
+    (re.compile(pattern), category) for pattern, category in PATH_PATTERNS.items()
+]
+
+# Extensions treated as binary without reading the file
+_BINARY_EXTENSIONS = frozenset((
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp",
+    ".zip", ".tar", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar",
+    ".pdf", ".exe", ".dll", ".so", ".dylib", ".bin", ".class", ".jar",
+    ".pyc", ".o", ".a", ".woff", ".woff2", ".ttf", ".otf", ".mp3", ".mp4",
+))
+
+# Bytes sniffed from the start of a file to decide whether it is binary
+_BINARY_SNIFF_BYTES = 8192
+_TEXT_BYTES = frozenset(range(0x20, 0x7F)) | {0x08, 0x09, 0x0A, 0x0C, 0x0D, 0x1B}
+
+# Keywords that move a .txt wordlist into the payloads category
+_PAYLOAD_KEYWORDS = frozenset(("payload", "xss", "sqli", "injection"))
+
+_URL_SCHEME = re.compile(r'^https?://')
+_SLUG_UNSAFE = re.compile(r'[^\w\-]')
+_SLUG_COLLAPSE = re.compile(r'_+')
+_GITHUB_URL = re.compile(r'^(?:https?://)?(?:www\.)?github\.com/(.+)$')
+_OWNER_REPO = re.compile(r'^[\w.\-]+/[\w.\-]+$')
+
+
+@lru_cache(maxsize=1024)
+def _safe_item_name(name: str) -> str:
+    """File stem an item is stored under (categories/<category>/<stem>.json)."""
+    return _SLUG_UNSAFE.sub('_', name).lower()
+
 
 def _get_strixdb_config() -> dict[str, str]:
     """Get StrixDB configuration."""
@@ -119,12 +474,8 @@ def _get_strixdb_config() -> dict[str, str]:
 
 
 def _get_headers(token: str) -> dict[str, str]:
-    """Get headers for GitHub API requests."""
-    return {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
+    """Get per-request headers for GitHub API calls made through _SESSION."""
+    return {"Authorization": f"token {token}"}
 
 
 def _sanitize_repo_slug(repo_url: str) -> str:
@@ -144,7 +495,7 @@ def _sanitize_repo_slug(repo_url: str) -> str:
         repo_url = repo_url.replace(':', '/').replace('git@', '')
     
     # Handle HTTPS format
-    repo_url = re.sub(r'^https?://', '', repo_url)
+    repo_url = _URL_SCHEME.sub('', repo_url)
     
     # Extract owner/repo part
     parts = repo_url.split('/')
@@ -156,12 +507,35 @@ def _sanitize_repo_slug(repo_url: str) -> str:
         slug = parts[-1] if parts else "unknown_repo"
     
     # Sanitize
-    slug = re.sub(r'[^\w\-]', '_', slug).lower()
-    slug = re.sub(r'_+', '_', slug).strip('_')
+    slug = _SLUG_UNSAFE.sub('_', slug).lower()
+    slug = _SLUG_COLLAPSE.sub('_', slug).strip('_')
     
     return slug
 
 
+def _file_extension(file_path: str) -> str:
+    """
+    Lowercased extension of the last path component, with the same rules as
+    Path.suffix (no suffix for dotfiles or names ending in '.'), without
+    building a Path object.
+    """
+    name = file_path.rpartition("/")[2]
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ""
+
+
+def _looks_binary(head: bytes) -> bool:
+    """NUL bytes or more than 30% non-text bytes in the head mark a file as binary."""
+    if not head:
+        return False
+    if b"\0" in head:
+        return True
+    non_text = sum(1 for byte in head if byte < 0x80 and byte not in _TEXT_BYTES)
+    return non_text / len(head) > 0.3
+
+
 def _categorize_file(file_path: str, content: str = "") -> str:
     """
     Categorize a file based on its path, extension, and content.
@@ -170,18 +544,18 @@ def _categorize_file(file_path: str, content: str = "") -> str:
     path_lower = file_path.lower()
     
     # First check path patterns (more specific)
-    for pattern, category in PATH_PATTERNS.items():
-        if re.search(pattern, path_lower):
+    for pattern, category in _PATH_PATTERNS_COMPILED:
+        if pattern.search(path_lower):
             return category
     
     # Then check file extension
-    ext = Path(file_path).suffix.lower()
+    ext = _file_extension(file_path)
     if ext in FILE_TYPE_MAPPINGS:
         category = FILE_TYPE_MAPPINGS[ext]
         
         # Further categorize .txt files based on path
         if category == "wordlists":
-            if any(x in path_lower for x in ["payload", "xss", "sqli", "injection"]):
+            if any(x in path_lower for x in _PAYLOAD_KEYWORDS):
                 return "payloads"
         
         return category
@@ -190,27 +564,88 @@ def _categorize_file(file_path: str, content: str = "") -> str:
     return "references"
 
 
+def _fetch_blob_text(config: dict[str, str], sha: str) -> str | None:
+    """Fetch a blob's raw bytes by sha (no base64 wrapping) and decode them."""
+    headers = _get_headers(config["token"])
+    headers["Accept"] = "application/vnd.github.raw"
+    
+    response = _SESSION.get(
+        f"{config['api_base']}/repos/{config['repo']}/git/blobs/{sha}",
+        headers=headers,
+        timeout=60,
+    )
+    if response.status_code != 200:
+        return None
+    return response.content.decode()
+
+
 def _get_or_create_repo_file(
     config: dict[str, str],
     repo_slug: str,
     file_name: str,
     default_content: dict[str, Any] | list[Any],
+    sha: str | None = None,
+    use_cache: bool = False,
 ) -> tuple[dict[str, Any] | list[Any], str | None]:
-    """Get existing file content or return default."""
+    """
+    Get existing file content or return default.
+    Repeat reads send If-None-Match and serve 304 responses from _ETAG_CACHE.
+    Read-only callers pass use_cache=True to reuse an entry validated within
+    the last REPO_FILE_CACHE_TTL seconds without any request.
+    
+    With a known blob sha the raw blob is fetched directly, skipping the
+    Contents API's base64 wrapping. Files over 1MB, for which the Contents API
+    returns no inline content, are read the same way.
+    """
+    try:
+        if sha:
+            text = _fetch_blob_text(config, sha)
+            if text is not None:
+                return json.loads(text), sha
+    except (requests.RequestException, UnicodeDecodeError, json.JSONDecodeError):
+        pass
+    
     path = f"extracted_repos/{repo_slug}/{file_name}"
     url = f"{config['api_base']}/repos/{config['repo']}/contents/{path}"
     
+    _load_persisted_etags()
+    cache_key = (config["repo"], repo_slug, file_name)
+    cached = _repo_cache_get(cache_key)
+    if use_cache and cached and time.monotonic() - cached[3] < REPO_FILE_CACHE_TTL:
+        _count("repo_file_cache_hits")
+        return json.loads(cached[1]), cached[2]
+    
+    headers = _get_headers(config["token"])
+    if cached:
+        headers["If-None-Match"] = cached[0]
+    
     try:
-        response = requests.get(url, headers=_get_headers(config["token"]), timeout=30)
+        response = _SESSION.get(url, headers=headers, timeout=30)
+        
+        if response.status_code == 304 and cached:
+            _count("etag_304")
+            _repo_cache_put(cache_key, (*cached[:3], time.monotonic()))
+            return json.loads(cached[1]), cached[2]
         
         if response.status_code == 200:
+            _count("repo_file_fetches")
             data = response.json()
-            content = json.loads(base64.b64decode(data.get("content", "")).decode())
+            if data.get("encoding") == "none" and data.get("sha"):
+                text = _fetch_blob_text(config, data["sha"])
+                if text is None:
+                    return default_content, None
+            else:
+                text = base64.b64decode(data.get("content", "")).decode()
+            content = json.loads(text)
+            etag = response.headers.get("ETag")
+            if isinstance(etag, str):
+                _repo_cache_put(cache_key, (etag, text, data.get("sha"), time.monotonic()))
             return content, data.get("sha")
         
+        _repo_cache_drop(cache_key)
         return default_content, None
         
-    except (requests.RequestException, json.JSONDecodeError):
+    except (requests.RequestException, UnicodeDecodeError, json.JSONDecodeError):
         return default_content, None
 
 
@@ -227,12 +662,7 @@ def _save_repo_file(
     path = f"extracted_repos/{repo_slug}/{file_name}"
     url = f"{config['api_base']}/repos/{config['repo']}/contents/{path}"
     
-    if isinstance(content, (dict, list)):
-        content_str = json.dumps(content, indent=2)
-    else:
-        content_str = str(content)
-    
-    content_encoded = base64.b64encode(content_str.encode()).decode()
+    content_encoded = base64.b64encode(_serialize_repo_content(content).encode()).decode()
     
     payload: dict[str, Any] = {
         "message": commit_message or f"[StrixDB] Update {path}",
@@ -244,30 +674,359 @@ def _save_repo_file(
         payload["sha"] = sha
     
     try:
-        response = requests.put(
+        response = _SESSION.put(
             url,
             headers=_get_headers(config["token"]),
             json=payload,
             timeout=30,
         )
-        return response.status_code in (200, 201)
+        if response.status_code in (200, 201):
+            _repo_cache_drop((config["repo"], repo_slug, file_name))
+            _item_tree_drop((config["repo"], repo_slug))
+            return True
+        return False
     except requests.RequestException:
         return False
 
 
-def _ensure_repo_directory(config: dict[str, str], repo_slug: str, repo_url: str) -> bool:
-    """Ensure the repository extraction directory exists in StrixDB."""
-    readme_path = f"extracted_repos/{repo_slug}/README.md"
-    url = f"{config['api_base']}/repos/{config['repo']}/contents/{readme_path}"
-    
+def _dumps(content: dict[str, Any] | list[Any]) -> str:
+    """Compact JSON for stored files; they are read by tools, not by people."""
+    return json.dumps(content, separators=(",", ":"), ensure_ascii=False)
+
+
+def _serialize_repo_content(content: dict[str, Any] | list[Any] | str) -> str:
+    """Serialize repo file content the same way _save_repo_file does."""
+    if isinstance(content, (dict, list)):
+        return _dumps(content)
+    return str(content)
+
+
+def _bulk_commit(
+    config: dict[str, str],
+    repo_slug: str,
+    files: dict[str, dict[str, Any] | list[Any] | str | bytes],
+    commit_message: str = "",
+) -> bool:
+    """
+    Commit many files under the repo's directory in a single commit.
+
+    Uses the Git Data API (tree + commit + ref update) instead of one
+    Contents API PUT per file. Text content is inlined in the tree; bytes
+    are uploaded as blobs first, in parallel.
+    """
+    if not files:
+        return True
+
+    headers = _get_headers(config["token"])
+    repo_api = f"{config['api_base']}/repos/{config['repo']}"
+    branch = config["branch"]
+
+    def _create_blob(data: bytes) -> str | None:
+        response = _SESSION.post(
+            f"{repo_api}/git/blobs",
+            headers=headers,
+            json={"content": base64.b64encode(data).decode(), "encoding": "base64"},
+            timeout=30,
+        )
+        if response.status_code != 201:
+            return None
+        return response.json().get("sha")
+
     try:
-        response = requests.get(url, headers=_get_headers(config["token"]), timeout=30)
+        branch_response = _SESSION.get(
+            f"{repo_api}/branches/{branch}", headers=headers, timeout=30
+        )
+        if branch_response.status_code != 200:
+            return False
+        branch_data = branch_response.json()
+        base_commit_sha = branch_data["commit"]["sha"]
+        base_tree_sha = branch_data["commit"]["commit"]["tree"]["sha"]
+
+        tree: list[dict[str, Any]] = []
+        binary_paths: list[str] = []
+        for file_name, content in files.items():
+            path = f"extracted_repos/{repo_slug}/{file_name}"
+            if isinstance(content, bytes):
+                binary_paths.append(file_name)
+                continue
+            tree.append({
+                "path": path,
+                "mode": "100644",
+                "type": "blob",
+                "content": _serialize_repo_content(content),
+            })
+
+        if binary_paths:
+            with ThreadPoolExecutor(max_workers=min(8, len(binary_paths))) as executor:
+                blob_shas = list(executor.map(_create_blob, (files[p] for p in binary_paths)))
+            for file_name, blob_sha in zip(binary_paths, blob_shas):
+                if not blob_sha:
+                    return False
+                tree.append({
+                    "path": f"extracted_repos/{repo_slug}/{file_name}",
+                    "mode": "100644",
+                    "type": "blob",
+                    "sha": blob_sha,
+                })
+
+        tree_response = _SESSION.post(
+            f"{repo_api}/git/trees",
+            headers=headers,
+            json={"base_tree": base_tree_sha, "tree": tree},
+            timeout=60,
+        )
+        if tree_response.status_code != 201:
+            return False
+
+        commit_response = _SESSION.post(
+            f"{repo_api}/git/commits",
+            headers=headers,
+            json={
+                "message": commit_message or f"[StrixDB] Update extracted_repos/{repo_slug}",
+                "tree": tree_response.json()["sha"],
+                "parents": [base_commit_sha],
+            },
+            timeout=30,
+        )
+        if commit_response.status_code != 201:
+            return False
+
+        ref_response = _SESSION.patch(
+            f"{repo_api}/git/refs/heads/{branch}",
+            headers=headers,
+            json={"sha": commit_response.json()["sha"]},
+            timeout=30,
+        )
+        if ref_response.status_code != 200:
+            return False
         
-        if response.status_code == 200:
-            return True  # Already exists
+        for file_name in files:
+            _repo_cache_drop((config["repo"], repo_slug, file_name))
+        _item_tree_drop((config["repo"], repo_slug))
+        return True
+
+    except (requests.RequestException, KeyError, TypeError):
+        return False
+
+
+# Index entries written by the scanners always carry these keys, so hot loops
+# fetch them in one C-level call; entries from older indexes fall back to .get
+_STATUS_FIELDS = itemgetter("extracted", "category")
+_LISTING_FIELDS = itemgetter("extracted", "category", "path", "size", "extracted_to")
+
+
+def _summarize_files(files: list[dict[str, Any]]) -> tuple[dict[str, int], dict[str, int]]:
+    """Return (stats, pending_by_category) for an index's files in one pass."""
+    extracted_count = 0
+    pending_by_category: defaultdict[str, int] = defaultdict(int)
+    for f in files:
+        try:
+            extracted, cat = _STATUS_FIELDS(f)
+        except KeyError:
+            extracted, cat = f.get("extracted"), f.get("category", "unknown")
+        if extracted:
+            extracted_count += 1
+        else:
+            pending_by_category[cat] += 1
+    
+    stats = {
+        "total": len(files),
+        "extracted": extracted_count,
+        "pending": len(files) - extracted_count,
+    }
+    return stats, dict(pending_by_category)
+
+
+def _with_index_summary(
+    index: dict[str, Any],
+    manifest: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Store precomputed stats and pending_by_category on an index document before
+    it is written, so status reads do not rescan every file. The same snapshot is
+    mirrored into manifest (as index_stats/pending_by_category) when given, which
+    lets status skip loading the index at all.
+    """
+    index["stats"], index["pending_by_category"] = _summarize_files(index.get("files", []))
+    if manifest is not None:
+        manifest["index_stats"] = dict(index["stats"])
+        manifest["pending_by_category"] = dict(index["pending_by_category"])
+    return index
+
+
+class _ExtractionSessionCache:
+    """
+    Shared manifest/index state for one extraction session per repo.
+    
+    Nested tool calls (strixdb_repo_extract_all -> _category) read and mutate
+    the same cached objects; only the outermost session flushes them, so the
+    manifest and index are written once per session instead of per file.
+    Entries are dropped when the outermost session exits.
+    """
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._docs: dict[str, dict[str, tuple[Any, str]]] = {}
+        self._dirty: dict[str, set[str]] = {}
+        self._depth: dict[str, int] = {}
+        self._views: dict[str, tuple[Any, dict[str, list[dict[str, Any]]], set[str]]] = {}
+        self._seen_hashes: dict[str, dict[str, str]] = {}
+    
+    @contextmanager
+    def session(self, repo_slug: str) -> Iterator[bool]:
+        """Enter a session for repo_slug; yields True for the outermost session."""
+        with self._lock:
+            depth = self._depth.get(repo_slug, 0)
+            self._depth[repo_slug] = depth + 1
+        try:
+            yield depth == 0
+        finally:
+            with self._lock:
+                self._depth[repo_slug] -= 1
+                if not self._depth[repo_slug]:
+                    del self._depth[repo_slug]
+                    self._docs.pop(repo_slug, None)
+                    self._dirty.pop(repo_slug, None)
+                    self._views.pop(repo_slug, None)
+                    self._seen_hashes.pop(repo_slug, None)
+    
+    def load(
+        self,
+        config: dict[str, str],
+        repo_slug: str,
+        file_name: str,
+        default_content: dict[str, Any] | list[Any],
+    ) -> tuple[dict[str, Any] | list[Any], str | None]:
+        """Return the cached (content, sha) for a repo file, fetching it on a miss."""
+        with self._lock:
+            entry = self._docs.get(repo_slug, {}).get(file_name)
+        if entry:
+            return entry
         
-        if response.status_code == 404:
-            readme_content = f"""# Extracted Repository: {repo_slug}
+        content, sha = _get_or_create_repo_file(config, repo_slug, file_name, default_content)
+        
+        with self._lock:
+            if sha and self._depth.get(repo_slug):
+                entry = self._docs.setdefault(repo_slug, {}).setdefault(file_name, (content, sha))
+                return entry
+        return content, sha
+    
+    def index_view(
+        self,
+        repo_slug: str,
+        index: dict[str, Any],
+    ) -> tuple[dict[str, list[dict[str, Any]]], set[str]]:
+        """
+        Return (entries bucketed by category, set of extracted paths) for index.
+        Built in one pass and reused for the rest of the session, so repeated
+        category filters only visit their own bucket.
+        """
+        with self._lock:
+            view = self._views.get(repo_slug)
+            if view and view[0] is index:
+                return view[1], view[2]
+        
+        buckets: dict[str, list[dict[str, Any]]] = {}
+        extracted: set[str] = set()
+        for f in index.get("files", []):
+            buckets.setdefault(f.get("category"), []).append(f)
+            if f.get("extracted"):
+                extracted.add(f.get("path"))
+        
+        with self._lock:
+            if self._depth.get(repo_slug):
+                self._views[repo_slug] = (index, buckets, extracted)
+        return buckets, extracted
+    
+    def find_duplicate(self, repo_slug: str, content_key: str) -> str | None:
+        """Return the save path already holding content_key in this session, if any."""
+        with self._lock:
+            return self._seen_hashes.get(repo_slug, {}).get(content_key)
+    
+    def remember_hashes(self, repo_slug: str, saved: dict[str, str]) -> None:
+        """Record content keys of items that were committed (first path wins)."""
+        with self._lock:
+            if self._depth.get(repo_slug):
+                seen = self._seen_hashes.setdefault(repo_slug, {})
+                for content_key, save_path in saved.items():
+                    seen.setdefault(content_key, save_path)
+    
+    def mark_dirty(self, repo_slug: str, file_name: str) -> None:
+        """Mark a cached repo file as modified so the next flush writes it."""
+        with self._lock:
+            self._dirty.setdefault(repo_slug, set()).add(file_name)
+    
+    def flush(
+        self,
+        config: dict[str, str],
+        repo_slug: str,
+        extra_files: dict[str, Any] | None = None,
+        commit_message: str = "",
+        updates: dict[str, Any] | None = None,
+    ) -> bool:
+        """
+        Write dirty files for repo_slug. With extra_files, everything goes into a
+        single bulk commit; otherwise each dirty file is PUT with its cached sha.
+        A dirty index also refreshes the manifest's copy of its stats.
+        
+        updates maps cached files to replacement content that is written in their
+        place; the cached copies stay untouched, so a failed write leaves nothing
+        recorded. Only successfully written files lose their dirty mark and cached
+        entry; failures stay dirty for the next flush.
+        """
+        updates = updates or {}
+        with self._lock:
+            pending = self._dirty.get(repo_slug, set()) | set(updates)
+        if "index.json" in pending:
+            index = updates.get("index.json")
+            if index is None:
+                index, _ = self.load(config, repo_slug, "index.json", {"files": []})
+            manifest, manifest_sha = self.load(config, repo_slug, "manifest.json", {})
+            manifest = updates.get("manifest.json", manifest)
+            _with_index_summary(index, manifest if manifest_sha else None)
+            if manifest_sha:
+                pending.add("manifest.json")
+        
+        with self._lock:
+            docs = self._docs.get(repo_slug, {})
+            writes = {
+                name: (updates.get(name, docs[name][0]), docs[name][1])
+                for name in pending if name in docs
+            }
+        
+        if extra_files:
+            files = {**extra_files, **{name: entry[0] for name, entry in writes.items()}}
+            ok = _bulk_commit(config, repo_slug, files, commit_message=commit_message)
+            written = set(writes) if ok else set()
+        else:
+            written = {
+                name for name, (content, sha) in writes.items()
+                if _save_repo_file(
+                    config,
+                    repo_slug,
+                    name,
+                    content,
+                    sha=sha,
+                    commit_message=commit_message or f"[StrixDB] Update {name}",
+                )
+            }
+            ok = written == set(writes)
+        
+        # Cached shas are stale after a write; reload on next access
+        with self._lock:
+            dirty = self._dirty.get(repo_slug, set())
+            for name in written:
+                docs.pop(name, None)
+                dirty.discard(name)
+        return ok
+
+
+_SESSION_CACHE = _ExtractionSessionCache()
+
+
+def _repo_readme(repo_slug: str, repo_url: str) -> str:
+    """Build the README placed at the root of a repo's extraction directory."""
+    return f"""# Extracted Repository: {repo_slug}
 
 ## Source Repository
 `{repo_url}`
@@ -293,25 +1052,6 @@ This directory contains data extracted from the source repository:
 
 ## Auto-generated by StrixDB Repository Extraction System
 """
-            content_encoded = base64.b64encode(readme_content.encode()).decode()
-            
-            create_response = requests.put(
-                url,
-                headers=_get_headers(config["token"]),
-                json={
-                    "message": f"[StrixDB] Initialize extracted repo: {repo_slug}",
-                    "content": content_encoded,
-                    "branch": config["branch"],
-                },
-                timeout=30,
-            )
-            
-            return create_response.status_code in (200, 201)
-        
-        return False
-        
-    except requests.RequestException:
-        return False
 
 
 def _create_extraction_manifest(
@@ -370,80 +1110,108 @@ def _create_extraction_manifest(
     }
 
 
-@register_tool(sandbox_execution=True)
-def strixdb_repo_extract_init(
-    agent_state: Any,
-    repo_url: str,
-    description: str = "",
-    tags: list[str] | None = None,
-    clone_depth: int = 1,
-) -> dict[str, Any]:
-    """
-    Initialize a repository extraction session.
-    
-    This clones the repository locally and prepares it for extraction.
-    Use this when you find a repository with valuable resources that
-    should be extracted into StrixDB for future use.
-    
-    Args:
-        agent_state: Current agent state
-        repo_url: Git repository URL (HTTPS or SSH)
-        description: Description of what this repo contains
-        tags: Tags for categorization (e.g., ["bugbounty", "wordlists", "tools"])
-        clone_depth: Git clone depth (1 for shallow, 0 for full)
+def _parse_github_repo(repo_url: str) -> tuple[str, str] | None:
+    """Return (owner, repo) for github.com URLs or owner/repo shorthands, else None."""
+    url = repo_url.strip()
+    if url.endswith(".git"):
+        url = url[:-4]
+    
+    if url.startswith("git@github.com:"):
+        path = url[len("git@github.com:"):]
+    else:
+        match = _GITHUB_URL.match(url)
+        if match:
+            path = match.group(1)
+        elif _OWNER_REPO.match(url):
+            path = url
+        else:
+            return None
     
-    Returns:
-        Dictionary with extraction session info and file manifest
+    parts = path.strip("/").split("/")
+    if len(parts) < 2 or not parts[0] or not parts[1]:
+        return None
+    return parts[0], parts[1]
+
+
+def _fetch_repo_tree(
+    config: dict[str, str],
+    owner: str,
+    repo: str,
+    ref: str = "HEAD",
+) -> list[dict[str, Any]] | None:
     """
-    config = _get_strixdb_config()
-    
-    if not config["repo"] or not config["token"]:
-        return {
-            "success": False,
-            "error": "StrixDB not configured. Ensure STRIXDB_TOKEN is set.",
-        }
-    
-    repo_slug = _sanitize_repo_slug(repo_url)
-    
-    # Check if already extracted
-    existing_manifest, manifest_sha = _get_or_create_repo_file(
-        config, repo_slug, "manifest.json", {}
-    )
+    Fetch the full file tree of a GitHub repository in one request.
+    Returns None when the request fails or GitHub truncates the tree.
+    """
+    url = f"{config['api_base']}/repos/{owner}/{repo}/git/trees/{ref}"
     
-    if existing_manifest and manifest_sha:
-        return {
-            "success": True,
-            "message": f"Repository '{repo_slug}' already initialized. Use update functions to add more data.",
-            "is_new": False,
-            "repo_slug": repo_slug,
-            "manifest": existing_manifest,
-            "hint": (
-                "Repository already exists. Use:\n"
-                "- strixdb_repo_extract_scan() to re-scan for new files\n"
-                "- strixdb_repo_extract_file() to extract specific files\n"
-                "- strixdb_repo_extract_category() to extract by category"
-            ),
-        }
+    try:
+        response = _SESSION.get(
+            url,
+            headers=_get_headers(config["token"]),
+            params={"recursive": "1"},
+            timeout=60,
+        )
+        
+        if response.status_code != 200:
+            return None
+        
+        data = response.json()
+        if data.get("truncated"):
+            logger.info(f"[StrixDB] Tree for {owner}/{repo} is truncated, falling back to clone")
+            return None
+        
+        return data.get("tree", [])
+        
+    except (requests.RequestException, ValueError):
+        return None
+
+
+def _discard_dir(path: str) -> None:
+    """
+    Remove a directory without blocking on large trees.
     
-    # Create extraction directory in StrixDB
-    if not _ensure_repo_directory(config, repo_slug, repo_url):
-        return {
-            "success": False,
-            "error": f"Failed to create extraction directory for '{repo_slug}'",
-        }
+    The directory is renamed aside (atomic on the same filesystem) so the path
+    is free immediately, and the renamed tree is deleted on a daemon thread.
+    """
+    if not os.path.lexists(path):
+        return
     
-    # Clone the repository locally (in sandbox)
-    clone_dir = f"/tmp/strixdb_extract/{repo_slug}"
+    trash = f"{path}.trash-{uuid.uuid4().hex[:8]}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}, daemon=True
+    ).start()
+
+
+def _clone_repo(
+    repo_url: str,
+    clone_dir: str,
+    clone_depth: int = 1,
+    blobless: bool = False,
+) -> str | None:
+    """
+    Clone a repository into clone_dir. Returns an error message, or None on success.
     
+    A blobless clone (--filter=blob:none --no-checkout) only downloads commits and
+    trees; file contents are fetched lazily when a path is checked out.
+    """
     try:
         # Clean up any existing directory
-        subprocess.run(["rm", "-rf", clone_dir], check=False, timeout=30)
+        _discard_dir(clone_dir)
         os.makedirs(os.path.dirname(clone_dir), exist_ok=True)
         
         # Clone with optional depth
         clone_cmd = ["git", "clone"]
         if clone_depth > 0:
             clone_cmd.extend(["--depth", str(clone_depth)])
+        if blobless:
+            clone_cmd.extend(["--filter=blob:none", "--no-checkout"])
         clone_cmd.extend([repo_url, clone_dir])
         
         result = subprocess.run(
@@ -454,64 +1222,473 @@ def strixdb_repo_extract_init(
         )
         
         if result.returncode != 0:
-            return {
-                "success": False,
-                "error": f"Git clone failed: {result.stderr}",
-            }
+            return f"Git clone failed: {result.stderr}"
         
     except subprocess.TimeoutExpired:
-        return {
-            "success": False,
-            "error": "Git clone timed out after 5 minutes",
-        }
+        return "Git clone timed out after 5 minutes"
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Clone failed: {str(e)}",
-        }
+        return f"Clone failed: {str(e)}"
     
-    # Scan the cloned repository
+    return None
+
+
+def _checkout_lazy_files(clone_dir: str, file_paths: list[str]) -> bool:
+    """
+    Materialize files from a blobless, no-checkout clone.
+    
+    All paths go through one git invocation so missing blobs are fetched in a
+    single batch and concurrent checkouts never contend for the index lock.
+    """
+    if not file_paths or not os.path.isdir(os.path.join(clone_dir, ".git")):
+        return False
+    
+    try:
+        result = subprocess.run(
+            ["git", "-C", clone_dir, "checkout", "HEAD", "--", *file_paths],
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+    
+    return result.returncode == 0
+
+
+def _index_from_tree(
+    tree: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], dict[str, int], int]:
+    """Build the file index from Git Trees API entries."""
     file_index = []
-    category_counts: dict[str, int] = {}
+    category_counts: defaultdict[str, int] = defaultdict(int)
     total_size = 0
     
+    for entry in tree:
+        if entry.get("type") != "blob":
+            continue
+        
+        relative_path = entry.get("path", "")
+        file_size = entry.get("size", 0)
+        total_size += file_size
+        
+        # Skip very large files (> 5MB)
+        if file_size > 5 * 1024 * 1024:
+            continue
+        
+        category = _categorize_file(relative_path)
+        category_counts[category] += 1
+        
+        file_index.append({
+            "path": relative_path,
+            "category": category,
+            "size": file_size,
+            "extension": _file_extension(relative_path),
+            "extracted": False,
+            "extracted_to": None,
+            "sha": entry.get("sha"),
+        })
+    
+    return file_index, dict(category_counts), total_size
+
+
+def _iter_clone_files(directory: str, prefix: str = "") -> Iterator[tuple[str, int]]:
+    """
+    Yield (relative path, size) for every regular file under directory,
+    skipping .git and symlinks, which could point outside the clone. Uses
+    os.scandir directly so type checks come from the readdir entry and each
+    file is stat'ed once through its DirEntry.
+    """
     try:
-        for root, dirs, files in os.walk(clone_dir):
-            # Skip .git directory
-            if '.git' in dirs:
-                dirs.remove('.git')
-            
-            for file_name in files:
-                file_path = os.path.join(root, file_name)
-                relative_path = os.path.relpath(file_path, clone_dir)
-                
-                try:
-                    file_stat = os.stat(file_path)
-                    file_size = file_stat.st_size
-                    total_size += file_size
-                    
-                    # Skip very large files (> 5MB)
-                    if file_size > 5 * 1024 * 1024:
-                        continue
-                    
-                    # Categorize the file
-                    category = _categorize_file(relative_path)
-                    category_counts[category] = category_counts.get(category, 0) + 1
-                    
-                    file_index.append({
-                        "path": relative_path,
-                        "category": category,
-                        "size": file_size,
-                        "extension": Path(file_name).suffix.lower(),
-                        "extracted": False,
-                    })
-                    
-                except OSError:
+        entries = os.scandir(directory)
+    except OSError:
+        # Unreadable directories are skipped, as os.walk does
+        return
+    
+    with entries:
+        for entry in entries:
+            relative_path = prefix + entry.name
+            try:
+                if entry.is_symlink():
                     continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != ".git":
+                        yield from _iter_clone_files(entry.path, relative_path + "/")
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    yield relative_path, entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+
+
+def _index_from_clone(
+    clone_dir: str,
+) -> tuple[list[dict[str, Any]], dict[str, int], int]:
+    """Build the file index by walking a local clone."""
+    file_index = []
+    category_counts: defaultdict[str, int] = defaultdict(int)
+    total_size = 0
+    
+    try:
+        for relative_path, file_size in _iter_clone_files(clone_dir):
+            total_size += file_size
+            
+            # Skip very large files (> 5MB)
+            if file_size > 5 * 1024 * 1024:
+                continue
+            
+            # Categorize the file
+            category = _categorize_file(relative_path)
+            category_counts[category] += 1
+            
+            file_index.append({
+                "path": relative_path,
+                "category": category,
+                "size": file_size,
+                "extension": _file_extension(relative_path),
+                "extracted": False,
+                "extracted_to": None,
+            })
                     
     except Exception as e:
         logger.warning(f"Error scanning repository: {e}")
     
+    return file_index, dict(category_counts), total_size
+
+
+def _run_git(clone_dir: str, *args: str, timeout: int = 300) -> subprocess.CompletedProcess[str] | None:
+    """Run a git command inside clone_dir; returns None if it could not run."""
+    try:
+        return subprocess.run(
+            ["git", "-C", clone_dir, *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+
+
+def _git_head_sha(clone_dir: str) -> str | None:
+    """Commit sha currently checked out in clone_dir."""
+    result = _run_git(clone_dir, "rev-parse", "HEAD", timeout=30)
+    if result is None or result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def _git_fetch_changes(clone_dir: str, last_sha: str, blobless: bool) -> dict[str, str] | None:
+    """
+    Fetch the remote HEAD into an existing clone and move to it.
+    Returns {path: status} (A/M/D) for files changed since last_sha, or None.
+    """
+    if not last_sha or not os.path.isdir(os.path.join(clone_dir, ".git")):
+        return None
+    
+    fetch = _run_git(clone_dir, "fetch", "origin", "HEAD")
+    if fetch is None or fetch.returncode != 0:
+        return None
+    
+    diff = _run_git(clone_dir, "diff", "--name-status", "--no-renames", last_sha, "FETCH_HEAD")
+    if diff is None or diff.returncode != 0:
+        return None
+    
+    changes: dict[str, str] = {}
+    for line in diff.stdout.splitlines():
+        status, _, path = line.partition("\t")
+        if path:
+            changes[path] = status[:1]
+    
+    # A blobless clone has no full worktree: move HEAD without checking out and
+    # drop stale lazily checked-out copies so they are fetched again on demand
+    reset = _run_git(clone_dir, "reset", "--soft" if blobless else "--hard", "FETCH_HEAD")
+    if reset is None or reset.returncode != 0:
+        return None
+    
+    if blobless:
+        for path in changes:
+            try:
+                os.remove(os.path.join(clone_dir, path))
+            except OSError:
+                pass
+    
+    return changes
+
+
+def _diff_file_indexes(
+    old_index: list[dict[str, Any]],
+    new_index: list[dict[str, Any]],
+) -> dict[str, dict[str, Any] | None]:
+    """
+    Compare two file listings. Returns {path: new entry} for added or changed
+    files and {path: None} for removed ones. Blob shas are compared when the new
+    listing has them, sizes otherwise.
+    """
+    old_by_path = {f.get("path"): f for f in old_index}
+    changes: dict[str, dict[str, Any] | None] = {}
+    
+    for entry in new_index:
+        previous = old_by_path.pop(entry["path"], None)
+        if previous is None:
+            changes[entry["path"]] = entry
+        elif entry.get("sha"):
+            if entry["sha"] != previous.get("sha"):
+                changes[entry["path"]] = entry
+        elif entry.get("size") != previous.get("size"):
+            changes[entry["path"]] = entry
+    
+    for path in old_by_path:
+        changes[path] = None
+    
+    return changes
+
+
+def _apply_index_changes(
+    file_index: list[dict[str, Any]],
+    changes: dict[str, dict[str, Any] | None],
+) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """Merge changed entries into file_index; changed files are marked for re-extraction."""
+    merged = {f.get("path"): f for f in file_index}
+    counts = {"added": 0, "modified": 0, "removed": 0}
+    
+    for path, entry in changes.items():
+        if entry is None:
+            if merged.pop(path, None) is not None:
+                counts["removed"] += 1
+        elif path in merged:
+            merged[path] = entry
+            counts["modified"] += 1
+        else:
+            merged[path] = entry
+            counts["added"] += 1
+    
+    return list(merged.values()), counts
+
+
+def _rescan_changes(
+    config: dict[str, str],
+    repo_url: str,
+    manifest: dict[str, Any],
+    file_index: list[dict[str, Any]],
+    clone_dir: str,
+    clone_depth: int,
+) -> dict[str, dict[str, Any] | None] | None:
+    """
+    Work out which index entries changed since the last scan, bringing the local
+    clone up to date. Returns None when an incremental re-scan is not possible.
+    """
+    last_sha = manifest.get("last_extracted_commit_sha")
+    if not last_sha:
+        return None
+    
+    if manifest.get("scan_mode") == "api":
+        github_repo = _parse_github_repo(repo_url)
+        tree = _fetch_repo_tree(config, *github_repo) if github_repo else None
+        if tree is None:
+            return None
+        
+        if _git_fetch_changes(clone_dir, last_sha, blobless=True) is None:
+            if _clone_repo(repo_url, clone_dir, clone_depth, blobless=True):
+                return None
+        
+        new_index, _, _ = _index_from_tree(tree)
+        return _diff_file_indexes(file_index, new_index)
+    
+    changed = _git_fetch_changes(clone_dir, last_sha, blobless=False)
+    if changed is None:
+        # No usable local history: re-clone and compare a fresh walk by size
+        if _clone_repo(repo_url, clone_dir, clone_depth):
+            return None
+        new_index, _, _ = _index_from_clone(clone_dir)
+        return _diff_file_indexes(file_index, new_index)
+    
+    changes: dict[str, dict[str, Any] | None] = {}
+    for path, status in changed.items():
+        if status == "D":
+            changes[path] = None
+            continue
+        try:
+            file_size = os.stat(os.path.join(clone_dir, path)).st_size
+        except OSError:
+            changes[path] = None
+            continue
+        # Files that grew past the 5MB limit drop out of the index
+        if file_size > 5 * 1024 * 1024:
+            changes[path] = None
+            continue
+        changes[path] = {
+            "path": path,
+            "category": _categorize_file(path),
+            "size": file_size,
+            "extension": _file_extension(path),
+            "extracted": False,
+            "extracted_to": None,
+        }
+    return changes
+
+
+def _incremental_rescan(
+    config: dict[str, str],
+    repo_url: str,
+    repo_slug: str,
+    manifest: dict[str, Any],
+    clone_depth: int,
+) -> dict[str, Any] | None:
+    """Update an existing extraction's index with only the files that changed."""
+    clone_dir = f"/tmp/strixdb_extract/{repo_slug}"
+    
+    index, _ = _get_or_create_repo_file(config, repo_slug, "index.json", {"files": []})
+    file_index = index.get("files", [])
+    
+    changes = _rescan_changes(config, repo_url, manifest, file_index, clone_dir, clone_depth)
+    if changes is None:
+        return None
+    
+    head_sha = _git_head_sha(clone_dir)
+    file_index, counts = _apply_index_changes(file_index, changes)
+    
+    if changes:
+        category_counts = Counter(f.get("category", "references") for f in file_index)
+        
+        now = datetime.now(timezone.utc).isoformat()
+        manifest["category_counts"] = dict(category_counts)
+        manifest.setdefault("stats", {})["total_files_scanned"] = len(file_index)
+        manifest["stats"]["total_size_bytes"] = sum(f.get("size", 0) for f in file_index)
+        manifest["updated_at"] = now
+        manifest["last_extracted_commit_sha"] = head_sha or manifest["last_extracted_commit_sha"]
+        manifest.setdefault("extraction_history", []).append({
+            "timestamp": now,
+            "type": "incremental_rescan",
+            **counts,
+        })
+        
+        if not _bulk_commit(
+            config,
+            repo_slug,
+            {
+                "index.json": _with_index_summary(
+                    {"files": file_index, "updated_at": now}, manifest
+                ),
+                "manifest.json": manifest,
+            },
+            commit_message=f"[StrixDB] Incremental re-scan: {repo_slug}",
+        ):
+            return {
+                "success": False,
+                "error": "Failed to save re-scanned index",
+            }
+    
+    logger.info(f"[StrixDB] Incremental re-scan of {repo_slug}: {counts}")
+    
+    return {
+        "success": True,
+        "message": (
+            f"Repository '{repo_slug}' re-scanned: {counts['added']} added, "
+            f"{counts['modified']} modified, {counts['removed']} removed"
+        ),
+        "is_new": False,
+        "repo_slug": repo_slug,
+        "clone_path": clone_dir,
+        "manifest": manifest,
+        "changes": counts,
+        "hint": (
+            "Only changed files were re-indexed. New and modified files are pending; use "
+            "strixdb_repo_extract_category() or strixdb_repo_extract_all() to extract them."
+        ),
+    }
+
+
+@register_tool(sandbox_execution=True)
+def strixdb_repo_extract_init(
+    agent_state: Any,
+    repo_url: str,
+    description: str = "",
+    tags: list[str] | None = None,
+    clone_depth: int = 1,
+    scan_mode: str = "auto",
+) -> dict[str, Any]:
+    """
+    Initialize a repository extraction session.
+    
+    This clones the repository locally and prepares it for extraction.
+    Use this when you find a repository with valuable resources that
+    should be extracted into StrixDB for future use.
+    
+    For GitHub repositories the file index is built from a single Trees API
+    call and only a blobless partial clone is made; files are checked out
+    lazily when extracted. Other hosts, or trees GitHub truncates, fall back
+    to a regular clone and a local walk.
+    
+    Args:
+        agent_state: Current agent state
+        repo_url: Git repository URL (HTTPS or SSH)
+        description: Description of what this repo contains
+        tags: Tags for categorization (e.g., ["bugbounty", "wordlists", "tools"])
+        clone_depth: Git clone depth (1 for shallow, 0 for full)
+        scan_mode: "auto", "api" (Trees API + blobless clone) or "clone" (full clone + walk)
+    
+    Returns:
+        Dictionary with extraction session info and file manifest
+    """
+    config = _get_strixdb_config()
+    
+    if not config["repo"] or not config["token"]:
+        return {
+            "success": False,
+            "error": "StrixDB not configured. Ensure STRIXDB_TOKEN is set.",
+        }
+    
+    repo_slug = _sanitize_repo_slug(repo_url)
+    
+    # Check if already extracted
+    existing_manifest, manifest_sha = _get_or_create_repo_file(
+        config, repo_slug, "manifest.json", {}
+    )
+    
+    if existing_manifest and manifest_sha:
+        # Re-runs only re-index what changed since the last recorded commit
+        rescan = _incremental_rescan(config, repo_url, repo_slug, existing_manifest, clone_depth)
+        if rescan is not None:
+            return rescan
+        
+        return {
+            "success": True,
+            "message": f"Repository '{repo_slug}' already initialized. Use update functions to add more data.",
+            "is_new": False,
+            "repo_slug": repo_slug,
+            "manifest": existing_manifest,
+            "hint": (
+                "Repository already exists. Use:\n"
+                "- strixdb_repo_extract_scan() to re-scan for new files\n"
+                "- strixdb_repo_extract_file() to extract specific files\n"
+                "- strixdb_repo_extract_category() to extract by category"
+            ),
+        }
+    
+    # List files via the Trees API when possible
+    tree = None
+    if scan_mode in ("auto", "api"):
+        github_repo = _parse_github_repo(repo_url)
+        if github_repo:
+            tree = _fetch_repo_tree(config, *github_repo)
+        if tree is None and scan_mode == "api":
+            logger.info(f"[StrixDB] Trees API unavailable for {repo_slug}, falling back to clone")
+    
+    # Clone the repository locally (in sandbox)
+    clone_dir = f"/tmp/strixdb_extract/{repo_slug}"
+    
+    clone_error = _clone_repo(repo_url, clone_dir, clone_depth, blobless=tree is not None)
+    if clone_error:
+        return {
+            "success": False,
+            "error": clone_error,
+        }
+    
+    # Scan the repository
+    if tree is not None:
+        file_index, category_counts, total_size = _index_from_tree(tree)
+    else:
+        file_index, category_counts, total_size = _index_from_clone(clone_dir)
+    
     # Create manifest
     manifest = _create_extraction_manifest(
         repo_url=repo_url,
@@ -523,32 +1700,27 @@ def strixdb_repo_extract_init(
     manifest["stats"]["total_files_scanned"] = len(file_index)
     manifest["stats"]["total_size_bytes"] = total_size
     manifest["category_counts"] = category_counts
+    manifest["scan_mode"] = "api" if tree is not None else "clone"
+    manifest["last_extracted_commit_sha"] = _git_head_sha(clone_dir)
     manifest["status"] = "scanned"
     
-    # Save manifest
-    if not _save_repo_file(
+    # Create the extraction directory (README), manifest and file index in one commit
+    if not _bulk_commit(
         config,
         repo_slug,
-        "manifest.json",
-        manifest,
+        {
+            "README.md": _repo_readme(repo_slug, repo_url),
+            "manifest.json": manifest,
+            "index.json": _with_index_summary({
+                "files": file_index,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            }, manifest),
+        },
         commit_message=f"[StrixDB] Initialize extraction: {repo_slug}",
     ):
         return {
             "success": False,
-            "error": "Failed to save manifest",
-        }
-    
-    # Save file index
-    if not _save_repo_file(
-        config,
-        repo_slug,
-        "index.json",
-        {"files": file_index, "updated_at": datetime.now(timezone.utc).isoformat()},
-        commit_message=f"[StrixDB] Save file index: {repo_slug}",
-    ):
-        return {
-            "success": False,
-            "error": "Failed to save file index",
+            "error": f"Failed to save extraction directory for '{repo_slug}'",
         }
     
     logger.info(f"[StrixDB] Initialized extraction for {repo_slug}: {len(file_index)} files")
@@ -575,52 +1747,57 @@ def strixdb_repo_extract_init(
     }
 
 
-@register_tool(sandbox_execution=True)
-def strixdb_repo_extract_file(
-    agent_state: Any,
+def _prepare_extracted_item(
     repo_slug: str,
     file_path: str,
     custom_category: str | None = None,
     custom_name: str | None = None,
     custom_description: str = "",
     custom_tags: list[str] | None = None,
+    extracted_at: str | None = None,
 ) -> dict[str, Any]:
     """
-    Extract a specific file from a cloned repository into StrixDB.
-    
-    Reads the file content and saves it to the appropriate category
-    in StrixDB with full metadata.
-    
-    Args:
-        agent_state: Current agent state
-        repo_slug: Repository slug from strixdb_repo_extract_init
-        file_path: Relative path to the file within the repo
-        custom_category: Override auto-detected category
-        custom_name: Custom name for the item in StrixDB
-        custom_description: Description of the file/content
-        custom_tags: Additional tags
-    
-    Returns:
-        Dictionary with extraction result
+    Read a file from the local clone and build its StrixDB item without saving it.
+    Batch callers pass one extracted_at for every item they prepare.
+    Returns {"success": True, "item": ..., "content": text, "save_path": ...} or an error dict.
     """
-    config = _get_strixdb_config()
-    
-    if not config["repo"] or not config["token"]:
-        return {"success": False, "error": "StrixDB not configured"}
-    
     clone_dir = f"/tmp/strixdb_extract/{repo_slug}"
     full_path = os.path.join(clone_dir, file_path)
     
-    if not os.path.exists(full_path):
+    # Blobless clones start with an empty worktree; check the file out on demand
+    if not os.path.exists(full_path) and not (
+        _checkout_lazy_files(clone_dir, [file_path]) and os.path.exists(full_path)
+    ):
         return {
             "success": False,
             "error": f"File not found: {file_path}. Make sure the repo is cloned.",
         }
     
-    # Read file content
+    # Read raw bytes once; the hash is taken over them and the text is decoded
+    # from the same buffer instead of re-encoding the decoded string. Binary
+    # files (known extension or sniffed head) keep only metadata and a hash.
+    extension = _file_extension(file_path)
+    magic = ""
     try:
-        with open(full_path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
+        with open(full_path, 'rb') as f:
+            head = b"" if extension in _BINARY_EXTENSIONS else f.read(_BINARY_SNIFF_BYTES)
+            is_binary = extension in _BINARY_EXTENSIONS or _looks_binary(head)
+            
+            if is_binary:
+                if not head:
+                    head = f.read(16)
+                magic = head[:16].hex()
+                f.seek(0)
+                content_hash = hashlib.file_digest(
+                    f, lambda: hashlib.blake2b(digest_size=6)
+                ).hexdigest()
+                content_length = os.fstat(f.fileno()).st_size
+                content = ""
+            else:
+                raw = head + f.read()
+                content = raw.decode('utf-8', errors='replace')
+                content_hash = hashlib.blake2b(raw, digest_size=6).hexdigest()
+                content_length = len(content)
     except Exception as e:
         return {
             "success": False,
@@ -632,10 +1809,10 @@ def strixdb_repo_extract_file(
     
     # Generate name
     name = custom_name or Path(file_path).stem
-    safe_name = re.sub(r'[^\w\-]', '_', name).lower()
+    safe_name = _safe_item_name(name)
     
     # Create item data
-    now = datetime.now(timezone.utc).isoformat()
+    now = extracted_at or datetime.now(timezone.utc).isoformat()
     item_id = f"ext_{str(uuid.uuid4())[:8]}"
     
     item_data = {
@@ -647,14 +1824,122 @@ def strixdb_repo_extract_file(
         "description": custom_description or f"Extracted from {repo_slug}: {file_path}",
         "tags": custom_tags or [],
         "content": content,
-        "content_length": len(content),
-        "extension": Path(file_path).suffix.lower(),
+        "content_length": content_length,
+        "extension": extension,
         "extracted_at": now,
-        "hash": hashlib.md5(content.encode()).hexdigest()[:12],
+        "hash": content_hash,
     }
     
-    # Save to category directory
-    save_path = f"categories/{category}/{safe_name}.json"
+    if is_binary:
+        item_data["is_binary"] = True
+        item_data["magic"] = magic
+    elif _zstd_available and len(raw) >= ZSTD_MIN_BYTES and category in ZSTD_CATEGORIES:
+        item_data["content"] = ""
+        item_data["content_zstd_b64"] = base64.b64encode(_zstd_compress(raw)).decode()
+        item_data["encoding"] = "zstd"
+    
+    return {
+        "success": True,
+        "item": item_data,
+        "content": content,
+        "save_path": f"categories/{category}/{safe_name}.json",
+    }
+
+
+def _content_key(item: dict[str, Any]) -> str:
+    """Dedupe key for an item: its content hash qualified by length."""
+    return f"{item['hash']}:{item['content_length']}"
+
+
+def _unique_save_path(save_path: str, file_path: str) -> str:
+    """Disambiguate a save path shared by same-stem files with a hash of file_path."""
+    suffix = hashlib.blake2b(file_path.encode(), digest_size=4).hexdigest()
+    return f"{save_path.removesuffix('.json')}_{suffix}.json"
+
+
+def _dedupe_prepared(
+    repo_slug: str,
+    prepared: dict[str, Any],
+    batch_hashes: dict[str, str],
+) -> bool:
+    """
+    Replace a prepared item with a pointer when identical content is already
+    stored under another path in this batch or session. Otherwise claim its
+    content key in batch_hashes. Returns True when the item became a pointer.
+    """
+    item = prepared["item"]
+    content_key = _content_key(item)
+    original = batch_hashes.get(content_key) or _SESSION_CACHE.find_duplicate(
+        repo_slug, content_key
+    )
+    
+    if original is None or original == prepared["save_path"]:
+        batch_hashes.setdefault(content_key, prepared["save_path"])
+        return False
+    
+    prepared["item"] = {
+        "id": item["id"],
+        "duplicate_of": original,
+        "original_path": item["original_path"],
+    }
+    return True
+
+
+@register_tool(sandbox_execution=True)
+def strixdb_repo_extract_file(
+    agent_state: Any,
+    repo_slug: str,
+    file_path: str,
+    custom_category: str | None = None,
+    custom_name: str | None = None,
+    custom_description: str = "",
+    custom_tags: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Extract a specific file from a cloned repository into StrixDB.
+    
+    Reads the file content and saves it to the appropriate category
+    in StrixDB with full metadata.
+    
+    Args:
+        agent_state: Current agent state
+        repo_slug: Repository slug from strixdb_repo_extract_init
+        file_path: Relative path to the file within the repo
+        custom_category: Override auto-detected category
+        custom_name: Custom name for the item in StrixDB
+        custom_description: Description of the file/content
+        custom_tags: Additional tags
+    
+    Returns:
+        Dictionary with extraction result
+    """
+    config = _get_strixdb_config()
+    
+    if not config["repo"] or not config["token"]:
+        return {"success": False, "error": "StrixDB not configured"}
+    
+    prepared = _prepare_extracted_item(
+        repo_slug,
+        file_path,
+        custom_category=custom_category,
+        custom_name=custom_name,
+        custom_description=custom_description,
+        custom_tags=custom_tags,
+    )
+    if not prepared["success"]:
+        return prepared
+    
+    item_data = prepared["item"]
+    save_path = prepared["save_path"]
+    item_id = item_data["id"]
+    name = item_data["name"]
+    category = item_data["category"]
+    content = prepared["content"]
+    now = item_data["extracted_at"]
+    
+    batch_hashes: dict[str, str] = {}
+    _dedupe_prepared(repo_slug, prepared, batch_hashes)
+    item_data = prepared["item"]
     
     if not _save_repo_file(
         config,
@@ -668,46 +1953,38 @@ def strixdb_repo_extract_file(
             "error": "Failed to save extracted file",
         }
     
-    # Update index to mark as extracted
-    index, index_sha = _get_or_create_repo_file(
-        config, repo_slug, "index.json", {"files": []}
-    )
-    
-    if index and index_sha:
-        for f in index.get("files", []):
-            if f.get("path") == file_path:
-                f["extracted"] = True
-                f["extracted_to"] = save_path
-                break
+    with _SESSION_CACHE.session(repo_slug) as owner:
+        _SESSION_CACHE.remember_hashes(repo_slug, batch_hashes)
         
-        _save_repo_file(
-            config,
-            repo_slug,
-            "index.json",
-            index,
-            sha=index_sha,
-            commit_message=f"[StrixDB] Update index: {file_path} extracted",
-        )
-    
-    # Update manifest stats
-    manifest, manifest_sha = _get_or_create_repo_file(
-        config, repo_slug, "manifest.json", {}
-    )
-    
-    if manifest and manifest_sha:
-        if "stats" not in manifest:
-            manifest["stats"] = {}
-        manifest["stats"]["files_extracted"] = manifest["stats"].get("files_extracted", 0) + 1
-        manifest["updated_at"] = now
+        # Update index to mark as extracted
+        index, index_sha = _SESSION_CACHE.load(config, repo_slug, "index.json", {"files": []})
         
-        _save_repo_file(
-            config,
-            repo_slug,
-            "manifest.json",
-            manifest,
-            sha=manifest_sha,
-            commit_message=f"[StrixDB] Update manifest stats",
-        )
+        if index and index_sha:
+            for f in index.get("files", []):
+                if f.get("path") == file_path:
+                    f["extracted"] = True
+                    f["extracted_to"] = save_path
+                    if custom_name:
+                        f["item_name"] = custom_name
+                    break
+            _SESSION_CACHE.mark_dirty(repo_slug, "index.json")
+        
+        # Update manifest stats
+        manifest, manifest_sha = _SESSION_CACHE.load(config, repo_slug, "manifest.json", {})
+        
+        if manifest and manifest_sha:
+            if "stats" not in manifest:
+                manifest["stats"] = {}
+            manifest["stats"]["files_extracted"] = manifest["stats"].get("files_extracted", 0) + 1
+            manifest["updated_at"] = now
+            _SESSION_CACHE.mark_dirty(repo_slug, "manifest.json")
+        
+        if owner:
+            _SESSION_CACHE.flush(
+                config,
+                repo_slug,
+                commit_message=f"[StrixDB] Update index and manifest: {file_path} extracted",
+            )
     
     logger.info(f"[StrixDB] Extracted {file_path} to {category}")
     
@@ -724,43 +2001,81 @@ def strixdb_repo_extract_file(
     }
 
 
-@register_tool(sandbox_execution=True)
-def strixdb_repo_extract_category(
-    agent_state: Any,
+def _mark_extracted(
+    config: dict[str, str],
     repo_slug: str,
-    category: str,
-    max_files: int = 100,
-    max_file_size_kb: int = 500,
-    include_extensions: list[str] | None = None,
-    exclude_extensions: list[str] | None = None,
+    index: dict[str, Any],
+    index_sha: str | None,
+    extracted_to: dict[str, str],
+    now_iso: str,
+) -> None:
+    """Record extracted paths in the cached index and manifest and mark them dirty."""
+    if index_sha:
+        _, extracted_paths = _SESSION_CACHE.index_view(repo_slug, index)
+        for f in index.get("files", []):
+            save_path = extracted_to.get(f.get("path"))
+            if save_path:
+                f["extracted"] = True
+                f["extracted_to"] = save_path
+                extracted_paths.add(f["path"])
+        _SESSION_CACHE.mark_dirty(repo_slug, "index.json")
+    
+    manifest, manifest_sha = _SESSION_CACHE.load(config, repo_slug, "manifest.json", {})
+    if manifest and manifest_sha:
+        stats = manifest.setdefault("stats", {})
+        stats["files_extracted"] = stats.get("files_extracted", 0) + len(extracted_to)
+        manifest["updated_at"] = now_iso
+        _SESSION_CACHE.mark_dirty(repo_slug, "manifest.json")
+
+
+def _extraction_updates(
+    config: dict[str, str],
+    repo_slug: str,
+    index: dict[str, Any],
+    index_sha: str | None,
+    extracted_to: dict[str, str],
+    now_iso: str,
 ) -> dict[str, Any]:
     """
-    Extract all files of a specific category from a cloned repository.
-    
-    Batch extracts files that belong to the specified category
-    (as determined by the scanning process).
-    
-    Args:
-        agent_state: Current agent state
-        repo_slug: Repository slug from strixdb_repo_extract_init
-        category: Category to extract (tools, scripts, wordlists, payloads, etc.)
-        max_files: Maximum number of files to extract
-        max_file_size_kb: Skip files larger than this
-        include_extensions: Only include these extensions
-        exclude_extensions: Exclude these extensions
-    
-    Returns:
-        Dictionary with extraction results
+    Copies of the index and manifest with extracted_to recorded, for a flush
+    that commits them with the items. The cached documents are not modified.
     """
-    config = _get_strixdb_config()
-    
-    if not config["repo"] or not config["token"]:
-        return {"success": False, "error": "StrixDB not configured"}
+    updates: dict[str, Any] = {}
+    if index_sha:
+        updates["index.json"] = {
+            **index,
+            "files": [
+                {**f, "extracted": True, "extracted_to": extracted_to[f["path"]]}
+                if f.get("path") in extracted_to else f
+                for f in index.get("files", [])
+            ],
+        }
     
+    manifest, manifest_sha = _SESSION_CACHE.load(config, repo_slug, "manifest.json", {})
+    if manifest and manifest_sha:
+        stats = dict(manifest.get("stats", {}))
+        stats["files_extracted"] = stats.get("files_extracted", 0) + len(extracted_to)
+        updates["manifest.json"] = {**manifest, "stats": stats, "updated_at": now_iso}
+    return updates
+
+
+def _extract_category(
+    config: dict[str, str],
+    repo_slug: str,
+    category: str,
+    max_files: int,
+    max_file_size_kb: int,
+    include_extensions: list[str] | None,
+    exclude_extensions: list[str] | None,
+    flush: bool,
+    now_iso: str,
+) -> dict[str, Any]:
+    """
+    Body of strixdb_repo_extract_category, run inside an extraction session.
+    now_iso is the batch timestamp shared by every item and manifest update.
+    """
     # Load index
-    index, _ = _get_or_create_repo_file(
-        config, repo_slug, "index.json", {"files": []}
-    )
+    index, index_sha = _SESSION_CACHE.load(config, repo_slug, "index.json", {"files": []})
     
     if not index or not index.get("files"):
         return {
@@ -769,11 +2084,10 @@ def strixdb_repo_extract_category(
         }
     
     # Filter files by category
+    buckets, extracted_paths = _SESSION_CACHE.index_view(repo_slug, index)
     files_to_extract = []
-    for f in index.get("files", []):
-        if f.get("extracted"):
-            continue
-        if f.get("category") != category:
+    for f in buckets.get(category, []):
+        if f.get("path") in extracted_paths:
             continue
         if f.get("size", 0) > max_file_size_kb * 1024:
             continue
@@ -795,21 +2109,79 @@ def strixdb_repo_extract_category(
             "extracted_count": 0,
         }
     
-    # Extract each file
+    # Prepare each file, then commit all items plus index/manifest updates at once
     extracted = []
     failed = []
+    pending_files: dict[str, Any] = {}
+    extracted_to: dict[str, str] = {}
+    batch_hashes: dict[str, str] = {}
+    duplicates = 0
     
-    for f in files_to_extract:
-        result = strixdb_repo_extract_file(
-            agent_state,
-            repo_slug=repo_slug,
-            file_path=f["path"],
-        )
+    # Check out everything a blobless clone is still missing in one batch
+    clone_dir = f"/tmp/strixdb_extract/{repo_slug}"
+    missing = [
+        f["path"] for f in files_to_extract
+        if not os.path.exists(os.path.join(clone_dir, f["path"]))
+    ]
+    if missing:
+        _checkout_lazy_files(clone_dir, missing)
+    
+    with ThreadPoolExecutor(max_workers=min(EXTRACT_WORKERS, len(files_to_extract))) as executor:
+        futures = {
+            executor.submit(
+                _prepare_extracted_item, repo_slug, f["path"], extracted_at=now_iso
+            ): f["path"]
+            for f in files_to_extract
+        }
         
-        if result.get("success"):
-            extracted.append(f["path"])
+        # Paths already holding an item for another file: earlier batches in the
+        # index, then items claimed in this batch. Results are taken in index order
+        # so the same file keeps the plain name on every run.
+        taken = {
+            f["extracted_to"]: f.get("path")
+            for f in buckets.get(category, []) if f.get("extracted_to")
+        }
+        for future, path in futures.items():
+            prepared = future.result()
+            
+            if prepared["success"]:
+                if taken.get(prepared["save_path"], path) != path:
+                    prepared["save_path"] = _unique_save_path(prepared["save_path"], path)
+                taken[prepared["save_path"]] = path
+                # Dedupe against the final path so hash claims match what is stored
+                duplicates += _dedupe_prepared(repo_slug, prepared, batch_hashes)
+                pending_files[prepared["save_path"]] = prepared["item"]
+                extracted_to[path] = prepared["save_path"]
+            else:
+                failed.append({"path": path, "error": prepared.get("error", "Unknown")})
+    
+    if pending_files:
+        commit_message = f"[StrixDB] Extract {len(extracted_to)} {category} files"
+        
+        # The outermost session commits items, index and manifest together; nested
+        # calls commit only the items and leave the index/manifest to the caller's flush
+        if flush:
+            saved = _SESSION_CACHE.flush(
+                config,
+                repo_slug,
+                extra_files=pending_files,
+                commit_message=commit_message,
+                updates=_extraction_updates(
+                    config, repo_slug, index, index_sha, extracted_to, now_iso
+                ),
+            )
         else:
-            failed.append({"path": f["path"], "error": result.get("error", "Unknown")})
+            saved = _bulk_commit(config, repo_slug, pending_files, commit_message=commit_message)
+            if saved:
+                _mark_extracted(config, repo_slug, index, index_sha, extracted_to, now_iso)
+        
+        if saved:
+            _SESSION_CACHE.remember_hashes(repo_slug, batch_hashes)
+            extracted.extend(extracted_to)
+        else:
+            failed.extend(
+                {"path": path, "error": "Failed to save extracted file"} for path in extracted_to
+            )
     
     logger.info(f"[StrixDB] Category extraction complete: {len(extracted)} extracted, {len(failed)} failed")
     
@@ -819,11 +2191,59 @@ def strixdb_repo_extract_category(
         "category": category,
         "extracted_count": len(extracted),
         "failed_count": len(failed),
+        "deduplicated_count": duplicates,
         "extracted_files": extracted[:20],  # Show first 20
         "failed_files": failed[:10] if failed else [],
     }
 
 
+@register_tool(sandbox_execution=True)
+def strixdb_repo_extract_category(
+    agent_state: Any,
+    repo_slug: str,
+    category: str,
+    max_files: int = 100,
+    max_file_size_kb: int = 500,
+    include_extensions: list[str] | None = None,
+    exclude_extensions: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Extract all files of a specific category from a cloned repository.
+    
+    Batch extracts files that belong to the specified category
+    (as determined by the scanning process).
+    
+    Args:
+        agent_state: Current agent state
+        repo_slug: Repository slug from strixdb_repo_extract_init
+        category: Category to extract (tools, scripts, wordlists, payloads, etc.)
+        max_files: Maximum number of files to extract
+        max_file_size_kb: Skip files larger than this
+        include_extensions: Only include these extensions
+        exclude_extensions: Exclude these extensions
+    
+    Returns:
+        Dictionary with extraction results
+    """
+    config = _get_strixdb_config()
+    
+    if not config["repo"] or not config["token"]:
+        return {"success": False, "error": "StrixDB not configured"}
+    
+    with _SESSION_CACHE.session(repo_slug) as owner:
+        return _extract_category(
+            config,
+            repo_slug,
+            category,
+            max_files,
+            max_file_size_kb,
+            include_extensions,
+            exclude_extensions,
+            flush=owner,
+            now_iso=datetime.now(timezone.utc).isoformat(),
+        )
+
+
 @register_tool(sandbox_execution=True)
 def strixdb_repo_extract_all(
     agent_state: Any,
@@ -848,76 +2268,78 @@ def strixdb_repo_extract_all(
         skip_categories: Skip these categories
     
     Returns:
-        Dictionary with comprehensive extraction results
-    """
-    config = _get_strixdb_config()
-    
-    if not config["repo"] or not config["token"]:
-        return {"success": False, "error": "StrixDB not configured"}
-    
-    # Load manifest to get category list
-    manifest, _ = _get_or_create_repo_file(
-        config, repo_slug, "manifest.json", {}
-    )
-    
-    if not manifest:
-        return {
-            "success": False,
-            "error": f"Repository '{repo_slug}' not initialized. Run strixdb_repo_extract_init first.",
-        }
-    
-    all_categories = list(manifest.get("category_counts", {}).keys())
-    
-    if categories:
-        all_categories = [c for c in all_categories if c in categories]
-    if skip_categories:
-        all_categories = [c for c in all_categories if c not in skip_categories]
+        Dictionary with comprehensive extraction results
+    """
+    config = _get_strixdb_config()
     
-    results: dict[str, dict[str, Any]] = {}
-    total_extracted = 0
-    total_failed = 0
+    if not config["repo"] or not config["token"]:
+        return {"success": False, "error": "StrixDB not configured"}
     
-    for category in all_categories:
-        result = strixdb_repo_extract_category(
-            agent_state,
-            repo_slug=repo_slug,
-            category=category,
-            max_files=max_files_per_category,
-            max_file_size_kb=max_file_size_kb,
-        )
+    with _SESSION_CACHE.session(repo_slug):
+        # Load manifest to get category list
+        manifest, manifest_sha = _SESSION_CACHE.load(config, repo_slug, "manifest.json", {})
         
-        results[category] = {
-            "extracted": result.get("extracted_count", 0),
-            "failed": result.get("failed_count", 0),
-        }
+        if not manifest:
+            return {
+                "success": False,
+                "error": f"Repository '{repo_slug}' not initialized. Run strixdb_repo_extract_init first.",
+            }
         
-        total_extracted += result.get("extracted_count", 0)
-        total_failed += result.get("failed_count", 0)
-    
-    # Update manifest
-    manifest, manifest_sha = _get_or_create_repo_file(
-        config, repo_slug, "manifest.json", {}
-    )
-    
-    if manifest and manifest_sha:
-        manifest["status"] = "completed"
-        manifest["stats"]["files_extracted"] = total_extracted
-        manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
-        manifest["last_extraction_at"] = datetime.now(timezone.utc).isoformat()
-        
-        manifest["extraction_history"].append({
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "type": "full_extraction",
-            "files_extracted": total_extracted,
-            "files_failed": total_failed,
-        })
+        all_categories = list(manifest.get("category_counts", {}).keys())
         
-        _save_repo_file(
+        if categories:
+            all_categories = [c for c in all_categories if c in categories]
+        if skip_categories:
+            all_categories = [c for c in all_categories if c not in skip_categories]
+        
+        results: dict[str, dict[str, Any]] = {}
+        total_extracted = 0
+        total_failed = 0
+        now_iso = datetime.now(timezone.utc).isoformat()
+        
+        # Categories run inside this session, so they never flush on their own
+        for category in all_categories:
+            result = _extract_category(
+                config,
+                repo_slug,
+                category,
+                max_files_per_category,
+                max_file_size_kb,
+                None,
+                None,
+                flush=False,
+                now_iso=now_iso,
+            )
+            
+            results[category] = {
+                "extracted": result.get("extracted_count", 0),
+                "failed": result.get("failed_count", 0),
+            }
+            
+            total_extracted += result.get("extracted_count", 0)
+            total_failed += result.get("failed_count", 0)
+        
+        # Update manifest (the cached object already carries the category updates)
+        manifest, manifest_sha = _SESSION_CACHE.load(config, repo_slug, "manifest.json", {})
+        
+        if manifest and manifest_sha:
+            manifest["status"] = "completed"
+            manifest["stats"]["files_extracted"] = total_extracted
+            manifest["updated_at"] = now_iso
+            manifest["last_extraction_at"] = now_iso
+            
+            manifest["extraction_history"].append({
+                "timestamp": now_iso,
+                "type": "full_extraction",
+                "files_extracted": total_extracted,
+                "files_failed": total_failed,
+            })
+            _SESSION_CACHE.mark_dirty(repo_slug, "manifest.json")
+        
+        # Write the index and manifest once for the whole extraction
+        _SESSION_CACHE.flush(
             config,
             repo_slug,
-            "manifest.json",
-            manifest,
-            sha=manifest_sha,
             commit_message=f"[StrixDB] Complete extraction: {repo_slug}",
         )
     
@@ -962,7 +2384,7 @@ def strixdb_repo_extract_status(
     
     # Load manifest
     manifest, _ = _get_or_create_repo_file(
-        config, repo_slug, "manifest.json", {}
+        config, repo_slug, "manifest.json", {}, use_cache=True
     )
     
     if not manifest:
@@ -971,21 +2393,20 @@ def strixdb_repo_extract_status(
             "error": f"Repository '{repo_slug}' not found",
         }
     
-    # Load index for detailed stats
-    index, _ = _get_or_create_repo_file(
-        config, repo_slug, "index.json", {"files": []}
-    )
-    
-    files = index.get("files", [])
-    extracted_count = sum(1 for f in files if f.get("extracted"))
-    pending_count = sum(1 for f in files if not f.get("extracted"))
-    
-    # Group pending by category
-    pending_by_category: dict[str, int] = {}
-    for f in files:
-        if not f.get("extracted"):
-            cat = f.get("category", "unknown")
-            pending_by_category[cat] = pending_by_category.get(cat, 0) + 1
+    # Current manifests mirror the index stats, so the index is only loaded for
+    # older data; indexes without a stored summary are summarized on the fly
+    if "index_stats" in manifest and "pending_by_category" in manifest:
+        summary, pending_by_category = manifest["index_stats"], manifest["pending_by_category"]
+    else:
+        index, _ = _get_or_create_repo_file(
+            config, repo_slug, "index.json", {"files": []}, use_cache=True
+        )
+        if "stats" in index and "pending_by_category" in index:
+            summary, pending_by_category = index["stats"], index["pending_by_category"]
+        else:
+            summary, pending_by_category = _summarize_files(index.get("files", []))
+    total_files = summary["total"]
+    extracted_count = summary["extracted"]
     
     return {
         "success": True,
@@ -993,10 +2414,12 @@ def strixdb_repo_extract_status(
         "source_url": manifest.get("source_url"),
         "status": manifest.get("status", "unknown"),
         "stats": {
-            "total_files": len(files),
+            "total_files": total_files,
             "extracted": extracted_count,
-            "pending": pending_count,
-            "extraction_percentage": round(extracted_count / len(files) * 100, 1) if files else 0,
+            "pending": summary["pending"],
+            "extraction_percentage": (
+                round(extracted_count / total_files * 100, 1) if total_files else 0
+            ),
         },
         "category_counts": manifest.get("category_counts", {}),
         "pending_by_category": pending_by_category,
@@ -1006,6 +2429,31 @@ def strixdb_repo_extract_status(
     }
 
 
+def _iter_extracted(
+    files: list[dict[str, Any]],
+    category: str | None,
+) -> Iterator[dict[str, Any]]:
+    """Filter index entries to extracted files (of category) and project them in one pass."""
+    for f in files:
+        try:
+            extracted, cat, path, size, extracted_to = _LISTING_FIELDS(f)
+        except KeyError:
+            extracted, cat, path, size, extracted_to = (
+                f.get("extracted"), f.get("category"), f.get("path"),
+                f.get("size"), f.get("extracted_to"),
+            )
+        if not extracted:
+            continue
+        if category and cat != category:
+            continue
+        yield {
+            "path": path,
+            "category": cat,
+            "size": size,
+            "extracted_to": extracted_to,
+        }
+
+
 @register_tool(sandbox_execution=False)
 def strixdb_repo_list_extracted(
     agent_state: Any,
@@ -1034,30 +2482,187 @@ def strixdb_repo_list_extracted(
     
     # Load index
     index, _ = _get_or_create_repo_file(
-        config, repo_slug, "index.json", {"files": []}
+        config, repo_slug, "index.json", {"files": []}, use_cache=True
     )
     
-    files = index.get("files", [])
-    extracted = [f for f in files if f.get("extracted")]
+    # Scanning stops once limit matches are found, so "truncated" only
+    # reports whether more matches may exist.
+    items: list[dict[str, Any]] = []
+    append = items.append
+    truncated = False
+    for entry in _iter_extracted(index.get("files", []), category):
+        if len(items) >= limit:
+            truncated = True
+            break
+        append(entry)
     
-    if category:
-        extracted = [f for f in extracted if f.get("category") == category]
+    return {
+        "success": True,
+        "repo_slug": repo_slug,
+        "total_extracted": len(items),
+        "truncated": truncated,
+        "items": items,
+    }
+
+
+# Extracted-file listings for paging: (StrixDB repo, repo_slug, category) ->
+# (sha of the index.json they were built from, entries sorted by path). Cursors
+# are offsets into the list; a new index sha rebuilds it.
+_EXTRACTED_PARTITIONS: dict[
+    tuple[str, str, str | None], tuple[str | None, list[dict[str, Any]]]
+] = {}
+_partitions_lock = threading.Lock()
+EXTRACTED_PARTITIONS_MAX = 32
+LIST_PAGE_SIZE_MAX = 500
+
+
+def _extracted_partition(
+    config: dict[str, str],
+    repo_slug: str,
+    category: str | None,
+) -> list[dict[str, Any]]:
+    index, sha = _get_or_create_repo_file(
+        config, repo_slug, "index.json", {"files": []}, use_cache=True
+    )
+    key = (config["repo"], repo_slug, category)
+    with _partitions_lock:
+        cached = _EXTRACTED_PARTITIONS.get(key)
+    if cached and sha is not None and cached[0] == sha:
+        return cached[1]
+    
+    entries = sorted(
+        _iter_extracted(index.get("files", []), category),
+        key=lambda entry: entry["path"] or "",
+    )
+    with _partitions_lock:
+        if (
+            key not in _EXTRACTED_PARTITIONS
+            and len(_EXTRACTED_PARTITIONS) >= EXTRACTED_PARTITIONS_MAX
+        ):
+            _EXTRACTED_PARTITIONS.pop(next(iter(_EXTRACTED_PARTITIONS)))
+        _EXTRACTED_PARTITIONS[key] = (sha, entries)
+    return entries
+
+
+@register_tool(sandbox_execution=False)
+def strixdb_repo_list_extracted_page(
+    agent_state: Any,
+    repo_slug: str,
+    cursor: str | None = None,
+    page_size: int = 50,
+    category: str | None = None,
+) -> dict[str, Any]:
+    """
+    List extracted files from a repository one page at a time.
     
-    extracted = extracted[:limit]
+    Files are ordered by path. Pass the returned next_cursor to get the
+    following page; it is None on the last page.
+    
+    Args:
+        agent_state: Current agent state
+        repo_slug: Repository slug
+        cursor: Cursor from a previous page (omit for the first page)
+        page_size: Items per page (max 500)
+        category: Filter by category (optional)
+    
+    Returns:
+        Dictionary with one page of extracted items and the next cursor
+    """
+    config = _get_strixdb_config()
+    
+    if not config["repo"] or not config["token"]:
+        return {"success": False, "error": "StrixDB not configured"}
+    
+    try:
+        offset = int(cursor) if cursor else 0
+    except ValueError:
+        offset = -1
+    if offset < 0:
+        return {"success": False, "error": f"Invalid cursor: {cursor}"}
+    
+    page_size = max(1, min(page_size, LIST_PAGE_SIZE_MAX))
+    entries = _extracted_partition(config, repo_slug, category)
+    page = [dict(entry) for entry in entries[offset:offset + page_size]]
+    end = offset + len(page)
     
     return {
         "success": True,
         "repo_slug": repo_slug,
-        "total_extracted": len(extracted),
-        "items": [
-            {
-                "path": f.get("path"),
-                "category": f.get("category"),
-                "size": f.get("size"),
-                "extracted_to": f.get("extracted_to"),
+        "category": category,
+        "total_extracted": len(entries),
+        "items": page,
+        "next_cursor": str(end) if end < len(entries) else None,
+    }
+
+
+def _find_item_path(
+    config: dict[str, str],
+    repo_slug: str,
+    category: str,
+    item_name: str,
+) -> str | None:
+    """Look up where an extracted item named item_name in category was stored."""
+    index, _ = _get_or_create_repo_file(
+        config, repo_slug, "index.json", {"files": []}, use_cache=True
+    )
+    prefix = f"categories/{category}/"
+    for f in index.get("files", []):
+        stored = f.get("extracted_to")
+        if not stored or not stored.startswith(prefix):
+            continue
+        if f.get("item_name", Path(f.get("path", "")).stem) == item_name:
+            return stored
+    return None
+
+
+def _resolve_item(
+    config: dict[str, str],
+    repo_slug: str,
+    item_name: str,
+    item: dict[str, Any],
+    blob_shas: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """
+    Turn a stored item document into what get_item returns: duplicate pointers
+    are followed to the original content and zstd content is decompressed.
+    blob_shas (path -> blob sha) lets the original be read as a raw blob.
+    """
+    # Duplicates are stored as pointers to the first copy of their content
+    if "duplicate_of" in item:
+        original_path = item["duplicate_of"]
+        original, _ = _get_or_create_repo_file(
+            config,
+            repo_slug,
+            original_path,
+            {},
+            sha=(blob_shas or {}).get(original_path),
+            use_cache=True,
+        )
+        if not original:
+            return {
+                "success": False,
+                "error": f"Item '{item_name}' points to missing '{original_path}'",
             }
-            for f in extracted
-        ],
+        item = {
+            **original,
+            "id": item["id"],
+            "original_path": item["original_path"],
+            "duplicate_of": original_path,
+        }
+    
+    if item.get("encoding") == "zstd":
+        if not _zstd_available:
+            return {
+                "success": False,
+                "error": "Item is zstd-compressed; install 'zstandard' to read it",
+            }
+        compressed = base64.b64decode(item.pop("content_zstd_b64", ""))
+        item["content"] = _zstd_decompress(compressed).decode("utf-8", errors="replace")
+        del item["encoding"]
+    
+    return {
+        "success": True,
+        "item": item,
     }
 
 
@@ -1088,23 +2693,269 @@ def strixdb_repo_get_item(
         return {"success": False, "error": "StrixDB not configured"}
     
     # Try to load the item
-    safe_name = re.sub(r'[^\w\-]', '_', item_name).lower()
+    safe_name = _safe_item_name(item_name)
     item_path = f"categories/{category}/{safe_name}.json"
     
     item, _ = _get_or_create_repo_file(
-        config, repo_slug, item_path, {}
+        config, repo_slug, item_path, {}, use_cache=True
     )
     
+    # On a miss, resolve the name through the index, which records the path each
+    # item was actually written to
+    if not item:
+        stored_path = _find_item_path(config, repo_slug, category, item_name)
+        if stored_path and stored_path != item_path:
+            item, _ = _get_or_create_repo_file(
+                config, repo_slug, stored_path, {}, use_cache=True
+            )
+    
     if not item:
         return {
             "success": False,
             "error": f"Item '{item_name}' not found in category '{category}'",
         }
     
+    return _resolve_item(config, repo_slug, item_name, item)
+
+
+GET_ITEMS_MAX = 100
+
+
+def _item_blob_shas(config: dict[str, str], repo_slug: str) -> dict[str, str] | None:
+    """
+    Map every stored item path of repo_slug to its blob sha with one recursive
+    Trees API call on extracted_repos/<slug>/categories. None if unavailable.
+    """
+    cache_key = (config["repo"], repo_slug)
+    with _item_tree_lock:
+        cached = _ITEM_TREE_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < REPO_FILE_CACHE_TTL:
+        _count("item_tree_cache_hits")
+        return cached[1]
+    
+    tree_ref = f"{config['branch']}:extracted_repos/{repo_slug}/categories"
+    try:
+        response = _SESSION.get(
+            f"{config['api_base']}/repos/{config['repo']}/git/trees/{tree_ref}",
+            headers=_get_headers(config["token"]),
+            params={"recursive": "1"},
+            timeout=60,
+        )
+        if response.status_code != 200:
+            return None
+        data = _response_json(response)
+    except (requests.RequestException, ValueError):
+        return None
+    
+    if data.get("truncated"):
+        return None
+    
+    shas = {
+        f"categories/{entry['path']}": entry["sha"]
+        for entry in data.get("tree", [])
+        if entry.get("type") == "blob"
+    }
+    with _item_tree_lock:
+        _ITEM_TREE_CACHE[cache_key] = (time.monotonic(), shas)
+    return shas
+
+
+@register_tool(sandbox_execution=False)
+def strixdb_repo_get_items(
+    agent_state: Any,
+    repo_slug: str,
+    items: list[dict[str, str]],
+) -> dict[str, Any]:
+    """
+    Get several extracted items from a repository at once.
+    
+    One tree listing resolves every requested item to its blob, and the blobs
+    are fetched in parallel, instead of one Contents request per item.
+    
+    Args:
+        agent_state: Current agent state
+        repo_slug: Repository slug
+        items: Items to fetch as {"category": ..., "item_name": ...} dicts
+    
+    Returns:
+        Dictionary with the loaded items and per-item errors
+    """
+    config = _get_strixdb_config()
+    
+    if not config["repo"] or not config["token"]:
+        return {"success": False, "error": "StrixDB not configured"}
+    
+    if not items:
+        return {"success": False, "error": "No items requested"}
+    if len(items) > GET_ITEMS_MAX:
+        return {"success": False, "error": f"At most {GET_ITEMS_MAX} items per call"}
+    
+    blob_shas = _item_blob_shas(config, repo_slug)
+    
+    def _load(request: dict[str, str]) -> dict[str, Any]:
+        category = request.get("category", "")
+        item_name = request.get("item_name", "")
+        item_path = f"categories/{category}/{_safe_item_name(item_name)}.json"
+        
+        # Names whose computed path is not in the tree resolve through the index
+        if blob_shas is not None and item_path not in blob_shas:
+            item_path = _find_item_path(config, repo_slug, category, item_name) or item_path
+        
+        item, _ = _get_or_create_repo_file(
+            config,
+            repo_slug,
+            item_path,
+            {},
+            sha=(blob_shas or {}).get(item_path),
+            use_cache=True,
+        )
+        if not item:
+            return {
+                "success": False,
+                "error": f"Item '{item_name}' not found in category '{category}'",
+            }
+        return _resolve_item(config, repo_slug, item_name, item, blob_shas)
+    
+    with ThreadPoolExecutor(max_workers=min(MANIFEST_FETCH_WORKERS, len(items))) as executor:
+        results = list(executor.map(_load, items))
+    
+    loaded = []
+    errors = []
+    for request, result in zip(items, results, strict=True):
+        if result["success"]:
+            loaded.append(result["item"])
+        else:
+            errors.append({
+                "category": request.get("category"),
+                "item_name": request.get("item_name"),
+                "error": result["error"],
+            })
+    
     return {
-        "success": True,
-        "item": item,
+        "success": bool(loaded),
+        "repo_slug": repo_slug,
+        "items": loaded,
+        "total": len(loaded),
+        "errors": errors,
+    }
+
+
+def _build_search_query(
+    config: dict[str, str],
+    query: str,
+    repo_slug: str | None,
+    category: str | None,
+) -> str:
+    """Build the code search string scoped to StrixDB's extracted repos."""
+    search_query = f"repo:{config['repo']} {query}"
+    
+    if repo_slug:
+        search_query += f" path:extracted_repos/{repo_slug}"
+    else:
+        search_query += " path:extracted_repos"
+    
+    if category:
+        search_query += f" path:categories/{category}"
+    
+    return search_query
+
+
+# Code search allows only 30 requests/min, so identical queries reuse results:
+# (query, per_page, page) -> (monotonic time fetched, parsed body), kept in LRU order
+SEARCH_CACHE_SIZE = 128
+SEARCH_CACHE_TTL = 60.0
+_SEARCH_CACHE: OrderedDict[tuple[str, int, int], tuple[float, dict[str, Any]]] = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _search_cache_hit_rate() -> float:
+    with _metrics_lock:
+        hits, misses = _METRICS["search_cache_hits"], _METRICS["search_cache_misses"]
+    return round(hits / (hits + misses), 3) if hits + misses else 0.0
+
+
+def _code_search(
+    config: dict[str, str],
+    search_query: str,
+    per_page: int,
+    page: int = 1,
+) -> tuple[int, dict[str, Any]]:
+    """
+    Run one page of GitHub code search; returns (status code, parsed body).
+    Successful pages are served from _SEARCH_CACHE for SEARCH_CACHE_TTL seconds.
+    
+    Code search is REST-only: GraphQL's search connection has no CODE type.
+    The page is requested with the plain v3 media type (no text-match
+    fragments) and each hit is projected to the fields we read (path, score)
+    before caching, dropping the per-hit repository object and URLs.
+    """
+    cache_key = (search_query, per_page, page)
+    with _search_cache_lock:
+        cached = _SEARCH_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+            _SEARCH_CACHE.move_to_end(cache_key)
+            _count("search_cache_hits")
+            return 200, cached[1]
+        _count("search_cache_misses")
+    
+    params: dict[str, Any] = {"q": search_query, "per_page": per_page}
+    if page > 1:
+        params["page"] = page
+    
+    response = _SESSION.get(
+        f"{config['api_base']}/search/code",
+        headers=_get_headers(config["token"]),
+        params=params,
+        timeout=30,
+    )
+    if response.status_code != 200:
+        return response.status_code, {}
+    
+    body = _response_json(response)
+    data = {
+        "total_count": body.get("total_count"),
+        "items": [
+            {"path": item.get("path", ""), "score": item.get("score", 0)}
+            for item in body.get("items", [])
+        ],
     }
+    with _search_cache_lock:
+        _SEARCH_CACHE[cache_key] = (time.monotonic(), data)
+        _SEARCH_CACHE.move_to_end(cache_key)
+        while len(_SEARCH_CACHE) > SEARCH_CACHE_SIZE:
+            _SEARCH_CACHE.popitem(last=False)
+    return response.status_code, data
+
+
+# GitHub code search serves at most 100 results per page and 1000 in total
+SEARCH_PER_PAGE_MAX = 100
+SEARCH_MAX_RESULTS = 1000
+
+# Pages requested ahead of the one being parsed; code search allows only
+# ~30 requests per minute, so the window stays small
+SEARCH_PREFETCH_MAX = 3
+
+
+def _search_results(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Map code search hits to StrixDB results, dropping paths outside extracted_repos/."""
+    results = []
+    for item in items:
+        path = item.get("path", "")
+        if not path.startswith("extracted_repos/"):
+            continue
+        
+        # extracted_repos/<slug>/categories/<category>/<file>: only the first
+        # four separators are needed, so the split stops there
+        parts = path.split("/", 4)
+        if len(parts) >= 4:
+            results.append({
+                "repo_slug": parts[1],
+                "category": parts[3] if parts[2] == "categories" else None,
+                "file": path.rpartition("/")[2],
+                "path": path,
+                "score": item.get("score", 0),
+            })
+    return results
 
 
 @register_tool(sandbox_execution=False)
@@ -1114,19 +2965,23 @@ def strixdb_repo_search(
     repo_slug: str | None = None,
     category: str | None = None,
     limit: int = 20,
+    prefetch_pages: int = 1,
 ) -> dict[str, Any]:
     """
     Search across extracted repository content.
     
     Find files and content matching your query across all or specific
-    extracted repositories.
+    extracted repositories. Limits above one page (100) are served from
+    several pages; up to prefetch_pages further pages are requested while
+    the current one is parsed.
     
     Args:
         agent_state: Current agent state
         query: Search query
         repo_slug: Limit to specific repo (optional)
         category: Limit to specific category (optional)
-        limit: Maximum results
+        limit: Maximum results (at most 1000)
+        prefetch_pages: Pages to request ahead (0-3, 0 fetches sequentially)
     
     Returns:
         Dictionary with search results
@@ -1136,63 +2991,71 @@ def strixdb_repo_search(
     if not config["repo"] or not config["token"]:
         return {"success": False, "error": "StrixDB not configured"}
     
+    limit = max(1, min(limit, SEARCH_MAX_RESULTS))
+    per_page = min(limit, SEARCH_PER_PAGE_MAX)
+    
     try:
-        # Use GitHub code search API
-        search_query = f"repo:{config['repo']} {query}"
-        
-        if repo_slug:
-            search_query += f" path:extracted_repos/{repo_slug}"
-        else:
-            search_query += " path:extracted_repos"
-        
-        if category:
-            search_query += f" path:categories/{category}"
-        
-        url = f"{config['api_base']}/search/code"
-        params = {
-            "q": search_query,
-            "per_page": min(limit, 100),
-        }
-        
-        response = requests.get(
-            url,
-            headers=_get_headers(config["token"]),
-            params=params,
-            timeout=30,
-        )
+        search_query = _build_search_query(config, query, repo_slug, category)
+        status_code, data = _code_search(config, search_query, per_page)
         
-        if response.status_code != 200:
+        if status_code != 200:
             return {
                 "success": False,
-                "error": f"Search failed: {response.status_code}",
+                "error": f"Search failed: {status_code}",
                 "results": [],
             }
         
-        data = response.json()
-        results = []
+        total_count = data.get("total_count")
+        page_items = data.get("items", [])
+        results = _search_results(page_items)
+        pages_fetched = 1
         
-        for item in data.get("items", []):
-            path = item.get("path", "")
-            
-            # Parse path to extract repo_slug and category
-            parts = path.split("/")
-            if len(parts) >= 4 and parts[0] == "extracted_repos":
-                results.append({
-                    "repo_slug": parts[1],
-                    "category": parts[3] if len(parts) > 3 and parts[2] == "categories" else None,
-                    "file": parts[-1],
-                    "path": path,
-                    "score": item.get("score", 0),
-                })
+        available = limit if total_count is None else min(total_count, SEARCH_MAX_RESULTS)
+        last_page = -(-min(limit, available) // per_page)
+        window = max(0, min(prefetch_pages, SEARCH_PREFETCH_MAX))
+        
+        executor = ThreadPoolExecutor(max_workers=window) if window and last_page > 1 else None
+        pending: deque[Any] = deque()
+        next_page = 2
+        try:
+            while len(results) < limit and len(page_items) == per_page and next_page <= last_page:
+                if executor:
+                    while len(pending) < window and next_page + len(pending) <= last_page:
+                        _count("search_pages_prefetched")
+                        pending.append(executor.submit(
+                            _code_search, config, search_query, per_page,
+                            next_page + len(pending),
+                        ))
+                    fetch = pending.popleft().result
+                else:
+                    fetch = partial(_code_search, config, search_query, per_page, next_page)
+                next_page += 1
+                
+                try:
+                    status_code, data = fetch()
+                except (requests.RequestException, ValueError) as e:
+                    logger.warning(f"Search page {next_page - 1} failed: {e}")
+                    break
+                if status_code != 200:
+                    break
+                
+                page_items = data.get("items", [])
+                results.extend(_search_results(page_items))
+                pages_fetched += 1
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
         
         return {
             "success": True,
             "query": query,
-            "total_count": data.get("total_count", len(results)),
+            "total_count": len(results) if total_count is None else total_count,
+            "pages_fetched": pages_fetched,
+            "cache_hit_rate": _search_cache_hit_rate(),
             "results": results[:limit],
         }
         
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError) as e:
         return {
             "success": False,
             "error": f"Search failed: {e}",
@@ -1200,6 +3063,74 @@ def strixdb_repo_search(
         }
 
 
+GRAPHQL_BATCH_SIZE = 100
+
+# Concurrent REST manifest loads when GraphQL is unavailable; kept small to stay
+# clear of GitHub's secondary rate limits
+MANIFEST_FETCH_WORKERS = 8
+
+
+def _graphql_url(api_base: str) -> str:
+    """GraphQL endpoint for an API base (api.github.com or GHES /api/v3)."""
+    if api_base.endswith("/v3"):
+        return f"{api_base[:-3]}graphql"
+    return f"{api_base}/graphql"
+
+
+def _fetch_manifests_graphql(
+    config: dict[str, str],
+    repo_slugs: list[str],
+) -> dict[str, dict[str, Any]] | None:
+    """
+    Load manifest.json for many extracted repos with aliased GraphQL blob lookups,
+    one request per GRAPHQL_BATCH_SIZE slugs. Returns None if any batch fails so
+    the caller can fall back to REST.
+    """
+    owner, _, name = config["repo"].partition("/")
+    manifests: dict[str, dict[str, Any]] = {}
+    
+    for start in range(0, len(repo_slugs), GRAPHQL_BATCH_SIZE):
+        batch = repo_slugs[start:start + GRAPHQL_BATCH_SIZE]
+        fields = " ".join(
+            f"f{i}: object(expression: "
+            f"{json.dumps(config['branch'] + ':extracted_repos/' + slug + '/manifest.json')})"
+            " { ... on Blob { text } }"
+            for i, slug in enumerate(batch)
+        )
+        query = (
+            f"query {{ repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+            f"{{ {fields} }} }}"
+        )
+        
+        try:
+            response = _SESSION.post(
+                _graphql_url(config["api_base"]),
+                headers=_get_headers(config["token"]),
+                json={"query": query},
+                timeout=30,
+            )
+            if response.status_code != 200:
+                return None
+            body = response.json()
+        except (requests.RequestException, ValueError):
+            return None
+        
+        repository = (body.get("data") or {}).get("repository")
+        if body.get("errors") or repository is None:
+            return None
+        _count("graphql_batches")
+        _count("graphql_manifests", len(batch))
+        
+        for i, slug in enumerate(batch):
+            blob = repository.get(f"f{i}") or {}
+            try:
+                manifests[slug] = json.loads(blob["text"]) if blob.get("text") else {}
+            except json.JSONDecodeError:
+                manifests[slug] = {}
+    
+    return manifests
+
+
 @register_tool(sandbox_execution=False)
 def strixdb_repo_list(
     agent_state: Any,
@@ -1225,7 +3156,7 @@ def strixdb_repo_list(
     try:
         # List contents of extracted_repos directory
         url = f"{config['api_base']}/repos/{config['repo']}/contents/extracted_repos"
-        response = requests.get(url, headers=_get_headers(config["token"]), timeout=30)
+        response = _SESSION.get(url, headers=_get_headers(config["token"]), timeout=30)
         
         if response.status_code == 404:
             return {"success": True, "repositories": [], "message": "No extracted repositories found"}
@@ -1233,27 +3164,38 @@ def strixdb_repo_list(
         if response.status_code != 200:
             return {"success": False, "error": f"Failed to list repos: {response.status_code}"}
         
-        items = response.json()
+        items = _response_json(response)
         repos = []
         
-        for item in items[:limit]:
-            if item.get("type") == "dir":
-                repo_slug = item.get("name")
-                
-                # Load manifest for details
-                manifest, _ = _get_or_create_repo_file(
-                    config, repo_slug, "manifest.json", {}
+        repo_slugs = [item.get("name") for item in items[:limit] if item.get("type") == "dir"]
+        
+        # One GraphQL request loads every manifest; REST per repo is the fallback
+        manifests = _fetch_manifests_graphql(config, repo_slugs) if repo_slugs else {}
+        
+        if manifests is None:
+            _count("manifest_rest_fallbacks")
+            with ThreadPoolExecutor(
+                max_workers=min(MANIFEST_FETCH_WORKERS, len(repo_slugs))
+            ) as executor:
+                loaded = executor.map(
+                    lambda slug: _get_or_create_repo_file(
+                        config, slug, "manifest.json", {}, use_cache=True
+                    )[0],
+                    repo_slugs,
                 )
-                
-                repos.append({
-                    "slug": repo_slug,
-                    "source_url": manifest.get("source_url", ""),
-                    "status": manifest.get("status", "unknown"),
-                    "files_extracted": manifest.get("stats", {}).get("files_extracted", 0),
-                    "categories": list(manifest.get("category_counts", {}).keys()),
-                    "tags": manifest.get("tags", []),
-                    "created_at": manifest.get("created_at"),
-                })
+                manifests = dict(zip(repo_slugs, loaded, strict=True))
+        
+        for repo_slug in repo_slugs:
+            manifest = manifests.get(repo_slug, {})
+            repos.append({
+                "slug": repo_slug,
+                "source_url": manifest.get("source_url", ""),
+                "status": manifest.get("status", "unknown"),
+                "files_extracted": manifest.get("stats", {}).get("files_extracted", 0),
+                "categories": list(manifest.get("category_counts", {}).keys()),
+                "tags": manifest.get("tags", []),
+                "created_at": manifest.get("created_at"),
+            })
         
         return {
             "success": True,
@@ -1261,5 +3203,38 @@ def strixdb_repo_list(
             "total": len(repos),
         }
         
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError) as e:
         return {"success": False, "error": f"Request failed: {e}"}
+
+
+@register_tool(sandbox_execution=False)
+def strixdb_metrics(agent_state: Any) -> dict[str, Any]:
+    """
+    Report StrixDB cache, batching and rate-limit counters for this process.
+    
+    Args:
+        agent_state: Current agent state
+    
+    Returns:
+        Dictionary with headline metrics and the raw counters
+    """
+    with _metrics_lock:
+        counters = dict(_METRICS)
+    
+    remaining = _RATE_BUDGET.remaining()
+    return {
+        "success": True,
+        "cache_hits": (
+            counters.get("repo_file_cache_hits", 0)
+            + counters.get("search_cache_hits", 0)
+            + counters.get("item_tree_cache_hits", 0)
+        ),
+        "etag_304": counters.get("etag_304", 0),
+        "graphql_batches": counters.get("graphql_batches", 0),
+        "search_cache_hit_rate": _search_cache_hit_rate(),
+        "rate_limit_remaining": remaining,
+        "rate_limit_reset_in": (
+            max(0, round(_RATE_BUDGET.seconds_until_reset())) if remaining is not None else None
+        ),
+        "counters": counters,
+    }
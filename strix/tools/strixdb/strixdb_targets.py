@@ -26,38 +26,152 @@ Target Structure:
 - targets/{target_slug}/
   - profile.json - Main target profile and metadata
   - sessions/ - Individual session data
-  - findings/ - Vulnerability findings
+  - findings/ - Vulnerability findings, one {finding_id}.json per finding
+    plus an append-only _index.jsonl of one-line summaries
   - endpoints.json - Discovered endpoints and paths
   - technologies.json - Tech stack information
-  - notes.json - Session notes and observations
+  - notes/ - Session notes and observations, in chunk files of
+    NOTES_CHUNK_SIZE entries (0000.json, 0001.json, ...) plus an
+    index.json naming the chunk being filled
+
+All files are compact UTF-8 JSON rather than a binary format such as
+MessagePack: they stay readable and diffable on GitHub, and with orjson the
+serialization cost is already small next to the API round-trip.
 """
 
 from __future__ import annotations
 
 import base64
+import copy
 import hashlib
 import json
 import logging
 import os
+import random
 import re
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Final
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from strix.tools.registry import register_tool
 
 
 logger = logging.getLogger(__name__)
 
+# Target files are (de)serialized with orjson when it is installed; the stdlib
+# json module is the fallback. Both write compact, unindented JSON.
+try:
+    import orjson
+    
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
 
-def _get_strixdb_config() -> dict[str, str]:
-    """Get StrixDB configuration."""
+
+def _dump_json_bytes(content: Any, newline: bool = False) -> bytes:
+    """Serialize content to compact UTF-8 JSON, optionally ending in a newline."""
+    if _orjson_available:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_APPEND_NEWLINE if newline else 0)
+        try:
+            return orjson.dumps(content, option=option)
+        except TypeError:
+            pass  # types orjson rejects (e.g. ints beyond 64 bits) go through json
+    text = json.dumps(content, separators=(",", ":"), ensure_ascii=False)
+    return (text + "\n" if newline else text).encode()
+
+
+# Parse UTF-8 JSON bytes without decoding them to str first. The parser is picked
+# once at import so the per-file hot path does not re-check which one is installed.
+_load_json_bytes: Callable[[bytes], Any] = orjson.loads if _orjson_available else json.loads
+
+
+def _encode_target_file(file_name: str, content: Any) -> bytes:
+    """Serialize a target file; .jsonl files hold a list as one JSON object per line."""
+    if file_name.endswith(".jsonl"):
+        return b"".join(_dump_json_bytes(entry, newline=True) for entry in content)
+    return _dump_json_bytes(content)
+
+
+def _decode_target_file(file_name: str, raw: bytes) -> Any:
+    """Inverse of _encode_target_file."""
+    if file_name.endswith(".jsonl"):
+        return [_load_json_bytes(line) for line in raw.splitlines() if line.strip()]
+    return _load_json_bytes(raw)
+
+
+def _create_session() -> requests.Session:
+    """Create the shared HTTP session used for all target file API calls.
+    
+    Pooled keep-alive connections avoid a TCP+TLS handshake per request,
+    urllib3 retries transient gateway errors and 429s, honoring Retry-After,
+    and the extraction module's _rate_limit_hook paces calls against the
+    X-RateLimit-* budget. Both modules use the same token, so they share one
+    budget; an exhausted-budget 403 waits for the reset and is re-sent
+    instead of surfacing as a failed write.
+    """
+    from strix.tools.strixdb.strixdb_repo_extract import _rate_limit_hook
+    
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    # Sized for strixdb_target_get, whose section loaders each run
+    # their own TARGET_FETCH_WORKERS fetches at once
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.hooks["response"].append(_rate_limit_hook)
+    return session
+
+
+_SESSION = _create_session()
+
+
+@lru_cache(maxsize=1)
+def _load_strixdb_config() -> dict[str, str]:
+    """
+    Resolve StrixDB configuration once per process.
+    
+    Resolving the owner costs a GitHub /user round-trip. Call
+    _invalidate_config_cache() after changing the STRIXDB_* environment.
+    """
     from strix.tools.strixdb.strixdb_actions import _get_strixdb_config as get_config
     return get_config()
 
 
+def _invalidate_config_cache() -> None:
+    """Forget the memoized StrixDB configuration (e.g. after changing STRIXDB_* env vars)."""
+    _load_strixdb_config.cache_clear()
+
+
+def _get_strixdb_config() -> dict[str, str]:
+    """Get StrixDB configuration (memoized; a missing repo is re-resolved next call)."""
+    config = _load_strixdb_config()
+    if not config["repo"]:
+        # Don't pin a transient /user failure or unset token for the whole process
+        _load_strixdb_config.cache_clear()
+    return config
+
+
+# Shared early-return for tools called without a configured StrixDB; callers
+# return a copy so results can be extended without touching the template
+_ERR_NOT_CONFIGURED: Final = {"success": False, "error": "StrixDB not configured"}
+
+
 def _get_headers(token: str) -> dict[str, str]:
     """Get headers for GitHub API requests."""
     return {
@@ -67,21 +181,42 @@ def _get_headers(token: str) -> dict[str, str]:
     }
 
 
+def _json_headers(token: str) -> dict[str, str]:
+    """
+    Headers for requests whose body is pre-serialized with _dump_json_bytes.
+    
+    Large writes (base64 file content, inline tree blobs) are sent as data=
+    bytes rather than json=, so requests does not serialize the payload a
+    second time with the stdlib encoder.
+    """
+    return {**_get_headers(token), "Content-Type": "application/json"}
+
+
+_URL_SCHEME = re.compile(r'^https?://')
+_PORT_SUFFIX = re.compile(r':\d+$')
+# Runs of unsafe characters become one underscore; the separate collapse
+# pass also folds underscores already in the target, so slugs stay stable
+_SLUG_UNSAFE = re.compile(r'[^\w\-.]+')
+_SLUG_COLLAPSE = re.compile(r'_{2,}')
+
+
+@lru_cache(maxsize=4096)
 def _sanitize_target_slug(target: str) -> str:
     """
     Create a safe directory-friendly slug from a target identifier.
-    Handles URLs, IPs, domains, etc.
+    Handles URLs, IPs, domains, etc. Memoized: agents pass the same few
+    targets to every tool call.
     """
     # Remove protocol
-    target = re.sub(r'^https?://', '', target)
+    target = _URL_SCHEME.sub('', target)
     # Remove trailing slashes and paths for domain-based slugs
-    target = target.split('/')[0]
+    target = target.partition('/')[0]
     # Remove port numbers for cleaner slug
-    target = re.sub(r':\d+$', '', target)
+    target = _PORT_SUFFIX.sub('', target)
     # Replace unsafe characters
-    slug = re.sub(r'[^\w\-.]', '_', target)
+    slug = _SLUG_UNSAFE.sub('_', target)
     # Remove multiple underscores
-    slug = re.sub(r'_+', '_', slug)
+    slug = _SLUG_COLLAPSE.sub('_', slug)
     # Trim and lowercase
     slug = slug.strip('_').lower()
     
@@ -92,9 +227,14 @@ def _sanitize_target_slug(target: str) -> str:
     return slug
 
 
-def _generate_session_id() -> str:
-    """Generate a unique session ID."""
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+def _merge_unique(existing: list[Any], new: list[Any]) -> list[Any]:
+    """existing followed by the items of new it lacks, in order, in a single pass."""
+    return list(dict.fromkeys(chain(existing, new)))
+
+
+def _generate_session_id(now: datetime | None = None) -> str:
+    """Generate a unique session ID, stamped with now (default: the current time)."""
+    timestamp = (now or datetime.now(timezone.utc)).strftime("%Y%m%d_%H%M%S")
     unique = str(uuid.uuid4())[:8]
     return f"session_{timestamp}_{unique}"
 
@@ -106,10 +246,14 @@ def _create_initial_target_profile(
     scope: list[str] | None = None,
     out_of_scope: list[str] | None = None,
     tags: list[str] | None = None,
+    slug: str | None = None,
 ) -> dict[str, Any]:
-    """Create the initial target profile structure."""
+    """
+    Create the initial target profile structure.
+    Pass slug when the caller has already sanitized target.
+    """
     now = datetime.now(timezone.utc).isoformat()
-    slug = _sanitize_target_slug(target)
+    slug = slug or _sanitize_target_slug(target)
     
     return {
         "id": str(uuid.uuid4())[:12],
@@ -181,14 +325,16 @@ def _create_session_data(
     target_slug: str,
     objective: str = "",
     focus_areas: list[str] | None = None,
+    now: datetime | None = None,
 ) -> dict[str, Any]:
-    """Create a new session data structure."""
-    now = datetime.now(timezone.utc).isoformat()
+    """Create a new session data structure, started at now (default: the current time)."""
+    now = now or datetime.now(timezone.utc)
     
     return {
         "session_id": session_id,
         "target_slug": target_slug,
-        "started_at": now,
+        "started_at": now.isoformat(),
+        "started_at_epoch": now.timestamp(),  # for durations without re-parsing
         "ended_at": None,
         "duration_minutes": 0,
         "status": "active",  # active, completed, paused, failed
@@ -237,49 +383,255 @@ def _create_session_data(
     }
 
 
+# Cache of target files: (StrixDB repo, target_slug, file_name) -> (etag, raw
+# bytes, sha, monotonic time stored), kept in LRU order. Entries from a GET carry
+# its ETag and are revalidated with If-None-Match. Entries for files this process
+# just wrote have etag None and are served without a request for
+# TARGET_WRITE_CACHE_TTL seconds, then re-read so other agents' writes show up.
+# Entries from a raw blob read have an empty etag and are only served to reads
+# asking for that same sha, since a blob sha pins its content. The bytes are
+# re-parsed on every hit so callers can mutate what they get back without
+# corrupting the cache.
+TARGET_CACHE_SIZE = 256
+TARGET_WRITE_CACHE_TTL = 30.0
+_ETAG_CACHE: OrderedDict[
+    tuple[str, str, str], tuple[str | None, bytes, str | None, float]
+] = OrderedDict()
+_etag_cache_lock = threading.Lock()
+
+
+def _cache_get(
+    key: tuple[str, str, str],
+) -> tuple[str | None, bytes, str | None, float] | None:
+    with _etag_cache_lock:
+        entry = _ETAG_CACHE.get(key)
+        if entry is not None:
+            _ETAG_CACHE.move_to_end(key)
+        return entry
+
+
+def _cache_put(key: tuple[str, str, str], entry: tuple[str | None, bytes, str | None]) -> None:
+    with _etag_cache_lock:
+        _ETAG_CACHE[key] = (*entry, time.monotonic())
+        _ETAG_CACHE.move_to_end(key)
+        while len(_ETAG_CACHE) > TARGET_CACHE_SIZE:
+            _ETAG_CACHE.popitem(last=False)
+
+
+def _cache_written(config: dict[str, str], target_slug: str, file_name: str, raw: bytes) -> None:
+    """Record bytes this process wrote; their sha is the git blob sha of raw."""
+    _cache_put((config["repo"], target_slug, file_name), (None, raw, _git_blob_sha(raw)))
+
+
+def _git_blob_sha(raw: bytes) -> str:
+    """The sha git assigns to a blob holding raw."""
+    return hashlib.sha1(b"blob %d\0" % len(raw) + raw, usedforsecurity=False).hexdigest()
+
+
+def _fetch_blob_bytes(config: dict[str, str], sha: str) -> bytes | None:
+    """Fetch a blob's raw bytes by sha (no base64 wrapping)."""
+    headers = _get_headers(config["token"])
+    headers["Accept"] = "application/vnd.github.raw"
+    
+    response = _SESSION.get(
+        f"{config['api_base']}/repos/{config['repo']}/git/blobs/{sha}",
+        headers=headers,
+        timeout=60,
+    )
+    if response.status_code != 200:
+        return None
+    return response.content
+
+
 def _get_or_create_target_file(
     config: dict[str, str],
     target_slug: str,
     file_name: str,
     default_content: dict[str, Any] | list[Any],
+    sha: str | None = None,
 ) -> tuple[dict[str, Any] | list[Any], str | None]:
     """
     Get existing file content or return default.
     Returns (content, sha) where sha is None if file doesn't exist.
+    
+    With a known blob sha the raw blob is fetched directly, skipping the
+    Contents API's base64 wrapping. Files over 1MB, for which the Contents API
+    returns no inline content, are read the same way.
     """
+    cache_key = (config["repo"], target_slug, file_name)
+    cached = _cache_get(cache_key)
+    
+    try:
+        written_recently = (
+            cached is not None
+            and cached[0] is None
+            and time.monotonic() - cached[3] < TARGET_WRITE_CACHE_TTL
+        )
+        if cached and (written_recently or (sha and cached[2] == sha)):
+            return _decode_target_file(file_name, cached[1]), cached[2]
+        if sha:
+            raw = _fetch_blob_bytes(config, sha)
+            if raw is not None:
+                content = _decode_target_file(file_name, raw)
+                _cache_put(cache_key, ("", raw, sha))
+                return content, sha
+    except (requests.RequestException, UnicodeDecodeError, json.JSONDecodeError):
+        pass
+    
     path = f"targets/{target_slug}/{file_name}"
     url = f"{config['api_base']}/repos/{config['repo']}/contents/{path}"
     
+    headers = _get_headers(config["token"])
+    if cached and cached[0]:
+        headers["If-None-Match"] = cached[0]
+    
     try:
-        response = requests.get(url, headers=_get_headers(config["token"]), timeout=30)
+        response = _SESSION.get(url, headers=headers, timeout=30)
+        
+        if response.status_code == 304 and cached:
+            return _decode_target_file(file_name, cached[1]), cached[2]
         
         if response.status_code == 200:
             data = response.json()
-            content = json.loads(base64.b64decode(data.get("content", "")).decode())
+            if data.get("encoding") == "none" and data.get("sha"):
+                raw = _fetch_blob_bytes(config, data["sha"])
+                if raw is None:
+                    return default_content, None
+            else:
+                raw = base64.b64decode(data.get("content", ""))
+            content = _decode_target_file(file_name, raw)
+            etag = response.headers.get("ETag")
+            if isinstance(etag, str):
+                _cache_put(cache_key, (etag, raw, data.get("sha")))
             return content, data.get("sha")
         
+        with _etag_cache_lock:
+            _ETAG_CACHE.pop(cache_key, None)
         return default_content, None
         
-    except (requests.RequestException, json.JSONDecodeError):
+    except (requests.RequestException, UnicodeDecodeError, json.JSONDecodeError):
         return default_content, None
 
 
+# Concurrent target file reads; small enough to stay clear of GitHub's
+# secondary rate limits
+TARGET_FETCH_WORKERS = 5
+
+
+def _load_target_files(
+    config: dict[str, str],
+    target_slug: str,
+    files: dict[str, dict[str, Any] | list[Any]],
+) -> dict[str, tuple[dict[str, Any] | list[Any], str | None]]:
+    """
+    Load several target files concurrently over the shared session.
+    files maps file name -> default content; returns file name -> (content, sha).
+    """
+    with ThreadPoolExecutor(max_workers=min(TARGET_FETCH_WORKERS, len(files))) as executor:
+        loaded = executor.map(
+            lambda item: _get_or_create_target_file(config, target_slug, item[0], item[1]),
+            files.items(),
+        )
+        return dict(zip(files, loaded, strict=True))
+
+
+def _fetch_profiles(config: dict[str, str], target_slugs: list[str]) -> dict[str, Any]:
+    """
+    Load profile.json for many targets, returning slug -> profile ({} if absent).
+    
+    Profiles are read with aliased GraphQL blob lookups, one request per
+    GRAPHQL_BATCH_SIZE targets. A blob GraphQL returns no text for is read by
+    its sha, and every profile falls back to a REST read if GraphQL is
+    unavailable.
+    """
+    from strix.tools.strixdb.strixdb_repo_extract import GRAPHQL_BATCH_SIZE, _graphql_url
+    
+    owner, _, name = config["repo"].partition("/")
+    profiles: dict[str, Any] = {}
+    blob_shas: dict[str, str | None] = {}
+    
+    for start in range(0, len(target_slugs), GRAPHQL_BATCH_SIZE):
+        batch = target_slugs[start:start + GRAPHQL_BATCH_SIZE]
+        fields = " ".join(
+            f"f{i}: object(expression: "
+            f"{json.dumps(config['branch'] + ':targets/' + slug + '/profile.json')})"
+            " { oid ... on Blob { text } }"
+            for i, slug in enumerate(batch)
+        )
+        query = (
+            f"query {{ repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+            f"{{ {fields} }} }}"
+        )
+        
+        try:
+            response = _SESSION.post(
+                _graphql_url(config["api_base"]),
+                headers=_get_headers(config["token"]),
+                json={"query": query},
+                timeout=30,
+            )
+            body = response.json() if response.status_code == 200 else {}
+        except (requests.RequestException, ValueError):
+            body = {}
+        
+        repository = (body.get("data") or {}).get("repository")
+        if body.get("errors") or repository is None:
+            blob_shas.update(dict.fromkeys(batch))
+            continue
+        
+        for i, slug in enumerate(batch):
+            blob = repository.get(f"f{i}")
+            if not blob:
+                profiles[slug] = {}
+            elif blob.get("text") is None:
+                blob_shas[slug] = blob.get("oid")
+            else:
+                try:
+                    profiles[slug] = json.loads(blob["text"])
+                except json.JSONDecodeError:
+                    profiles[slug] = {}
+    
+    if blob_shas:
+        with ThreadPoolExecutor(max_workers=min(TARGET_FETCH_WORKERS, len(blob_shas))) as executor:
+            loaded = executor.map(
+                lambda item: _get_or_create_target_file(
+                    config, item[0], "profile.json", {}, sha=item[1]
+                )[0],
+                blob_shas.items(),
+            )
+            profiles.update(zip(blob_shas, loaded, strict=True))
+    
+    return profiles
+
+
+# A commit message, or a callable building it; writers may pass the callable so
+# the message is only formatted when a commit is actually made
+_CommitMessage = str | Callable[[], str]
+
+
+def _resolve_commit_message(commit_message: _CommitMessage) -> str:
+    return commit_message() if callable(commit_message) else commit_message
+
+
 def _save_target_file(
     config: dict[str, str],
     target_slug: str,
     file_name: str,
     content: dict[str, Any] | list[Any],
     sha: str | None = None,
-    commit_message: str = "",
+    commit_message: _CommitMessage = "",
 ) -> bool:
-    """Save a file to the target's directory in StrixDB."""
+    """Save a file to the target's directory in StrixDB (a no-op if it is unchanged)."""
     path = f"targets/{target_slug}/{file_name}"
     url = f"{config['api_base']}/repos/{config['repo']}/contents/{path}"
     
-    content_encoded = base64.b64encode(json.dumps(content, indent=2).encode()).decode()
+    raw = _encode_target_file(file_name, content)
+    if sha and _git_blob_sha(raw) == sha:
+        return True  # byte-identical to what is stored: nothing to commit
+    content_encoded = base64.b64encode(raw).decode()
     
     payload: dict[str, Any] = {
-        "message": commit_message or f"[StrixDB] Update {path}",
+        "message": _resolve_commit_message(commit_message) or f"[StrixDB] Update {path}",
         "content": content_encoded,
         "branch": config["branch"],
     }
@@ -288,31 +640,71 @@ def _save_target_file(
         payload["sha"] = sha
     
     try:
-        response = requests.put(
+        response = _SESSION.put(
             url,
-            headers=_get_headers(config["token"]),
-            json=payload,
+            headers=_json_headers(config["token"]),
+            data=_dump_json_bytes(payload),
             timeout=30,
         )
-        return response.status_code in (200, 201)
+        if response.status_code in (200, 201):
+            _cache_written(config, target_slug, file_name, raw)
+            return True
     except requests.RequestException:
-        return False
+        pass
+    
+    # Most likely a stale sha: make the next read go back to GitHub
+    with _etag_cache_lock:
+        _ETAG_CACHE.pop((config["repo"], target_slug, file_name), None)
+    return False
 
 
-def _ensure_target_directory(config: dict[str, str], target_slug: str) -> bool:
-    """Ensure the target directory exists in StrixDB."""
-    readme_path = f"targets/{target_slug}/README.md"
-    url = f"{config['api_base']}/repos/{config['repo']}/contents/{readme_path}"
+# Re-read/re-apply attempts when a read-modify-write loses a race with
+# another writer (the PUT is rejected because the file's sha moved on)
+SAVE_MERGE_RETRIES = 3
+
+
+def _save_with_merge(
+    config: dict[str, str],
+    target_slug: str,
+    file_name: str,
+    default_content: dict[str, Any] | list[Any],
+    mutate: Callable[[Any], Any],
+    commit_message: _CommitMessage = "",
+    max_retries: int = SAVE_MERGE_RETRIES,
+) -> dict[str, Any] | list[Any] | None:
+    """
+    Read-modify-write a target file with optimistic concurrency.
     
-    try:
-        response = requests.get(url, headers=_get_headers(config["token"]), timeout=30)
-        
-        if response.status_code == 200:
-            return True  # Already exists
-        
-        if response.status_code == 404:
-            # Create the directory with a README
-            readme_content = f"""# Target: {target_slug}
+    mutate receives the current content and returns the content to save, or
+    None to skip the write. When the PUT fails (normally a stale sha because
+    another session wrote the file in between), the file is re-read and
+    mutate re-applied, with jittered exponential backoff.
+    
+    Returns the saved content, or None if nothing was saved.
+    """
+    for attempt in range(max_retries + 1):
+        content, sha = _get_or_create_target_file(
+            config, target_slug, file_name, copy.deepcopy(default_content)
+        )
+        updated = mutate(content)
+        if updated is None:
+            return None
+        if _save_target_file(
+            config, target_slug, file_name, updated, sha=sha, commit_message=commit_message,
+        ):
+            return updated
+        if attempt < max_retries:
+            time.sleep(0.3 * 2 ** attempt + random.random() * 0.1)
+    
+    logger.warning(
+        "[StrixDB] Gave up saving %s/%s after %d tries", target_slug, file_name, max_retries + 1
+    )
+    return None
+
+
+def _target_readme(target_slug: str) -> str:
+    """README.md describing a target's directory."""
+    return f"""# Target: {target_slug}
 
 This directory contains comprehensive scan data for target: `{target_slug}`
 
@@ -320,16 +712,498 @@ This directory contains comprehensive scan data for target: `{target_slug}`
 
 - `profile.json` - Main target profile and metadata
 - `sessions/` - Individual session data
-- `findings/` - Vulnerability findings
+- `findings/` - One JSON file per finding, summarized in `findings/_index.jsonl`
 - `endpoints.json` - Discovered endpoints and paths
 - `technologies.json` - Technology stack information
-- `notes.json` - Session notes and observations
+- `notes/` - Session notes and observations, in numbered chunks tracked by `notes/index.json`
 
 ## Auto-generated by StrixDB Target Tracking System
 """
-            content_encoded = base64.b64encode(readme_content.encode()).decode()
+
+
+def _resolve_branch_state(
+    config: dict[str, str],
+    target_slug: str,
+    expected_shas: dict[str, str | None],
+) -> tuple[str, str] | None:
+    """
+    Resolve the branch head as (commit sha, tree sha) with one GraphQL query.
+    
+    The same query looks up the current blob sha of every file in
+    expected_shas. None is returned if any of them changed since it was read
+    (an expected None means the file must not exist yet), or if GraphQL is
+    unavailable.
+    """
+    from strix.tools.strixdb.strixdb_repo_extract import _graphql_url
+    
+    owner, _, name = config["repo"].partition("/")
+    branch = config["branch"]
+    names = list(expected_shas)
+    fields = " ".join(
+        f"f{i}: object(expression: "
+        f"{json.dumps(f'{branch}:targets/{target_slug}/{file_name}')}) {{ oid }}"
+        for i, file_name in enumerate(names)
+    )
+    query = (
+        f"query {{ repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ "
+        f"ref(qualifiedName: {json.dumps('refs/heads/' + branch)}) "
+        f"{{ target {{ oid ... on Commit {{ tree {{ oid }} }} }} }} {fields} }} }}"
+    )
+    
+    try:
+        response = _SESSION.post(
+            _graphql_url(config["api_base"]),
+            headers=_get_headers(config["token"]),
+            json={"query": query},
+            timeout=30,
+        )
+        if response.status_code != 200:
+            return None
+        body = response.json()
+        repository = (body.get("data") or {}).get("repository")
+        if body.get("errors") or not repository or not repository.get("ref"):
+            return None
+        head = repository["ref"]["target"]
+        
+        for i, file_name in enumerate(names):
+            current = (repository.get(f"f{i}") or {}).get("oid")
+            if current != expected_shas[file_name]:
+                logger.info("[StrixDB] %s/%s changed since it was read", target_slug, file_name)
+                return None
+        return head["oid"], head["tree"]["oid"]
+        
+    except (requests.RequestException, ValueError, KeyError, TypeError):
+        return None
+
+
+def _batch_create_target_files(
+    config: dict[str, str],
+    target_slug: str,
+    files: dict[str, dict[str, Any] | list[Any] | str | None],
+    commit_message: _CommitMessage = "",
+    expected_shas: dict[str, str | None] | None = None,
+) -> bool:
+    """
+    Write many files under the target's directory in a single commit.
+    A None content deletes that file.
+    
+    Uses the Git Data API (tree with inline content + commit + ref update),
+    four requests in total, instead of one Contents API PUT and commit per file.
+    
+    With expected_shas (file name -> sha it was read at, None for new files),
+    the commit is only made if none of those files changed in between, the
+    same guarantee a Contents API PUT with sha gives. The ref update is not
+    forced, so a commit landing after the check also fails the batch. Files
+    whose content is unchanged from their expected sha are left out, and if
+    nothing changed no request is made at all.
+    """
+    if not files:
+        return True
+    
+    headers = _get_headers(config["token"])
+    repo_api = f"{config['api_base']}/repos/{config['repo']}"
+    branch = config["branch"]
+    
+    encoded = {
+        file_name: (
+            content.encode() if isinstance(content, str)
+            else _encode_target_file(file_name, content)
+        )
+        for file_name, content in files.items()
+        if content is not None
+    }
+    if expected_shas:
+        # Files byte-identical to the version they were read at need no blob;
+        # their sha is still checked below
+        encoded = {
+            file_name: raw
+            for file_name, raw in encoded.items()
+            if not expected_shas.get(file_name)
+            or _git_blob_sha(raw) != expected_shas[file_name]
+        }
+        if not encoded and all(content is not None for content in files.values()):
+            return True  # nothing changed
+    tree: list[dict[str, Any]] = [
+        {
+            "path": f"targets/{target_slug}/{file_name}",
+            "mode": "100644",
+            "type": "blob",
+            "content": raw.decode(),
+        }
+        for file_name, raw in encoded.items()
+    ]
+    tree.extend(
+        {
+            "path": f"targets/{target_slug}/{file_name}",
+            "mode": "100644",
+            "type": "blob",
+            "sha": None,
+        }
+        for file_name, content in files.items()
+        if content is None
+    )
+    
+    try:
+        if expected_shas is not None:
+            state = _resolve_branch_state(config, target_slug, expected_shas)
+            if state is None:
+                return False
+            base_commit_sha, base_tree_sha = state
+        else:
+            branch_response = _SESSION.get(
+                f"{repo_api}/branches/{branch}", headers=headers, timeout=30
+            )
+            if branch_response.status_code != 200:
+                return False
+            branch_data = branch_response.json()
+            base_commit_sha = branch_data["commit"]["sha"]
+            base_tree_sha = branch_data["commit"]["commit"]["tree"]["sha"]
+        
+        tree_response = _SESSION.post(
+            f"{repo_api}/git/trees",
+            headers=_json_headers(config["token"]),
+            data=_dump_json_bytes({"base_tree": base_tree_sha, "tree": tree}),
+            timeout=60,
+        )
+        if tree_response.status_code != 201:
+            return False
+        
+        commit_response = _SESSION.post(
+            f"{repo_api}/git/commits",
+            headers=headers,
+            json={
+                "message": (
+                    _resolve_commit_message(commit_message)
+                    or f"[StrixDB] Update targets/{target_slug}"
+                ),
+                "tree": tree_response.json()["sha"],
+                "parents": [base_commit_sha],
+            },
+            timeout=30,
+        )
+        if commit_response.status_code != 201:
+            return False
+        
+        ref_response = _SESSION.patch(
+            f"{repo_api}/git/refs/heads/{branch}",
+            headers=headers,
+            json={"sha": commit_response.json()["sha"]},
+            timeout=30,
+        )
+        if ref_response.status_code != 200:
+            return False
+        
+        for file_name, raw in encoded.items():
+            _cache_written(config, target_slug, file_name, raw)
+        with _etag_cache_lock:
+            for file_name in files.keys() - encoded.keys():
+                _ETAG_CACHE.pop((config["repo"], target_slug, file_name), None)
+        return True
+        
+    except (requests.RequestException, KeyError, TypeError):
+        return False
+
+
+FINDINGS_INDEX = "findings/_index.jsonl"
+
+# Legacy single-file findings store, still read for targets created before
+# findings/ existed
+LEGACY_FINDINGS_FILE = "findings.json"
+
+
+class _TargetBatch:
+    """
+    Collect the target file writes of one tool call and commit them together.
+    
+        with _TargetBatch(config, target_slug, "[StrixDB] ...", "profile.json") as batch:
+            batch.stage("profile.json", profile, profile_sha)
+        if "profile.json" in batch.failed:
+            ...
+    
+    On exit the staged files go out as a single sha-checked Git Data API
+    commit. If that is not possible (GraphQL unavailable, or a file changed
+    since it was read) each file falls back to its own Contents API PUT with
+    its sha, so a conflicting file fails on its own as before. The main file
+    is saved first in that fallback; if it fails the other files are not
+    written, so derived counters and session entries are not recorded for a
+    change that was never saved. Files that could not be saved are listed in
+    failed.
+    """
+    
+    def __init__(
+        self,
+        config: dict[str, str],
+        target_slug: str,
+        commit_message: _CommitMessage,
+        main_file: str | None = None,
+    ) -> None:
+        self.config = config
+        self.target_slug = target_slug
+        self.commit_message = commit_message
+        self.main_file = main_file
+        self.failed: set[str] = set()
+        self._files: dict[str, dict[str, Any] | list[Any]] = {}
+        self._shas: dict[str, str | None] = {}
+    
+    def stage(
+        self, file_name: str, content: dict[str, Any] | list[Any], sha: str | None
+    ) -> None:
+        """Stage content for file_name, read at sha (None for a new file)."""
+        self._files[file_name] = content
+        self._shas[file_name] = sha
+    
+    def commit(self) -> set[str]:
+        """Write the staged files; returns the names that could not be saved."""
+        if not self._files or _batch_create_target_files(
+            self.config,
+            self.target_slug,
+            dict(self._files),
+            commit_message=self.commit_message,
+            expected_shas=dict(self._shas),
+        ):
+            self.failed = set()
+        else:
+            # The main file goes first; the rest only follow once it is saved
+            order = sorted(self._files, key=lambda file_name: file_name != self.main_file)
+            self.failed = set()
+            for file_name in order:
+                if not _save_target_file(
+                    self.config,
+                    self.target_slug,
+                    file_name,
+                    self._files[file_name],
+                    sha=self._shas[file_name],
+                    commit_message=self.commit_message,
+                ):
+                    if file_name == self.main_file:
+                        self.failed = set(self._files)
+                        break
+                    self.failed.add(file_name)
+        self._files.clear()
+        self._shas.clear()
+        return self.failed
+    
+    def __enter__(self) -> _TargetBatch:
+        return self
+    
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.commit()
+
+
+def _finding_summary(finding: dict[str, Any], body_file: str) -> dict[str, Any]:
+    """
+    The one-line findings/_index.jsonl entry for a finding.
+    
+    sha is the git blob sha of the stored body, so readers can fetch it raw
+    from the Git Data API without a Contents API lookup.
+    """
+    return {
+        "id": finding["id"],
+        "severity": finding.get("severity", ""),
+        "title": finding.get("title", ""),
+        "ts": finding.get("created_at", ""),
+        "sha": _git_blob_sha(_encode_target_file(body_file, finding)),
+    }
+
+
+def _append_finding(
+    config: dict[str, str],
+    target_slug: str,
+    finding: dict[str, Any],
+    commit_message: _CommitMessage = "",
+) -> bool:
+    """
+    Store a finding as findings/{id}.json and append it to the findings index.
+    
+    Only the small index is read back, so the cost of adding a finding does
+    not grow with the size of the existing findings. Both files go in one
+    commit; if that fails (e.g. the branch moved on), the body is written on
+    its own and the index append is merged onto the latest version.
+    """
+    body_file = f"findings/{finding['id']}.json"
+    summary = _finding_summary(finding, body_file)
+    
+    index, index_sha = _get_or_create_target_file(config, target_slug, FINDINGS_INDEX, [])
+    if _batch_create_target_files(
+        config,
+        target_slug,
+        {body_file: finding, FINDINGS_INDEX: [*index, summary]},
+        commit_message=commit_message,
+        expected_shas={body_file: None, FINDINGS_INDEX: index_sha},
+    ):
+        return True
+    
+    if not _save_target_file(
+        config, target_slug, body_file, finding, commit_message=commit_message
+    ):
+        return False
+    
+    return _save_with_merge(
+        config,
+        target_slug,
+        FINDINGS_INDEX,
+        [],
+        lambda entries: [*entries, summary],
+        commit_message=commit_message,
+    ) is not None
+
+
+def _migrate_legacy_findings(
+    config: dict[str, str],
+    target_slug: str,
+    legacy_findings: list[dict[str, Any]],
+    legacy_sha: str,
+    index: list[dict[str, Any]],
+    index_sha: str | None,
+) -> bool:
+    """
+    Move the findings of a legacy findings.json into findings/{id}.json files.
+    
+    The bodies, the index (legacy entries first) and the removal of
+    findings.json go in one commit, so a failed migration leaves the target
+    as it was. Findings without an id are left in place.
+    """
+    if not all("id" in finding for finding in legacy_findings):
+        return False
+    
+    indexed = {entry.get("id") for entry in index}
+    files: dict[str, dict[str, Any] | list[Any] | str | None] = {}
+    summaries = []
+    for finding in legacy_findings:
+        body_file = f"findings/{finding['id']}.json"
+        files[body_file] = finding
+        if finding["id"] not in indexed:
+            summaries.append(_finding_summary(finding, body_file))
+    files[FINDINGS_INDEX] = [*summaries, *index]
+    files[LEGACY_FINDINGS_FILE] = None
+    
+    migrated = _batch_create_target_files(
+        config,
+        target_slug,
+        files,
+        commit_message=f"[StrixDB] Split findings.json into findings/ for {target_slug}",
+        expected_shas={LEGACY_FINDINGS_FILE: legacy_sha, FINDINGS_INDEX: index_sha},
+    )
+    if migrated:
+        logger.info(
+            "[StrixDB] Migrated %d legacy findings for %s", len(legacy_findings), target_slug
+        )
+    return migrated
+
+
+def _load_findings(config: dict[str, str], target_slug: str) -> dict[str, list[Any]]:
+    """
+    Load every finding of a target, split into vulnerabilities and informational.
+    
+    Bodies listed in the findings index are fetched concurrently, as raw blobs
+    when the index records their sha; findings from a legacy findings.json
+    come first, and are migrated into findings/ on the way.
+    """
+    legacy, legacy_sha = _get_or_create_target_file(
+        config, target_slug, LEGACY_FINDINGS_FILE,
+        {"vulnerabilities": [], "informational": []}
+    )
+    findings = {
+        "vulnerabilities": list(legacy.get("vulnerabilities", [])),
+        "informational": list(legacy.get("informational", [])),
+    }
+    
+    index, index_sha = _get_or_create_target_file(config, target_slug, FINDINGS_INDEX, [])
+    if legacy_sha:
+        legacy_findings = findings["vulnerabilities"] + findings["informational"]
+        if legacy_findings and _migrate_legacy_findings(
+            config, target_slug, legacy_findings, legacy_sha, index, index_sha
+        ):
+            # Migrated bodies are already in hand; only fetch the rest
+            migrated_ids = {finding["id"] for finding in legacy_findings}
+            index = [entry for entry in index if entry.get("id") not in migrated_ids]
+    bodies = [
+        (f"findings/{entry['id']}.json", entry.get("sha")) for entry in index if "id" in entry
+    ]
+    if not bodies:
+        return findings
+    
+    with ThreadPoolExecutor(max_workers=min(TARGET_FETCH_WORKERS, len(bodies))) as executor:
+        loaded = list(executor.map(
+            lambda body: _get_or_create_target_file(
+                config, target_slug, body[0], {}, sha=body[1]
+            ),
+            bodies,
+        ))
+    
+    for body, _ in loaded:
+        if not body:
+            continue
+        bucket = "informational" if body.get("severity") == "info" else "vulnerabilities"
+        findings[bucket].append(body)
+    return findings
+
+
+NOTES_INDEX = "notes/index.json"
+
+# Notes per chunk file; adding a note only reads and rewrites the chunk being filled
+NOTES_CHUNK_SIZE = 50
+
+# Chunks read back by strixdb_target_get (the most recent NOTES_CHUNK_SIZE *
+# NOTES_READ_CHUNKS notes); older chunks stay in the repository
+NOTES_READ_CHUNKS = 10
+
+# Legacy single-file notes store, still read for targets created before notes/ existed
+LEGACY_NOTES_FILE = "notes.json"
+
+
+def _empty_notes_index() -> dict[str, int]:
+    return {"current_chunk": 0, "chunk_entries": 0}
+
+
+def _notes_chunk_file(chunk: int) -> str:
+    return f"notes/{chunk:04d}.json"
+
+
+def _load_notes(config: dict[str, str], target_slug: str) -> dict[str, list[Any]]:
+    """
+    Load the most recent notes of a target, oldest first.
+    
+    Entries of a legacy notes.json come first, followed by the last
+    NOTES_READ_CHUNKS chunk files, which are fetched concurrently.
+    """
+    loaded = _load_target_files(config, target_slug, {
+        LEGACY_NOTES_FILE: {"entries": []},
+        NOTES_INDEX: _empty_notes_index(),
+    })
+    legacy, _ = loaded[LEGACY_NOTES_FILE]
+    index, index_sha = loaded[NOTES_INDEX]
+    entries = list(legacy.get("entries", []))
+    if not index_sha:
+        return {"entries": entries}
+    
+    current = index.get("current_chunk", 0)
+    chunks = {
+        _notes_chunk_file(chunk): {"entries": []}
+        for chunk in range(max(0, current - NOTES_READ_CHUNKS + 1), current + 1)
+    }
+    for chunk_data, _ in _load_target_files(config, target_slug, chunks).values():
+        entries.extend(chunk_data.get("entries", []))
+    return {"entries": entries[-NOTES_CHUNK_SIZE * NOTES_READ_CHUNKS:]}
+
+
+def _ensure_target_directory(config: dict[str, str], target_slug: str) -> bool:
+    """Ensure the target directory exists in StrixDB."""
+    readme_path = f"targets/{target_slug}/README.md"
+    url = f"{config['api_base']}/repos/{config['repo']}/contents/{readme_path}"
+    
+    try:
+        response = _SESSION.get(url, headers=_get_headers(config["token"]), timeout=30)
+        
+        if response.status_code == 200:
+            return True  # Already exists
+        
+        if response.status_code == 404:
+            # Create the directory with a README
+            content_encoded = base64.b64encode(_target_readme(target_slug).encode()).decode()
             
-            create_response = requests.put(
+            create_response = _SESSION.put(
                 url,
                 headers=_get_headers(config["token"]),
                 json={
@@ -384,7 +1258,7 @@ def strixdb_target_init(
     
     if not config["repo"] or not config["token"]:
         return {
-            "success": False,
+            **_ERR_NOT_CONFIGURED,
             "error": "StrixDB not configured. Ensure STRIXDB_TOKEN is set.",
             "target": None,
         }
@@ -419,14 +1293,6 @@ def strixdb_target_init(
             ),
         }
     
-    # Create new target
-    if not _ensure_target_directory(config, target_slug):
-        return {
-            "success": False,
-            "error": f"Failed to create target directory for '{target_slug}'",
-            "target": None,
-        }
-    
     # Create initial profile
     profile = _create_initial_target_profile(
         target=target,
@@ -435,39 +1301,56 @@ def strixdb_target_init(
         scope=scope,
         out_of_scope=out_of_scope,
         tags=tags,
+        slug=target_slug,
     )
     
-    if not _save_target_file(
-        config,
-        target_slug,
-        "profile.json",
-        profile,
-        commit_message=f"[StrixDB] Initialize target profile: {target_slug}",
-    ):
-        return {
-            "success": False,
-            "error": f"Failed to save target profile for '{target_slug}'",
-            "target": None,
-        }
-    
     # Create empty data files
     empty_structures = {
         "endpoints.json": {"discovered": [], "tested": [], "vulnerable": []},
         "technologies.json": {"identified": [], "versions": {}},
-        "notes.json": {"entries": []},
-        "findings.json": {"vulnerabilities": [], "informational": []},
+        NOTES_INDEX: _empty_notes_index(),
+        FINDINGS_INDEX: [],
     }
     
-    for file_name, content in empty_structures.items():
-        _save_target_file(
+    # README, profile and data files go in one commit; if the Git Data API is
+    # unavailable (e.g. the StrixDB repository has no commits yet), fall back
+    # to one Contents API write per file
+    if not _batch_create_target_files(
+        config,
+        target_slug,
+        {"README.md": _target_readme(target_slug), "profile.json": profile, **empty_structures},
+        commit_message=f"[StrixDB] Initialize target: {target_slug}",
+    ):
+        if not _ensure_target_directory(config, target_slug):
+            return {
+                "success": False,
+                "error": f"Failed to create target directory for '{target_slug}'",
+                "target": None,
+            }
+        
+        if not _save_target_file(
             config,
             target_slug,
-            file_name,
-            content,
-            commit_message=f"[StrixDB] Initialize {file_name} for {target_slug}",
-        )
+            "profile.json",
+            profile,
+            commit_message=f"[StrixDB] Initialize target profile: {target_slug}",
+        ):
+            return {
+                "success": False,
+                "error": f"Failed to save target profile for '{target_slug}'",
+                "target": None,
+            }
+        
+        for file_name, content in empty_structures.items():
+            _save_target_file(
+                config,
+                target_slug,
+                file_name,
+                content,
+                commit_message=f"[StrixDB] Initialize {file_name} for {target_slug}",
+            )
     
-    logger.info(f"[StrixDB] Initialized new target: {target_slug}")
+    logger.info("[StrixDB] Initialized new target: %s", target_slug)
     
     return {
         "success": True,
@@ -515,18 +1398,18 @@ def strixdb_target_session_start(
     config = _get_strixdb_config()
     
     if not config["repo"] or not config["token"]:
-        return {
-            "success": False,
-            "error": "StrixDB not configured",
-            "session": None,
-        }
+        return {**_ERR_NOT_CONFIGURED, "session": None}
     
     target_slug = _sanitize_target_slug(target)
     
-    # Load existing profile
-    profile, profile_sha = _get_or_create_target_file(
-        config, target_slug, "profile.json", {}
-    )
+    # Load the profile and the technology list in parallel. The summary needs
+    # nothing else: findings are counted in the profile stats, and
+    # add_endpoint keeps stats.endpoints_discovered in step with endpoints.json.
+    loaded = _load_target_files(config, target_slug, {
+        "profile.json": {},
+        "technologies.json": {"identified": [], "versions": {}},
+    })
+    profile, profile_sha = loaded["profile.json"]
     
     if not profile or not profile_sha:
         return {
@@ -535,31 +1418,17 @@ def strixdb_target_session_start(
             "session": None,
         }
     
-    # Load supplementary data
-    endpoints, _ = _get_or_create_target_file(
-        config, target_slug, "endpoints.json",
-        {"discovered": [], "tested": [], "vulnerable": []}
-    )
-    technologies, _ = _get_or_create_target_file(
-        config, target_slug, "technologies.json",
-        {"identified": [], "versions": {}}
-    )
-    findings, _ = _get_or_create_target_file(
-        config, target_slug, "findings.json",
-        {"vulnerabilities": [], "informational": []}
-    )
-    notes, _ = _get_or_create_target_file(
-        config, target_slug, "notes.json",
-        {"entries": []}
-    )
+    technologies, _ = loaded["technologies.json"]
     
-    # Create new session
-    session_id = _generate_session_id()
+    # Create new session; its id, start time and the profile's last scan share one clock read
+    now = datetime.now(timezone.utc)
+    session_id = _generate_session_id(now)
     session_data = _create_session_data(
         session_id=session_id,
         target_slug=target_slug,
         objective=objective,
         focus_areas=focus_areas,
+        now=now,
     )
     
     # Save session
@@ -576,20 +1445,25 @@ def strixdb_target_session_start(
             "session": None,
         }
     
-    # Update profile with session start
-    profile["status"] = "active"
-    profile["last_scan_at"] = datetime.now(timezone.utc).isoformat()
-    profile["total_sessions"] = profile.get("total_sessions", 0) + 1
-    profile["stats"]["sessions_count"] = profile["total_sessions"]
-    
-    _save_target_file(
+    # Update profile with session start, merged onto the latest version so a
+    # concurrent writer does not cost the session count
+    def _start_session(current: dict[str, Any]) -> dict[str, Any] | None:
+        if not current:
+            return None
+        current["status"] = "active"
+        current["last_scan_at"] = session_data["started_at"]
+        current["total_sessions"] = current.get("total_sessions", 0) + 1
+        current.setdefault("stats", {})["sessions_count"] = current["total_sessions"]
+        return current
+    
+    profile = _save_with_merge(
         config,
         target_slug,
         "profile.json",
-        profile,
-        sha=profile_sha,
+        {},
+        _start_session,
         commit_message=f"[StrixDB] Update profile - session {session_id} started",
-    )
+    ) or _start_session(profile)
     
     # Build comprehensive summary for the AI
     tested_areas = profile.get("tested_areas", {})
@@ -605,7 +1479,7 @@ def strixdb_target_session_start(
     if not tested_areas.get("vulnerability_types"):
         recommendations.append("No vulnerability testing recorded yet - start with recon and common vulns")
     
-    logger.info(f"[StrixDB] Started session {session_id} for target {target_slug}")
+    logger.info("[StrixDB] Started session %s for target %s", session_id, target_slug)
     
     return {
         "success": True,
@@ -626,7 +1500,7 @@ def strixdb_target_session_start(
                 "medium": profile.get("stats", {}).get("medium", 0),
                 "low": profile.get("stats", {}).get("low", 0),
             },
-            "endpoints_discovered": len(endpoints.get("discovered", [])),
+            "endpoints_discovered": profile.get("stats", {}).get("endpoints_discovered", 0),
             "technologies": technologies.get("identified", [])[:10],
             "confirmed_vulns": quick_info.get("confirmed_vulnerabilities", []),
             "key_endpoints": quick_info.get("key_endpoints", [])[:10],
@@ -685,7 +1559,7 @@ def strixdb_target_session_end(
     config = _get_strixdb_config()
     
     if not config["repo"] or not config["token"]:
-        return {"success": False, "error": "StrixDB not configured"}
+        return {**_ERR_NOT_CONFIGURED}
     
     target_slug = _sanitize_target_slug(target)
     
@@ -700,17 +1574,18 @@ def strixdb_target_session_end(
             "error": f"Session '{session_id}' not found for target '{target_slug}'",
         }
     
-    # Load profile
-    profile, profile_sha = _get_or_create_target_file(
-        config, target_slug, "profile.json", {}
-    )
-    
     # Update session data
     now = datetime.now(timezone.utc)
-    started_at = datetime.fromisoformat(session_data.get("started_at", now.isoformat()).replace('Z', '+00:00'))
-    duration = int((now - started_at).total_seconds() / 60)
-    
-    session_data["ended_at"] = now.isoformat()
+    ended_at = now.isoformat()
+    started_epoch = session_data.get("started_at_epoch")
+    if started_epoch is None:
+        # Sessions stored before started_at_epoch existed
+        started_epoch = datetime.fromisoformat(
+            session_data.get("started_at", ended_at)
+        ).timestamp()
+    duration = int((now.timestamp() - started_epoch) / 60)
+    
+    session_data["ended_at"] = ended_at
     session_data["duration_minutes"] = duration
     session_data["status"] = "completed"
     session_data["accomplishments"] = accomplishments or []
@@ -731,44 +1606,52 @@ def strixdb_target_session_end(
         commit_message=f"[StrixDB] End session {session_id}",
     )
     
-    # Update profile
-    if profile and profile_sha:
+    # Update profile, re-applied on top of concurrent writes
+    session_summary = {
+        "session_id": session_id,
+        "date": ended_at,
+        "duration_minutes": duration,
+        "summary": summary[:500],
+        "findings_count": session_data.get("metrics", {}).get("findings_count", 0),
+    }
+    
+    def _end_session(profile: dict[str, Any]) -> dict[str, Any] | None:
+        if not profile:
+            return None
         profile["status"] = "paused"
-        profile["updated_at"] = now.isoformat()
+        profile["updated_at"] = ended_at
         profile["quick_info"]["last_session_summary"] = summary
         
         # Update pending work
         if immediate_follow_ups:
             existing_high = profile.get("pending_work", {}).get("high_priority", [])
-            profile["pending_work"]["high_priority"] = list(set(existing_high + immediate_follow_ups))[:20]
+            profile["pending_work"]["high_priority"] = _merge_unique(
+                existing_high, immediate_follow_ups
+            )[:20]
         if promising_leads:
             existing_medium = profile.get("pending_work", {}).get("medium_priority", [])
-            profile["pending_work"]["medium_priority"] = list(set(existing_medium + promising_leads))[:20]
+            profile["pending_work"]["medium_priority"] = _merge_unique(
+                existing_medium, promising_leads
+            )[:20]
         if recommendations:
             profile["pending_work"]["follow_ups"] = recommendations[:10]
         
         # Add to session history
-        session_summary = {
-            "session_id": session_id,
-            "date": now.isoformat(),
-            "duration_minutes": duration,
-            "summary": summary[:500],
-            "findings_count": session_data.get("metrics", {}).get("findings_count", 0),
-        }
         history = profile.get("session_history", [])
         history.append(session_summary)
         profile["session_history"] = history[-20:]  # Keep last 20 sessions
-        
-        _save_target_file(
-            config,
-            target_slug,
-            "profile.json",
-            profile,
-            sha=profile_sha,
-            commit_message=f"[StrixDB] Update profile after session {session_id}",
-        )
+        return profile
+    
+    _save_with_merge(
+        config,
+        target_slug,
+        "profile.json",
+        {},
+        _end_session,
+        commit_message=f"[StrixDB] Update profile after session {session_id}",
+    )
     
-    logger.info(f"[StrixDB] Ended session {session_id} for target {target_slug}")
+    logger.info("[StrixDB] Ended session %s for target %s", session_id, target_slug)
     
     return {
         "success": True,
@@ -840,18 +1723,19 @@ def strixdb_target_add_finding(
     config = _get_strixdb_config()
     
     if not config["repo"] or not config["token"]:
-        return {"success": False, "error": "StrixDB not configured"}
+        return {**_ERR_NOT_CONFIGURED}
     
     target_slug = _sanitize_target_slug(target)
     now = datetime.now(timezone.utc).isoformat()
     
     finding_id = f"finding_{str(uuid.uuid4())[:8]}"
+    severity_key = severity.lower()
     
     finding = {
         "id": finding_id,
         "session_id": session_id,
         "title": title,
-        "severity": severity.lower(),
+        "severity": severity_key,
         "vulnerability_type": vulnerability_type,
         "description": description,
         "affected_endpoint": affected_endpoint,
@@ -867,41 +1751,19 @@ def strixdb_target_add_finding(
         "verified": True,
     }
     
-    # Load existing findings
-    findings, findings_sha = _get_or_create_target_file(
-        config, target_slug, "findings.json",
-        {"vulnerabilities": [], "informational": []}
-    )
-    
-    if severity.lower() == "info":
-        findings["informational"].append(finding)
-    else:
-        findings["vulnerabilities"].append(finding)
-    
-    # Save findings
-    if not _save_target_file(
-        config,
-        target_slug,
-        "findings.json",
-        findings,
-        sha=findings_sha,
-        commit_message=f"[StrixDB] Add finding: {title[:50]}",
-    ):
-        return {"success": False, "error": "Failed to save finding"}
+    commit_message = f"[StrixDB] Add finding: {title[:50]}"
     
     # Update profile stats
-    profile, profile_sha = _get_or_create_target_file(
-        config, target_slug, "profile.json", {}
-    )
-    
-    if profile and profile_sha:
+    def _count_finding(profile: dict[str, Any]) -> dict[str, Any] | None:
+        if not profile:
+            return None
         stats = profile.get("stats", {})
         stats["total_findings"] = stats.get("total_findings", 0) + 1
-        stats[severity.lower()] = stats.get(severity.lower(), 0) + 1
+        stats[severity_key] = stats.get(severity_key, 0) + 1
         profile["stats"] = stats
         
         # Update quick info
-        if severity.lower() in ["critical", "high"]:
+        if severity_key in ("critical", "high"):
             confirmed = profile.get("quick_info", {}).get("confirmed_vulnerabilities", [])
             confirmed.append(f"{severity.upper()}: {title}")
             profile["quick_info"]["confirmed_vulnerabilities"] = confirmed[-10:]
@@ -911,39 +1773,57 @@ def strixdb_target_add_finding(
         if vulnerability_type not in tested:
             tested.append(vulnerability_type)
             profile["tested_areas"]["vulnerability_types"] = tested
-        
-        _save_target_file(
-            config,
-            target_slug,
-            "profile.json",
-            profile,
-            sha=profile_sha,
-            commit_message=f"[StrixDB] Update stats for finding: {finding_id}",
-        )
+        return profile
     
     # Update session metrics
-    session_data, session_sha = _get_or_create_target_file(
-        config, target_slug, f"sessions/{session_id}.json", {}
-    )
-    
-    if session_data and session_sha:
+    def _add_to_session(session_data: dict[str, Any]) -> dict[str, Any] | None:
+        if not session_data:
+            return None
         session_data["findings"].append({
             "id": finding_id,
             "title": title,
             "severity": severity,
         })
         session_data["metrics"]["findings_count"] = len(session_data["findings"])
-        
-        _save_target_file(
-            config,
-            target_slug,
-            f"sessions/{session_id}.json",
-            session_data,
-            sha=session_sha,
-            commit_message=f"[StrixDB] Update session with finding: {finding_id}",
-        )
-    
-    logger.info(f"[StrixDB] Added finding '{title}' ({severity}) for {target_slug}")
+        return session_data
+    
+    # Body, index entry, profile stats and session metrics are read once and
+    # normally go out as one sha-checked commit
+    body_file = f"findings/{finding_id}.json"
+    session_file = f"sessions/{session_id}.json"
+    loaded = _load_target_files(config, target_slug, {
+        FINDINGS_INDEX: [],
+        "profile.json": {},
+        session_file: {},
+    })
+    index, index_sha = loaded[FINDINGS_INDEX]
+    files: dict[str, dict[str, Any] | list[Any] | str | None] = {
+        body_file: finding,
+        FINDINGS_INDEX: [*index, _finding_summary(finding, body_file)],
+    }
+    expected_shas: dict[str, str | None] = {body_file: None, FINDINGS_INDEX: index_sha}
+    updates = (("profile.json", _count_finding), (session_file, _add_to_session))
+    for file_name, update in updates:
+        content, sha = loaded[file_name]
+        updated = update(content) if sha else None
+        if updated is not None:
+            files[file_name] = updated
+            expected_shas[file_name] = sha
+    
+    if not _batch_create_target_files(
+        config, target_slug, files, commit_message=commit_message, expected_shas=expected_shas,
+    ):
+        # Something moved on since it was read: store the finding on its own and
+        # merge the profile and session updates onto their latest versions
+        if not _append_finding(config, target_slug, finding, commit_message=commit_message):
+            return {"success": False, "error": "Failed to save finding"}
+        for file_name, update in updates:
+            if file_name in files:
+                _save_with_merge(
+                    config, target_slug, file_name, {}, update, commit_message=commit_message,
+                )
+    
+    logger.info("[StrixDB] Added finding '%s' (%s) for %s", title, severity, target_slug)
     
     return {
         "success": True,
@@ -996,14 +1876,16 @@ def strixdb_target_add_endpoint(
     config = _get_strixdb_config()
     
     if not config["repo"] or not config["token"]:
-        return {"success": False, "error": "StrixDB not configured"}
+        return {**_ERR_NOT_CONFIGURED}
     
     target_slug = _sanitize_target_slug(target)
     now = datetime.now(timezone.utc).isoformat()
+    method_upper = method.upper()
+    endpoint_key = f"{method_upper} {endpoint}"
     
     endpoint_data = {
         "endpoint": endpoint,
-        "method": method.upper(),
+        "method": method_upper,
         "parameters": parameters or [],
         "auth_required": auth_required,
         "tested": tested,
@@ -1014,99 +1896,92 @@ def strixdb_target_add_endpoint(
         "discovered_in_session": session_id,
     }
     
-    # Load existing endpoints
-    endpoints, endpoints_sha = _get_or_create_target_file(
-        config, target_slug, "endpoints.json",
-        {"discovered": [], "tested": [], "vulnerable": []}
-    )
-    
-    # Check if endpoint already exists
-    existing = [e for e in endpoints.get("discovered", []) 
-                if e.get("endpoint") == endpoint and e.get("method") == method.upper()]
-    
-    if existing:
-        # Update existing endpoint
-        for i, e in enumerate(endpoints["discovered"]):
-            if e.get("endpoint") == endpoint and e.get("method") == method.upper():
-                # Merge data
-                e.update({k: v for k, v in endpoint_data.items() if v})
-                endpoints["discovered"][i] = e
-                break
+    # Load endpoints, profile and session together
+    session_file = f"sessions/{session_id}.json"
+    loaded = _load_target_files(config, target_slug, {
+        "endpoints.json": {"discovered": [], "tested": [], "vulnerable": []},
+        "profile.json": {},
+        session_file: {},
+    })
+    endpoints, endpoints_sha = loaded["endpoints.json"]
+    discovered = endpoints.setdefault("discovered", [])
+    
+    # Check if endpoint already exists: one pass builds a (method, endpoint) -> position
+    # index (first occurrence wins), instead of a filter scan followed by a search scan
+    index: dict[tuple[Any, Any], int] = {}
+    for i, e in enumerate(discovered):
+        index.setdefault((e.get("method"), e.get("endpoint")), i)
+    position = index.get((method_upper, endpoint))
+    existing = position is not None
+    
+    if position is not None:
+        # Merge data into the existing endpoint
+        discovered[position].update({k: v for k, v in endpoint_data.items() if v})
     else:
-        endpoints["discovered"].append(endpoint_data)
+        discovered.append(endpoint_data)
     
     # Update tested/vulnerable lists
-    endpoint_key = f"{method.upper()} {endpoint}"
-    if tested and endpoint_key not in endpoints.get("tested", []):
-        endpoints.setdefault("tested", []).append(endpoint_key)
-    if vulnerable and endpoint_key not in endpoints.get("vulnerable", []):
-        endpoints.setdefault("vulnerable", []).append(endpoint_key)
-    
-    # Save endpoints
-    if not _save_target_file(
+    if tested:
+        tested_keys = endpoints.setdefault("tested", [])
+        if endpoint_key not in tested_keys:
+            tested_keys.append(endpoint_key)
+    if vulnerable:
+        vulnerable_keys = endpoints.setdefault("vulnerable", [])
+        if endpoint_key not in vulnerable_keys:
+            vulnerable_keys.append(endpoint_key)
+    
+    # Endpoints, profile stats and session go out in one commit
+    with _TargetBatch(
         config,
         target_slug,
+        lambda: f"[StrixDB] Add/update endpoint: {method} {endpoint}",
         "endpoints.json",
-        endpoints,
-        sha=endpoints_sha,
-        commit_message=f"[StrixDB] Add/update endpoint: {method} {endpoint}",
-    ):
-        return {"success": False, "error": "Failed to save endpoint"}
-    
-    # Update profile stats
-    profile, profile_sha = _get_or_create_target_file(
-        config, target_slug, "profile.json", {}
-    )
-    
-    if profile and profile_sha:
-        profile["stats"]["endpoints_discovered"] = len(endpoints.get("discovered", []))
+    ) as batch:
+        batch.stage("endpoints.json", endpoints, endpoints_sha)
         
-        # Update key endpoints in quick info
-        if vulnerable or auth_required or notes:
-            key_endpoints = profile.get("quick_info", {}).get("key_endpoints", [])
-            if endpoint_key not in key_endpoints:
-                key_endpoints.append(endpoint_key)
-                profile["quick_info"]["key_endpoints"] = key_endpoints[-20:]
+        # Update profile stats
+        profile, profile_sha = loaded["profile.json"]
+        if profile and profile_sha:
+            # Counter is kept in the profile; only genuinely new endpoints bump it
+            stats = profile.setdefault("stats", {})
+            stats["endpoints_discovered"] = stats.get("endpoints_discovered", 0) + (
+                0 if existing else 1
+            )
+            
+            # Update key endpoints in quick info
+            if vulnerable or auth_required or notes:
+                key_endpoints = profile.get("quick_info", {}).get("key_endpoints", [])
+                if endpoint_key not in key_endpoints:
+                    key_endpoints.append(endpoint_key)
+                    profile["quick_info"]["key_endpoints"] = key_endpoints[-20:]
+            
+            batch.stage("profile.json", profile, profile_sha)
         
-        _save_target_file(
-            config,
-            target_slug,
-            "profile.json",
-            profile,
-            sha=profile_sha,
-            commit_message=f"[StrixDB] Update stats for endpoint",
-        )
-    
-    # Update session
-    session_data, session_sha = _get_or_create_target_file(
-        config, target_slug, f"sessions/{session_id}.json", {}
-    )
+        # Update session; left out of the commit when nothing in it changes
+        session_data, session_sha = loaded[session_file]
+        if session_data and session_sha and (not existing or tested):
+            session_endpoints = session_data.setdefault("endpoints", {})
+            session_metrics = session_data["metrics"]
+            if not existing:
+                session_discovered = session_endpoints.setdefault("discovered", [])
+                session_discovered.append(endpoint_key)
+                session_metrics["endpoints_discovered"] = len(session_discovered)
+            
+            if tested:
+                session_tested = session_endpoints.setdefault("tested", [])
+                session_tested.append(endpoint_key)
+                session_metrics["endpoints_tested"] = len(session_tested)
+            
+            batch.stage(session_file, session_data, session_sha)
     
-    if session_data and session_sha:
-        if not existing:
-            session_endpoints = session_data.get("endpoints", {})
-            session_endpoints.setdefault("discovered", []).append(endpoint_key)
-            session_data["endpoints"] = session_endpoints
-            session_data["metrics"]["endpoints_discovered"] = len(session_endpoints.get("discovered", []))
-        
-        if tested:
-            session_data["endpoints"].setdefault("tested", []).append(endpoint_key)
-            session_data["metrics"]["endpoints_tested"] = len(session_data["endpoints"].get("tested", []))
-        
-        _save_target_file(
-            config,
-            target_slug,
-            f"sessions/{session_id}.json",
-            session_data,
-            sha=session_sha,
-            commit_message=f"[StrixDB] Update session with endpoint",
-        )
+    if "endpoints.json" in batch.failed:
+        return {"success": False, "error": "Failed to save endpoint"}
     
     return {
         "success": True,
         "message": f"Endpoint '{method} {endpoint}' saved",
         "endpoint": endpoint_data,
-        "is_new": not bool(existing),
+        "is_new": not existing,
     }
 
 
@@ -1141,7 +2016,7 @@ def strixdb_target_add_note(
     config = _get_strixdb_config()
     
     if not config["repo"] or not config["token"]:
-        return {"success": False, "error": "StrixDB not configured"}
+        return {**_ERR_NOT_CONFIGURED}
     
     target_slug = _sanitize_target_slug(target)
     now = datetime.now(timezone.utc).isoformat()
@@ -1156,48 +2031,50 @@ def strixdb_target_add_note(
         "created_at": now,
     }
     
-    # Load existing notes
-    notes, notes_sha = _get_or_create_target_file(
-        config, target_slug, "notes.json",
-        {"entries": []}
-    )
-    
-    notes["entries"].append(note_entry)
-    
-    # Keep notes manageable - max 500 entries
-    if len(notes["entries"]) > 500:
-        notes["entries"] = notes["entries"][-500:]
-    
-    if not _save_target_file(
-        config,
-        target_slug,
-        "notes.json",
-        notes,
-        sha=notes_sha,
-        commit_message=f"[StrixDB] Add note: {note[:50]}...",
-    ):
-        return {"success": False, "error": "Failed to save note"}
-    
-    # Add to session notes
-    session_data, session_sha = _get_or_create_target_file(
-        config, target_slug, f"sessions/{session_id}.json", {}
+    # Load the notes index and session together
+    session_file = f"sessions/{session_id}.json"
+    loaded = _load_target_files(config, target_slug, {
+        NOTES_INDEX: _empty_notes_index(),
+        session_file: {},
+    })
+    notes_index, notes_index_sha = loaded[NOTES_INDEX]
+    
+    # Only the chunk being filled is read and rewritten. It is read even when the
+    # index says it is new, so a chunk written without its index update is appended
+    # to rather than clobbered.
+    current = notes_index.get("current_chunk", 0)
+    if notes_index.get("chunk_entries", 0) >= NOTES_CHUNK_SIZE:
+        current += 1
+    chunk_file = _notes_chunk_file(current)
+    chunk, chunk_sha = _get_or_create_target_file(
+        config, target_slug, chunk_file, {"entries": []}
     )
-    
-    if session_data and session_sha:
-        session_data.setdefault("notes", []).append({
-            "id": note_entry["id"],
-            "content": note[:200],
-            "category": category,
-        })
-        
-        _save_target_file(
-            config,
-            target_slug,
-            f"sessions/{session_id}.json",
-            session_data,
-            sha=session_sha,
-            commit_message=f"[StrixDB] Update session with note",
+    chunk_entries = chunk.setdefault("entries", [])
+    chunk_entries.append(note_entry)
+    
+    with _TargetBatch(
+        config, target_slug, lambda: f"[StrixDB] Add note: {note[:50]}...", chunk_file
+    ) as batch:
+        batch.stage(chunk_file, chunk, chunk_sha)
+        batch.stage(
+            NOTES_INDEX,
+            {"current_chunk": current, "chunk_entries": len(chunk_entries)},
+            notes_index_sha,
         )
+        
+        # Add to session notes
+        session_data, session_sha = loaded[session_file]
+        if session_data and session_sha:
+            session_notes = session_data.setdefault("notes", [])
+            session_notes.append({
+                "id": note_entry["id"],
+                "content": note[:200],
+                "category": category,
+            })
+            batch.stage(session_file, session_data, session_sha)
+    
+    if chunk_file in batch.failed:
+        return {"success": False, "error": "Failed to save note"}
     
     return {
         "success": True,
@@ -1243,14 +2120,16 @@ def strixdb_target_update_progress(
     config = _get_strixdb_config()
     
     if not config["repo"] or not config["token"]:
-        return {"success": False, "error": "StrixDB not configured"}
+        return {**_ERR_NOT_CONFIGURED}
     
     target_slug = _sanitize_target_slug(target)
     
-    # Load profile
-    profile, profile_sha = _get_or_create_target_file(
-        config, target_slug, "profile.json", {}
+    # Load profile, and the session too when there are tools to record
+    session_file = f"sessions/{session_id}.json"
+    loaded = _load_target_files(
+        config, target_slug, {"profile.json": {}, **({session_file: {}} if tools_used else {})}
     )
+    profile, profile_sha = loaded["profile.json"]
     
     if not profile or not profile_sha:
         return {"success": False, "error": f"Target '{target_slug}' not found"}
@@ -1264,12 +2143,15 @@ def strixdb_target_update_progress(
     })
     
     if recon_completed:
-        tested["reconnaissance"] = list(set(tested.get("reconnaissance", []) + recon_completed))
+        tested["reconnaissance"] = _merge_unique(tested.get("reconnaissance", []), recon_completed)
     if vuln_types_tested:
-        tested["vulnerability_types"] = list(set(tested.get("vulnerability_types", []) + vuln_types_tested))
+        tested["vulnerability_types"] = _merge_unique(
+            tested.get("vulnerability_types", []), vuln_types_tested
+        )
     if endpoints_tested:
         current = tested.get("endpoints_tested", [])
-        tested["endpoints_tested"] = list(set(current + endpoints_tested))[-200:]  # Keep last 200
+        # Keep last 200
+        tested["endpoints_tested"] = _merge_unique(current, endpoints_tested)[-200:]
     
     profile["tested_areas"] = tested
     
@@ -1282,9 +2164,13 @@ def strixdb_target_update_progress(
     })
     
     if add_high_priority:
-        pending["high_priority"] = list(set(pending.get("high_priority", []) + add_high_priority))[:20]
+        pending["high_priority"] = _merge_unique(
+            pending.get("high_priority", []), add_high_priority
+        )[:20]
     if add_medium_priority:
-        pending["medium_priority"] = list(set(pending.get("medium_priority", []) + add_medium_priority))[:20]
+        pending["medium_priority"] = _merge_unique(
+            pending.get("medium_priority", []), add_medium_priority
+        )[:20]
     if remove_completed:
         for item in remove_completed:
             for key in pending:
@@ -1294,34 +2180,24 @@ def strixdb_target_update_progress(
     profile["pending_work"] = pending
     profile["updated_at"] = datetime.now(timezone.utc).isoformat()
     
-    if not _save_target_file(
+    with _TargetBatch(
         config,
         target_slug,
+        lambda: f"[StrixDB] Update progress for {target_slug}",
         "profile.json",
-        profile,
-        sha=profile_sha,
-        commit_message=f"[StrixDB] Update progress for {target_slug}",
-    ):
-        return {"success": False, "error": "Failed to update progress"}
-    
-    # Update session tools used
-    if tools_used:
-        session_data, session_sha = _get_or_create_target_file(
-            config, target_slug, f"sessions/{session_id}.json", {}
-        )
+    ) as batch:
+        batch.stage("profile.json", profile, profile_sha)
         
-        if session_data and session_sha:
-            current_tools = session_data.get("metrics", {}).get("tools_used", [])
-            session_data["metrics"]["tools_used"] = list(set(current_tools + tools_used))
-            
-            _save_target_file(
-                config,
-                target_slug,
-                f"sessions/{session_id}.json",
-                session_data,
-                sha=session_sha,
-                commit_message=f"[StrixDB] Update session tools used",
-            )
+        # Update session tools used
+        if tools_used:
+            session_data, session_sha = loaded[session_file]
+            if session_data and session_sha:
+                current_tools = session_data.get("metrics", {}).get("tools_used", [])
+                session_data["metrics"]["tools_used"] = _merge_unique(current_tools, tools_used)
+                batch.stage(session_file, session_data, session_sha)
+    
+    if "profile.json" in batch.failed:
+        return {"success": False, "error": "Failed to update progress"}
     
     return {
         "success": True,
@@ -1359,15 +2235,32 @@ def strixdb_target_get(
     config = _get_strixdb_config()
     
     if not config["repo"] or not config["token"]:
-        return {"success": False, "error": "StrixDB not configured"}
+        return {**_ERR_NOT_CONFIGURED}
     
     target_slug = _sanitize_target_slug(target)
     
-    # Load profile
-    profile, _ = _get_or_create_target_file(
-        config, target_slug, "profile.json", {}
-    )
+    # The profile and the requested sections are independent reads: run them
+    # concurrently so a cold read costs the slowest section, not their sum
+    loaders: dict[str, Callable[[], Any]] = {
+        "profile": lambda: _get_or_create_target_file(
+            config, target_slug, "profile.json", {}
+        )[0],
+    }
+    if include_findings:
+        loaders["findings"] = lambda: _load_findings(config, target_slug)
+    if include_endpoints:
+        loaders["endpoints"] = lambda: _get_or_create_target_file(
+            config, target_slug, "endpoints.json",
+            {"discovered": [], "tested": [], "vulnerable": []}
+        )[0]
+    if include_notes:
+        loaders["notes"] = lambda: _load_notes(config, target_slug)
     
+    with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+        futures = {section: executor.submit(load) for section, load in loaders.items()}
+        sections = {section: future.result() for section, future in futures.items()}
+    
+    profile = sections.pop("profile")
     if not profile:
         return {
             "success": False,
@@ -1380,30 +2273,10 @@ def strixdb_target_get(
         "target": {
             "slug": target_slug,
             "profile": profile,
+            **sections,
         },
     }
     
-    if include_findings:
-        findings, _ = _get_or_create_target_file(
-            config, target_slug, "findings.json",
-            {"vulnerabilities": [], "informational": []}
-        )
-        result["target"]["findings"] = findings
-    
-    if include_endpoints:
-        endpoints, _ = _get_or_create_target_file(
-            config, target_slug, "endpoints.json",
-            {"discovered": [], "tested": [], "vulnerable": []}
-        )
-        result["target"]["endpoints"] = endpoints
-    
-    if include_notes:
-        notes, _ = _get_or_create_target_file(
-            config, target_slug, "notes.json",
-            {"entries": []}
-        )
-        result["target"]["notes"] = notes
-    
     if include_session_history:
         result["target"]["session_history"] = profile.get("session_history", [])
     
@@ -1432,12 +2305,12 @@ def strixdb_target_list(
     config = _get_strixdb_config()
     
     if not config["repo"] or not config["token"]:
-        return {"success": False, "error": "StrixDB not configured", "targets": []}
+        return {**_ERR_NOT_CONFIGURED, "targets": []}
     
     try:
         # List contents of targets directory
         url = f"{config['api_base']}/repos/{config['repo']}/contents/targets"
-        response = requests.get(url, headers=_get_headers(config["token"]), timeout=30)
+        response = _SESSION.get(url, headers=_get_headers(config["token"]), timeout=30)
         
         if response.status_code == 404:
             return {"success": True, "targets": [], "message": "No targets found"}
@@ -1447,30 +2320,29 @@ def strixdb_target_list(
         
         items = response.json()
         targets = []
+        slugs = [item.get("name") for item in items[:limit] if item.get("type") == "dir"]
+        
+        # All profiles come from aliased GraphQL lookups instead of one GET per target
+        profiles = _fetch_profiles(config, slugs) if include_stats else {}
         
-        for item in items[:limit]:
-            if item.get("type") == "dir":
-                target_slug = item.get("name")
-                
-                target_info = {
-                    "slug": target_slug,
-                }
-                
-                if include_stats:
-                    profile, _ = _get_or_create_target_file(
-                        config, target_slug, "profile.json", {}
-                    )
-                    if profile:
-                        target_info.update({
-                            "target": profile.get("target", target_slug),
-                            "target_type": profile.get("target_type", "unknown"),
-                            "status": profile.get("status", "unknown"),
-                            "total_sessions": profile.get("total_sessions", 0),
-                            "last_scan_at": profile.get("last_scan_at"),
-                            "stats": profile.get("stats", {}),
-                        })
-                
-                targets.append(target_info)
+        for target_slug in slugs:
+            target_info = {
+                "slug": target_slug,
+            }
+            
+            if include_stats:
+                profile = profiles.get(target_slug) or {}
+                if profile:
+                    target_info.update({
+                        "target": profile.get("target", target_slug),
+                        "target_type": profile.get("target_type", "unknown"),
+                        "status": profile.get("status", "unknown"),
+                        "total_sessions": profile.get("total_sessions", 0),
+                        "last_scan_at": profile.get("last_scan_at"),
+                        "stats": profile.get("stats", {}),
+                    })
+            
+            targets.append(target_info)
         
         return {
             "success": True,
@@ -1514,7 +2386,7 @@ def strixdb_target_add_technology(
     config = _get_strixdb_config()
     
     if not config["repo"] or not config["token"]:
-        return {"success": False, "error": "StrixDB not configured"}
+        return {**_ERR_NOT_CONFIGURED}
     
     target_slug = _sanitize_target_slug(target)
     now = datetime.now(timezone.utc).isoformat()
@@ -1529,11 +2401,14 @@ def strixdb_target_add_technology(
         "discovered_at": now,
     }
     
-    # Load existing technologies
-    technologies, tech_sha = _get_or_create_target_file(
-        config, target_slug, "technologies.json",
-        {"identified": [], "versions": {}}
-    )
+    # Load technologies, profile and session together
+    session_file = f"sessions/{session_id}.json"
+    loaded = _load_target_files(config, target_slug, {
+        "technologies.json": {"identified": [], "versions": {}},
+        "profile.json": {},
+        session_file: {},
+    })
+    technologies, tech_sha = loaded["technologies.json"]
     
     # Check if already exists
     existing = [t for t in technologies.get("identified", []) 
@@ -1556,56 +2431,38 @@ def strixdb_target_add_technology(
     if version:
         technologies["versions"][technology] = version
     
-    if not _save_target_file(
+    with _TargetBatch(
         config,
         target_slug,
+        lambda: f"[StrixDB] Add technology: {technology}",
         "technologies.json",
-        technologies,
-        sha=tech_sha,
-        commit_message=f"[StrixDB] Add technology: {technology}",
-    ):
-        return {"success": False, "error": "Failed to save technology"}
-    
-    # Update profile quick info
-    profile, profile_sha = _get_or_create_target_file(
-        config, target_slug, "profile.json", {}
-    )
-    
-    if profile and profile_sha:
-        main_techs = profile.get("quick_info", {}).get("main_technologies", [])
-        if technology not in main_techs:
-            main_techs.append(technology)
-            profile["quick_info"]["main_technologies"] = main_techs[-15:]
-        profile["stats"]["technologies_identified"] = len(technologies.get("identified", []))
+    ) as batch:
+        batch.stage("technologies.json", technologies, tech_sha)
         
-        _save_target_file(
-            config,
-            target_slug,
-            "profile.json",
-            profile,
-            sha=profile_sha,
-            commit_message=f"[StrixDB] Update profile for technology: {technology}",
-        )
-    
-    # Update session
-    session_data, session_sha = _get_or_create_target_file(
-        config, target_slug, f"sessions/{session_id}.json", {}
-    )
-    
-    if session_data and session_sha:
-        session_techs = session_data.get("technologies", [])
-        if technology not in session_techs:
-            session_techs.append(technology)
-            session_data["technologies"] = session_techs
+        # Update profile quick info
+        profile, profile_sha = loaded["profile.json"]
+        if profile and profile_sha:
+            main_techs = profile.get("quick_info", {}).get("main_technologies", [])
+            if technology not in main_techs:
+                main_techs.append(technology)
+                profile["quick_info"]["main_technologies"] = main_techs[-15:]
+            stats = profile.setdefault("stats", {})
+            stats["technologies_identified"] = stats.get("technologies_identified", 0) + (
+                0 if existing else 1
+            )
+            batch.stage("profile.json", profile, profile_sha)
         
-        _save_target_file(
-            config,
-            target_slug,
-            f"sessions/{session_id}.json",
-            session_data,
-            sha=session_sha,
-            commit_message=f"[StrixDB] Update session with technology",
-        )
+        # Update session; left out of the commit when it already lists the technology
+        session_data, session_sha = loaded[session_file]
+        if session_data and session_sha:
+            session_techs = session_data.get("technologies", [])
+            if technology not in session_techs:
+                session_techs.append(technology)
+                session_data["technologies"] = session_techs
+                batch.stage(session_file, session_data, session_sha)
+    
+    if "technologies.json" in batch.failed:
+        return {"success": False, "error": "Failed to save technology"}
     
     return {
         "success": True,
@@ -2,36 +2,37 @@ import os
 import asyncio
 from unittest.mock import MagicMock, patch, AsyncMock
 
-# Simulate a minimal test runner
-async def run_test(name, func):
-    print(f"Running {name}...", end=" ", flush=True)
-    try:
-        if asyncio.iscoroutinefunction(func):
-            await func()
-        else:
-            func()
-        print("PASSED")
-    except Exception as e:
-        print(f"FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+import pytest
+
+
+class _NotifyingDict(dict):
+    """dict that sets an asyncio.Event whenever a key is assigned."""
+    
+    def __init__(self, event):
+        super().__init__()
+        self.event = event
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.event.set()
 
 # Test timeout configuration
 def test_timeout_config():
+    # Both timeouts are read from the environment at call time, no reload needed
+    import strix.runtime.remote_tool_server.http_client as http_client
+    import strix.runtime.remote_tool_server.tool_executor as tool_executor
+    
     # Test http_client
     with patch.dict(os.environ, {"STRIX_TOOL_TIMEOUT": "500.0"}):
-        import importlib
-        import strix.runtime.remote_tool_server.http_client as http_client
-        importlib.reload(http_client)
-        assert http_client.DEFAULT_TIMEOUT == 500.0
+        assert http_client._default_timeout() == 500.0
+        assert http_client.HttpToolClient("localhost:8000", "token").timeout == 500.0
     
     # Test tool_executor
     with patch.dict(os.environ, {"STRIX_TOOL_EXECUTION_TIMEOUT": "400.0"}):
-        import strix.runtime.remote_tool_server.tool_executor as tool_executor
-        importlib.reload(tool_executor)
-        assert tool_executor.TOOL_EXECUTION_TIMEOUT == 400.0
+        assert tool_executor._tool_execution_timeout() == 400.0
 
 # Test background execution logic
+@pytest.mark.asyncio
 async def test_background_tool_execution():
     from strix.tools.executor import _execute_single_tool
     
@@ -48,8 +49,13 @@ async def test_background_tool_execution():
     with patch("strix.tools.executor.execute_tool_invocation", new_callable=AsyncMock) as mock_exec:
         mock_exec.return_value = {"content": "Finished sleep", "status": "success"}
         
-        # We also need to mock _agent_messages from agents_graph_actions
-        with patch("strix.tools.agents_graph.agents_graph_actions._agent_messages", {}) as mock_messages:
+        # We also need to mock _agent_messages from agents_graph_actions; the
+        # background task signals completion by creating the agent's inbox
+        delivered = asyncio.Event()
+        with patch(
+            "strix.tools.agents_graph.agents_graph_actions._agent_messages",
+            _NotifyingDict(delivered),
+        ) as mock_messages:
             
             obs_xml, images, should_finish = await _execute_single_tool(
                 tool_inv, agent_state, tracer, "test_agent"
@@ -60,8 +66,8 @@ async def test_background_tool_execution():
             assert images == []
             assert should_finish is False
             
-            # Give it a tiny bit to start the task
-            await asyncio.sleep(0.5)
+            # Wait for the background task to deliver its completion notice
+            await asyncio.wait_for(delivered.wait(), timeout=2.0)
             
             # Check if a message was "sent" back to the agent
             assert "test_agent" in mock_messages
@@ -70,6 +76,7 @@ async def test_background_tool_execution():
             assert "Finished sleep" in mock_messages["test_agent"][0]["content"]
 
 # Test per-tool timeout logic
+@pytest.mark.asyncio
 async def test_per_tool_timeout():
     from strix.tools.executor import _execute_single_tool
     
@@ -90,12 +97,3 @@ async def test_per_tool_timeout():
         # Verify timeout=0.1 was passed to execute_tool_invocation
         args, kwargs = mock_inv.call_args
         assert kwargs["timeout"] == 0.1
-
-async def main():
-    print("=== ASYNC TOOLS & TIMEOUT VERIFICATION ===")
-    await run_test("test_timeout_config", test_timeout_config)
-    await run_test("test_background_tool_execution", test_background_tool_execution)
-    await run_test("test_per_tool_timeout", test_per_tool_timeout)
-
-if __name__ == "__main__":
-    asyncio.run(main())
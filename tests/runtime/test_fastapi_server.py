@@ -1,5 +1,8 @@
 import os
 import sys
+from contextlib import contextmanager
+
+import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import MagicMock, patch
 
@@ -9,20 +12,39 @@ os.environ["STRIX_SERVER_TOKEN"] = "test-token"
 # Mock tool initialization to avoid slow imports
 with patch("strix.tools.registry.get_tool_names", return_value=["test_tool"]):
     from strix.runtime.remote_tool_server.http_server import app
+    from strix.runtime.remote_tool_server.tool_executor import ToolExecutor
+
+# Built once; _patched_executor resets it instead of constructing a new mock per test
+_EXECUTOR_TEMPLATE = MagicMock(spec=ToolExecutor)
+
+
+@pytest.fixture(scope="module")
+def client():
+    # One client (and one app startup/shutdown) shared by every test in the module
+    with TestClient(app) as shared_client:
+        yield shared_client
 
-client = TestClient(app)
+@contextmanager
+def _patched_executor():
+    """Serve the shared executor mock, cleared of calls and configured returns."""
+    _EXECUTOR_TEMPLATE.reset_mock(return_value=True, side_effect=True)
+    with patch(
+        "strix.runtime.remote_tool_server.http_server.get_tool_executor",
+        return_value=_EXECUTOR_TEMPLATE,
+    ):
+        yield _EXECUTOR_TEMPLATE
 
-def run_test(name, func):
+def run_test(name, func, client):
     print(f"Running {name}...", end=" ", flush=True)
     try:
-        func()
+        func(client)
         print("PASSED")
     except Exception as e:
         print(f"FAILED: {e}")
         import traceback
         traceback.print_exc()
 
-def test_health_get():
+def test_health_get(client):
     # Mock network check to avoid hang
     with patch("socket.gethostbyname", side_effect=Exception("No network")):
         response = client.get("/health")
@@ -31,12 +53,12 @@ def test_health_get():
         assert data["healthy"] is True
         assert data["network_status"] == "disconnected"
 
-def test_health_post():
+def test_health_post(client):
     response = client.post("/health")
     assert response.status_code == 200
     assert response.json()["healthy"] is True
 
-def test_execute_unauthorized():
+def test_execute_unauthorized(client):
     response = client.post("/execute", json={
         "tool_name": "test_tool",
         "kwargs": {},
@@ -44,12 +66,9 @@ def test_execute_unauthorized():
     })
     assert response.status_code == 401
 
-def test_execute_success():
-    # Mocking the executor
-    mock_executor = MagicMock()
-    mock_executor.execute_tool.return_value = {"result": "success_result"}
-    
-    with patch("strix.runtime.remote_tool_server.http_server.get_tool_executor", return_value=mock_executor):
+def test_execute_success(client):
+    with _patched_executor() as mock_executor:
+        mock_executor.execute_tool.return_value = {"result": "success_result"}
         response = client.post("/execute", json={
             "tool_name": "test_tool",
             "kwargs": {"arg1": "val1"},
@@ -62,11 +81,9 @@ def test_execute_success():
         assert data["result"] == "success_result"
         mock_executor.execute_tool.assert_called_once_with("test_tool", {"arg1": "val1"}, timeout=None)
 
-def test_execute_with_timeout():
-    mock_executor = MagicMock()
-    mock_executor.execute_tool.return_value = {"result": "timeout_result"}
-    
-    with patch("strix.runtime.remote_tool_server.http_server.get_tool_executor", return_value=mock_executor):
+def test_execute_with_timeout(client):
+    with _patched_executor() as mock_executor:
+        mock_executor.execute_tool.return_value = {"result": "timeout_result"}
         response = client.post("/execute", json={
             "tool_name": "test_tool",
             "kwargs": {},
@@ -77,11 +94,9 @@ def test_execute_with_timeout():
         assert response.status_code == 200
         mock_executor.execute_tool.assert_called_once_with("test_tool", {}, timeout=10.5)
 
-def test_execute_error():
-    mock_executor = MagicMock()
-    mock_executor.execute_tool.return_value = {"error": "some_error"}
-    
-    with patch("strix.runtime.remote_tool_server.http_server.get_tool_executor", return_value=mock_executor):
+def test_execute_error(client):
+    with _patched_executor() as mock_executor:
+        mock_executor.execute_tool.return_value = {"error": "some_error"}
         response = client.post("/execute", json={
             "tool_name": "test_tool",
             "kwargs": {},
@@ -94,14 +109,12 @@ def test_execute_error():
         assert data["error"] == "some_error"
         assert data["exit_code"] == 1
 
-def test_execute_batch():
-    mock_executor = MagicMock()
-    mock_executor.execute_batch.return_value = [
-        {"result": "res1"},
-        {"error": "err2"}
-    ]
-    
-    with patch("strix.runtime.remote_tool_server.http_server.get_tool_executor", return_value=mock_executor):
+def test_execute_batch(client):
+    with _patched_executor() as mock_executor:
+        mock_executor.execute_batch.return_value = [
+            {"result": "res1"},
+            {"error": "err2"}
+        ]
         response = client.post("/execute_batch", json={
             "tools": [
                 {"tool_name": "t1", "kwargs": {}},
@@ -119,7 +132,7 @@ def test_execute_batch():
         assert data["results"][1]["success"] is False
         assert data["results"][1]["error"] == "err2"
 
-def test_register_agent():
+def test_register_agent(client):
     response = client.post("/register_agent", json={
         "agent_id": "agent-123",
         "auth_token": "test-token"
@@ -131,14 +144,18 @@ def test_register_agent():
 
 def main():
     print("=== FASTAPI SERVER VERIFICATION ===")
-    run_test("test_health_get", test_health_get)
-    run_test("test_health_post", test_health_post)
-    run_test("test_execute_unauthorized", test_execute_unauthorized)
-    run_test("test_execute_success", test_execute_success)
-    run_test("test_execute_with_timeout", test_execute_with_timeout)
-    run_test("test_execute_error", test_execute_error)
-    run_test("test_execute_batch", test_execute_batch)
-    run_test("test_register_agent", test_register_agent)
+    with TestClient(app) as client:
+        for test in (
+            test_health_get,
+            test_health_post,
+            test_execute_unauthorized,
+            test_execute_success,
+            test_execute_with_timeout,
+            test_execute_error,
+            test_execute_batch,
+            test_register_agent,
+        ):
+            run_test(test.__name__, test, client)
 
 if __name__ == "__main__":
     main()
@@ -12,6 +12,7 @@ Tests all repository extraction functionality including:
 import json
 import os
 from datetime import datetime, timezone
+from pathlib import Path
 from unittest.mock import MagicMock, patch, mock_open
 
 import pytest
@@ -34,6 +35,23 @@ def mock_strixdb_config():
     }
 
 
+@pytest.fixture(autouse=True)
+def isolated_caches(monkeypatch):
+    """Keep the persisted ETag cache out of tests and start each test with empty caches."""
+    from strix.tools.strixdb import strixdb_repo_extract
+    
+    monkeypatch.setattr(strixdb_repo_extract, "ETAG_CACHE_PATH", "")
+    strixdb_repo_extract._ETAG_CACHE.clear()
+    strixdb_repo_extract._SEARCH_CACHE.clear()
+    strixdb_repo_extract._ITEM_TREE_CACHE.clear()
+    strixdb_repo_extract._EXTRACTED_PARTITIONS.clear()
+    yield
+    strixdb_repo_extract._ETAG_CACHE.clear()
+    strixdb_repo_extract._SEARCH_CACHE.clear()
+    strixdb_repo_extract._ITEM_TREE_CACHE.clear()
+    strixdb_repo_extract._EXTRACTED_PARTITIONS.clear()
+
+
 class TestRepoSlugGeneration:
     """Tests for repository slug generation."""
     
@@ -242,6 +260,126 @@ class TestRepoExtractInit:
         assert result["manifest"]["status"] == "completed"
 
 
+class TestDiscardDir:
+    """Tests for clearing an old clone directory before re-cloning."""
+    
+    def test_discard_dir_frees_path(self, tmp_path):
+        """Test that the path is free immediately and the tree is removed."""
+        import time
+        
+        from strix.tools.strixdb.strixdb_repo_extract import _discard_dir
+        
+        clone_dir = tmp_path / "owner_repo"
+        (clone_dir / "sub").mkdir(parents=True)
+        (clone_dir / "sub" / "file.txt").write_text("data")
+        
+        _discard_dir(str(clone_dir))
+        
+        assert not clone_dir.exists()
+        for _ in range(100):
+            if not list(tmp_path.iterdir()):
+                break
+            time.sleep(0.01)
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_discard_missing_dir(self, tmp_path):
+        """Test that a missing directory is ignored."""
+        from strix.tools.strixdb.strixdb_repo_extract import _discard_dir
+        
+        _discard_dir(str(tmp_path / "missing"))
+
+
+class TestTreeScan:
+    """Tests for building the file index from the Git Trees API."""
+    
+    def test_parse_github_repo(self):
+        """Test extracting owner/repo from GitHub URLs."""
+        from strix.tools.strixdb.strixdb_repo_extract import _parse_github_repo
+        
+        assert _parse_github_repo("https://github.com/owner/repo.git") == ("owner", "repo")
+        assert _parse_github_repo("git@github.com:owner/repo.git") == ("owner", "repo")
+        assert _parse_github_repo("owner/repo") == ("owner", "repo")
+        assert _parse_github_repo("https://gitlab.com/owner/repo") is None
+    
+    def test_index_from_tree(self):
+        """Test that only blobs under the size limit are indexed."""
+        from strix.tools.strixdb.strixdb_repo_extract import _index_from_tree
+        
+        tree = [
+            {"path": "payloads", "type": "tree", "sha": "t1"},
+            {"path": "payloads/xss.txt", "type": "blob", "size": 100, "sha": "b1"},
+            {"path": "big.bin", "type": "blob", "size": 6 * 1024 * 1024, "sha": "b2"},
+        ]
+        
+        file_index, category_counts, total_size = _index_from_tree(tree)
+        
+        assert [f["path"] for f in file_index] == ["payloads/xss.txt"]
+        assert file_index[0]["sha"] == "b1"
+        assert category_counts == {"payloads": 1}
+        assert total_size == 100 + 6 * 1024 * 1024
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
+    def test_fetch_tree_truncated(self, mock_requests_get, mock_strixdb_config):
+        """Test that a truncated tree signals a clone fallback."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"tree": [], "truncated": True}
+        mock_requests_get.return_value = mock_response
+        
+        from strix.tools.strixdb.strixdb_repo_extract import _fetch_repo_tree
+        
+        assert _fetch_repo_tree(mock_strixdb_config, "owner", "repo") is None
+    
+    def test_clone_scan_skips_symlinks(self, tmp_path):
+        """Test that symlinked files and directories in a clone are never indexed."""
+        from strix.tools.strixdb.strixdb_repo_extract import _iter_clone_files
+        
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "secret.txt").write_text("do not upload")
+        clone = tmp_path / "clone"
+        (clone / "payloads").mkdir(parents=True)
+        (clone / "payloads" / "xss.txt").write_text("<script>")
+        (clone / ".git").mkdir()
+        (clone / ".git" / "HEAD").write_text("ref")
+        (clone / "linked_dir").symlink_to(outside, target_is_directory=True)
+        (clone / "linked.txt").symlink_to(outside / "secret.txt")
+        
+        assert list(_iter_clone_files(str(clone))) == [("payloads/xss.txt", 8)]
+
+
+class TestIncrementalRescan:
+    """Tests for merging re-scan results into an existing index."""
+    
+    def test_diff_and_apply_changes(self):
+        """Test that only added, changed and removed entries are touched."""
+        from strix.tools.strixdb.strixdb_repo_extract import (
+            _apply_index_changes,
+            _diff_file_indexes,
+        )
+        
+        old_index = [
+            {"path": "a.py", "sha": "s1", "size": 1, "extracted": True},
+            {"path": "b.py", "sha": "s2", "size": 1, "extracted": True},
+            {"path": "c.py", "sha": "s3", "size": 1, "extracted": False},
+        ]
+        new_index = [
+            {"path": "a.py", "sha": "s1", "size": 1, "extracted": False},
+            {"path": "b.py", "sha": "s2b", "size": 2, "extracted": False},
+            {"path": "d.py", "sha": "s4", "size": 1, "extracted": False},
+        ]
+        
+        changes = _diff_file_indexes(old_index, new_index)
+        merged, counts = _apply_index_changes(old_index, changes)
+        
+        assert set(changes) == {"b.py", "c.py", "d.py"}
+        assert counts == {"added": 1, "modified": 1, "removed": 1}
+        by_path = {f["path"]: f for f in merged}
+        assert by_path["a.py"]["extracted"] is True
+        assert by_path["b.py"]["extracted"] is False
+        assert "c.py" not in by_path
+
+
 class TestRepoExtractFile:
     """Tests for strixdb_repo_extract_file function."""
     
@@ -265,7 +403,7 @@ class TestRepoExtractFile:
     @patch('strix.tools.strixdb.strixdb_repo_extract._save_repo_file')
     @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
     @patch('os.path.exists')
-    @patch('builtins.open', new_callable=mock_open, read_data="print('hello')")
+    @patch('builtins.open', new_callable=mock_open, read_data=b"print('hello')")
     def test_extract_file_success(
         self,
         mock_file,
@@ -297,6 +435,19 @@ class TestRepoExtractFile:
         assert result["item"]["category"] == "tools"
 
 
+class TestBinaryDetection:
+    """Tests for the binary sniffing heuristic."""
+    
+    def test_looks_binary(self):
+        """Test NUL bytes and non-text ratios."""
+        from strix.tools.strixdb.strixdb_repo_extract import _looks_binary
+        
+        assert _looks_binary(b"\x89PNG\r\n\x1a\n\x00\x00") is True
+        assert _looks_binary(bytes(range(1, 32)) * 4) is True
+        assert _looks_binary("print('héllo')\n".encode()) is False
+        assert _looks_binary(b"") is False
+
+
 class TestRepoExtractCategory:
     """Tests for strixdb_repo_extract_category function."""
     
@@ -353,6 +504,122 @@ class TestRepoExtractCategory:
         assert result["extracted_count"] == 0
 
 
+    @patch('strix.tools.strixdb.strixdb_repo_extract._bulk_commit')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._checkout_lazy_files')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._prepare_extracted_item')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
+    def test_failed_commit_leaves_files_pending(
+        self,
+        mock_get_file,
+        mock_config,
+        mock_prepare,
+        mock_checkout,
+        mock_bulk_commit,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that the index and manifest only record files whose commit succeeded."""
+        mock_config.return_value = mock_strixdb_config
+        index = {
+            "files": [
+                {"path": "run.sh", "category": "scripts", "size": 10, "extension": ".sh"},
+            ]
+        }
+        manifest = {"stats": {"files_extracted": 0}}
+        mock_get_file.side_effect = lambda config, slug, name, default: (
+            (index, "sha1") if name == "index.json" else (manifest, "sha2")
+        )
+        mock_prepare.return_value = {
+            "success": True,
+            "item": {"id": "ext_1", "original_path": "run.sh", "hash": "abc", "content_length": 8},
+            "content": "echo hi\n",
+            "save_path": "categories/scripts/run.json",
+        }
+        mock_bulk_commit.return_value = False
+        
+        from strix.tools.strixdb.strixdb_repo_extract import strixdb_repo_extract_category
+        
+        result = strixdb_repo_extract_category(
+            mock_agent_state,
+            repo_slug="owner_repo",
+            category="scripts",
+        )
+        
+        assert result["extracted_count"] == 0
+        assert result["failed_count"] == 1
+        # The failed commit carried the updates, but the cached documents were not touched
+        files = mock_bulk_commit.call_args.args[2]
+        assert files["index.json"]["files"][0]["extracted"] is True
+        assert files["manifest.json"]["stats"]["files_extracted"] == 1
+        assert "extracted" not in index["files"][0]
+        assert manifest["stats"]["files_extracted"] == 0
+
+
+    @patch('strix.tools.strixdb.strixdb_repo_extract._bulk_commit')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._checkout_lazy_files')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._prepare_extracted_item')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
+    def test_same_stem_files_get_distinct_paths(
+        self,
+        mock_get_file,
+        mock_config,
+        mock_prepare,
+        mock_checkout,
+        mock_bulk_commit,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that same-stem files do not overwrite each other and duplicates follow them."""
+        mock_config.return_value = mock_strixdb_config
+        paths = ["a/list.txt", "b/list.txt", "c/copy.txt"]
+        index = {
+            "files": [
+                {"path": path, "category": "wordlists", "size": 10, "extension": ".txt"}
+                for path in paths
+            ]
+        }
+        mock_get_file.side_effect = lambda config, slug, name, default: (
+            (index, "sha1") if name == "index.json" else ({}, None)
+        )
+        content_hashes = {"a/list.txt": "aaa", "b/list.txt": "bbb", "c/copy.txt": "aaa"}
+        mock_prepare.side_effect = lambda slug, path, **kwargs: {
+            "success": True,
+            "item": {
+                "id": f"ext_{path}",
+                "original_path": path,
+                "hash": content_hashes[path],
+                "content_length": 6,
+            },
+            "content": "admin\n",
+            "save_path": f"categories/wordlists/{Path(path).stem}.json",
+        }
+        mock_bulk_commit.return_value = True
+        
+        from strix.tools.strixdb.strixdb_repo_extract import (
+            _unique_save_path,
+            strixdb_repo_extract_category,
+        )
+        
+        result = strixdb_repo_extract_category(
+            mock_agent_state,
+            repo_slug="owner_repo",
+            category="wordlists",
+        )
+        
+        assert result["extracted_count"] == 3
+        assert result["deduplicated_count"] == 1
+        files = mock_bulk_commit.call_args.args[2]
+        first = "categories/wordlists/list.json"
+        second = _unique_save_path(first, "b/list.txt")
+        assert files[first]["original_path"] == "a/list.txt"
+        assert files[second]["original_path"] == "b/list.txt"
+        assert files["categories/wordlists/copy.json"]["duplicate_of"] == first
+        extracted_to = {f["path"]: f["extracted_to"] for f in files["index.json"]["files"]}
+        assert extracted_to["b/list.txt"] == second
+
+
 class TestRepoExtractStatus:
     """Tests for strixdb_repo_extract_status function."""
     
@@ -368,7 +635,7 @@ class TestRepoExtractStatus:
         """Test getting extraction status."""
         mock_config.return_value = mock_strixdb_config
         
-        def get_file_side_effect(config, slug, filename, default):
+        def get_file_side_effect(config, slug, filename, default, **kwargs):
             if filename == "manifest.json":
                 return ({
                     "source_url": "https://github.com/owner/repo",
@@ -403,6 +670,46 @@ class TestRepoExtractStatus:
         assert result["stats"]["extracted"] == 2
         assert result["stats"]["pending"] == 1
     
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
+    def test_status_from_manifest_snapshot(
+        self,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that status skips the index when the manifest carries its stats."""
+        mock_config.return_value = mock_strixdb_config
+        mock_get_file.return_value = ({
+            "status": "extracting",
+            "index_stats": {"total": 4, "extracted": 1, "pending": 3},
+            "pending_by_category": {"scripts": 3},
+        }, "sha1")
+        
+        from strix.tools.strixdb.strixdb_repo_extract import strixdb_repo_extract_status
+        
+        result = strixdb_repo_extract_status(mock_agent_state, repo_slug="owner_repo")
+        
+        assert mock_get_file.call_count == 1
+        assert result["stats"]["extraction_percentage"] == 25.0
+        assert result["pending_by_category"] == {"scripts": 3}
+    
+    def test_index_summary_written_with_index(self):
+        """Test that written indexes carry the counts status reads."""
+        from strix.tools.strixdb.strixdb_repo_extract import _with_index_summary
+        
+        index = _with_index_summary({
+            "files": [
+                {"path": "a.py", "category": "scripts", "extracted": True},
+                {"path": "b.py", "category": "scripts", "extracted": False},
+                {"path": "c.txt", "category": "wordlists"},
+            ]
+        })
+        
+        assert index["stats"] == {"total": 3, "extracted": 1, "pending": 2}
+        assert index["pending_by_category"] == {"scripts": 1, "wordlists": 1}
+    
     @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
     @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
     def test_status_not_found(
@@ -488,6 +795,80 @@ class TestRepoListExtracted:
         
         assert result["success"] is True
         assert result["total_extracted"] == 1
+        assert result["truncated"] is False
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
+    def test_list_extracted_truncated(
+        self,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that hitting the limit with more matches left sets truncated."""
+        mock_config.return_value = mock_strixdb_config
+        mock_get_file.return_value = ({
+            "files": [
+                {"path": f"{i}.py", "category": "scripts", "extracted": True}
+                for i in range(5)
+            ]
+        }, "sha")
+        
+        from strix.tools.strixdb.strixdb_repo_extract import strixdb_repo_list_extracted
+        
+        result = strixdb_repo_list_extracted(mock_agent_state, repo_slug="owner_repo", limit=2)
+        
+        assert [item["path"] for item in result["items"]] == ["0.py", "1.py"]
+        assert result["truncated"] is True
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
+    def test_list_extracted_pages_by_cursor(
+        self,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test cursor paging over a partition cached until the index sha changes."""
+        from strix.tools.strixdb import strixdb_repo_extract as mod
+        
+        mock_config.return_value = mock_strixdb_config
+        index = {
+            "files": [
+                {"path": f"{i}.py", "category": "scripts", "extracted": i != 3}
+                for i in (4, 0, 3, 2, 1)
+            ]
+        }
+        mock_get_file.return_value = (index, "sha1")
+        
+        first = mod.strixdb_repo_list_extracted_page(
+            mock_agent_state, repo_slug="owner_repo", page_size=3
+        )
+        partition = mod._EXTRACTED_PARTITIONS[("testuser/StrixDB", "owner_repo", None)][1]
+        second = mod.strixdb_repo_list_extracted_page(
+            mock_agent_state, repo_slug="owner_repo", cursor=first["next_cursor"], page_size=3
+        )
+        
+        assert [item["path"] for item in first["items"]] == ["0.py", "1.py", "2.py"]
+        assert [item["path"] for item in second["items"]] == ["4.py"]
+        assert first["total_extracted"] == 4
+        assert second["next_cursor"] is None
+        assert mod._EXTRACTED_PARTITIONS[("testuser/StrixDB", "owner_repo", None)][1] is partition
+        
+        index["files"].append({"path": "5.py", "category": "scripts", "extracted": True})
+        mock_get_file.return_value = (index, "sha2")
+        third = mod.strixdb_repo_list_extracted_page(
+            mock_agent_state, repo_slug="owner_repo", cursor="3", page_size=3
+        )
+        
+        assert [item["path"] for item in third["items"]] == ["4.py", "5.py"]
+        
+        invalid = mod.strixdb_repo_list_extracted_page(
+            mock_agent_state, repo_slug="owner_repo", cursor="abc"
+        )
+        assert invalid["success"] is False
 
 
 class TestRepoGetItem:
@@ -525,6 +906,120 @@ class TestRepoGetItem:
         assert result["item"]["name"] == "test_script"
         assert result["item"]["content"] == "print('hello')"
     
+    @patch('strix.tools.strixdb.strixdb_repo_extract._zstd_decompress', create=True)
+    @patch('strix.tools.strixdb.strixdb_repo_extract._zstd_available', True)
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
+    def test_get_item_zstd_content(
+        self,
+        mock_get_file,
+        mock_config,
+        mock_decompress,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that zstd-compressed items are decompressed transparently."""
+        import base64
+        
+        mock_config.return_value = mock_strixdb_config
+        mock_decompress.side_effect = lambda data: data
+        mock_get_file.return_value = ({
+            "name": "big_list",
+            "content": "",
+            "content_zstd_b64": base64.b64encode(b"admin\nroot\n").decode(),
+            "encoding": "zstd",
+        }, "sha")
+        
+        from strix.tools.strixdb.strixdb_repo_extract import strixdb_repo_get_item
+        
+        result = strixdb_repo_get_item(
+            mock_agent_state,
+            repo_slug="owner_repo",
+            category="wordlists",
+            item_name="big_list",
+        )
+        
+        assert result["success"] is True
+        assert result["item"]["content"] == "admin\nroot\n"
+        assert "content_zstd_b64" not in result["item"]
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
+    def test_get_item_follows_duplicate_pointer(
+        self,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that a duplicate pointer resolves to the original item's content."""
+        mock_config.return_value = mock_strixdb_config
+        mock_get_file.side_effect = [
+            ({
+                "id": "ext_copy",
+                "duplicate_of": "categories/wordlists/users.json",
+                "original_path": "lists/copy/users.txt",
+            }, "sha2"),
+            ({
+                "id": "ext_orig",
+                "name": "users",
+                "content": "admin\n",
+                "original_path": "lists/users.txt",
+            }, "sha1"),
+        ]
+        
+        from strix.tools.strixdb.strixdb_repo_extract import strixdb_repo_get_item
+        
+        result = strixdb_repo_get_item(
+            mock_agent_state,
+            repo_slug="owner_repo",
+            category="wordlists",
+            item_name="users_copy",
+        )
+        
+        assert result["success"] is True
+        assert result["item"]["content"] == "admin\n"
+        assert result["item"]["id"] == "ext_copy"
+        assert result["item"]["original_path"] == "lists/copy/users.txt"
+        assert mock_get_file.call_args.args[2] == "categories/wordlists/users.json"
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
+    def test_get_item_resolved_through_index(
+        self,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that a name whose computed path misses is resolved via the index."""
+        mock_config.return_value = mock_strixdb_config
+        
+        def get_file_side_effect(config, slug, filename, default, **kwargs):
+            if filename == "index.json":
+                return ({"files": [{
+                    "path": "tools/Recon Tool.py",
+                    "extracted": True,
+                    "extracted_to": "categories/tools/legacy_recon.json",
+                }]}, "sha_index")
+            if filename == "categories/tools/legacy_recon.json":
+                return ({"name": "Recon Tool", "content": "print(1)"}, "sha_item")
+            return (default, None)
+        
+        mock_get_file.side_effect = get_file_side_effect
+        
+        from strix.tools.strixdb.strixdb_repo_extract import strixdb_repo_get_item
+        
+        result = strixdb_repo_get_item(
+            mock_agent_state,
+            repo_slug="owner_repo",
+            category="tools",
+            item_name="Recon Tool",
+        )
+        
+        assert result["success"] is True
+        assert result["item"]["content"] == "print(1)"
+    
     @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
     @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
     def test_get_item_not_found(
@@ -549,13 +1044,67 @@ class TestRepoGetItem:
         
         assert result["success"] is False
         assert "not found" in result["error"].lower()
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
+    def test_get_items_resolves_blobs_from_one_tree(
+        self,
+        mock_get_file,
+        mock_config,
+        mock_get,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that get_items lists the tree once and reads each item by blob sha."""
+        mock_config.return_value = mock_strixdb_config
+        mock_get.return_value = MagicMock(
+            status_code=200,
+            content=json.dumps({
+                "truncated": False,
+                "tree": [
+                    {"path": "scripts", "type": "tree", "sha": "t1"},
+                    {"path": "scripts/a.json", "type": "blob", "sha": "sha_a"},
+                    {"path": "payloads/b.json", "type": "blob", "sha": "sha_b"},
+                ],
+            }).encode(),
+        )
+        mock_get.return_value.json.return_value = json.loads(mock_get.return_value.content)
+        stored = {
+            "categories/scripts/a.json": {"id": "a", "name": "a", "category": "scripts"},
+            "categories/payloads/b.json": {"id": "b", "name": "b", "category": "payloads"},
+        }
+        mock_get_file.side_effect = lambda config, slug, path, default, **kwargs: (
+            stored.get(path, {}), kwargs.get("sha")
+        )
+        
+        from strix.tools.strixdb.strixdb_repo_extract import strixdb_repo_get_items
+        
+        result = strixdb_repo_get_items(
+            mock_agent_state,
+            repo_slug="owner_repo",
+            items=[
+                {"category": "scripts", "item_name": "a"},
+                {"category": "payloads", "item_name": "b"},
+                {"category": "payloads", "item_name": "missing"},
+            ],
+        )
+        
+        assert result["success"] is True
+        assert [item["id"] for item in result["items"]] == ["a", "b"]
+        assert result["errors"][0]["item_name"] == "missing"
+        assert mock_get.call_count == 1
+        assert "git/trees/main:extracted_repos/owner_repo/categories" in mock_get.call_args[0][0]
+        shas = {call.args[2]: call.kwargs.get("sha") for call in mock_get_file.call_args_list}
+        assert shas["categories/scripts/a.json"] == "sha_a"
+        assert shas["categories/payloads/b.json"] == "sha_b"
 
 
 class TestRepoSearch:
     """Tests for strixdb_repo_search function."""
     
     @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
-    @patch('requests.get')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
     def test_search_success(
         self,
         mock_requests_get,
@@ -575,6 +1124,7 @@ class TestRepoSearch:
                 {"path": "extracted_repos/owner_repo/categories/wordlists/common.json", "score": 0.8},
             ],
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_requests_get.return_value = mock_response
         
         from strix.tools.strixdb.strixdb_repo_extract import strixdb_repo_search
@@ -587,24 +1137,201 @@ class TestRepoSearch:
         assert result["success"] is True
         assert result["total_count"] == 2
         assert len(result["results"]) == 2
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
+    def test_search_repeat_served_from_cache(
+        self,
+        mock_requests_get,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that an identical search within the TTL skips the API call."""
+        mock_config.return_value = mock_strixdb_config
+        
+        mock_response = MagicMock(status_code=200)
+        mock_response.json.return_value = {
+            "total_count": 1,
+            "items": [{"path": "extracted_repos/owner_repo/categories/payloads/xss.json"}],
+        }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_requests_get.return_value = mock_response
+        
+        from strix.tools.strixdb.strixdb_repo_extract import strixdb_repo_search
+        
+        first = strixdb_repo_search(mock_agent_state, query="xss")
+        second = strixdb_repo_search(mock_agent_state, query="xss")
+        strixdb_repo_search(mock_agent_state, query="xss", category="payloads")
+        
+        assert mock_requests_get.call_count == 2
+        assert second["results"] == first["results"]
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
+    def test_search_cache_keeps_projected_hits(
+        self,
+        mock_requests_get,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that only path and score of each hit are kept in the search cache."""
+        from strix.tools.strixdb import strixdb_repo_extract as mod
+        
+        mock_config.return_value = mock_strixdb_config
+        body = {
+            "total_count": 1,
+            "items": [{
+                "path": "extracted_repos/owner_repo/categories/payloads/xss.json",
+                "score": 2.5,
+                "html_url": "https://github.com/testuser/StrixDB/blob/main/x",
+                "repository": {"full_name": "testuser/StrixDB", "owner": {}},
+            }],
+        }
+        mock_response = MagicMock(status_code=200, content=json.dumps(body).encode())
+        mock_response.json.return_value = body
+        mock_requests_get.return_value = mock_response
+        
+        result = mod.strixdb_repo_search(mock_agent_state, query="xss")
+        
+        assert result["results"][0]["score"] == 2.5
+        (_, cached), = mod._SEARCH_CACHE.values()
+        assert cached["items"] == [
+            {"path": "extracted_repos/owner_repo/categories/payloads/xss.json", "score": 2.5},
+        ]
+    
+    @pytest.mark.parametrize("prefetch_pages", [0, 2])
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
+    def test_search_limit_spans_pages(
+        self,
+        mock_requests_get,
+        mock_config,
+        prefetch_pages,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that a limit above one page merges pages up to total_count."""
+        mock_config.return_value = mock_strixdb_config
+        
+        def page_response(url, headers=None, params=None, timeout=None):
+            page = params.get("page", 1)
+            count = 100 if page < 3 else 50
+            body = {
+                "total_count": 250,
+                "items": [
+                    {"path": f"extracted_repos/owner_repo/categories/payloads/p{page}_{i}.json"}
+                    for i in range(count)
+                ],
+            }
+            response = MagicMock(status_code=200, content=json.dumps(body).encode())
+            response.json.return_value = body
+            return response
+        
+        mock_requests_get.side_effect = page_response
+        
+        from strix.tools.strixdb.strixdb_repo_extract import strixdb_repo_search
+        
+        result = strixdb_repo_search(
+            mock_agent_state,
+            query="xss",
+            limit=500,
+            prefetch_pages=prefetch_pages,
+        )
+        
+        assert result["success"] is True
+        assert result["pages_fetched"] == 3
+        assert len(result["results"]) == 250
+        assert result["results"][-1]["file"] == "p3_49.json"
+        # total_count caps the pages requested, even with prefetch
+        assert mock_requests_get.call_count == 3
+
+
+class TestMetrics:
+    """Tests for the strixdb_metrics counters."""
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
+    def test_counts_cache_hits_and_304s(
+        self,
+        mock_get,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+        monkeypatch,
+    ):
+        """Test that TTL hits, 304 revalidations and rate-limit headroom are reported."""
+        import base64
+        from collections import Counter
+        
+        from strix.tools.strixdb import strixdb_repo_extract as mod
+        
+        monkeypatch.setattr(mod, "_METRICS", Counter())
+        budget = mod._RateBudget()
+        budget.update({"X-RateLimit-Remaining": "4321", "X-RateLimit-Reset": "0"})
+        monkeypatch.setattr(mod, "_RATE_BUDGET", budget)
+        mock_config.return_value = mock_strixdb_config
+        ok = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+        ok.json.return_value = {
+            "sha": "abc",
+            "content": base64.b64encode(b'{"x": 1}').decode(),
+        }
+        mock_get.side_effect = [ok, MagicMock(status_code=304, headers={})]
+        
+        mod._get_or_create_repo_file(mock_strixdb_config, "owner_repo", "index.json", {})
+        mod._get_or_create_repo_file(
+            mock_strixdb_config, "owner_repo", "index.json", {}, use_cache=True
+        )
+        mod._get_or_create_repo_file(mock_strixdb_config, "owner_repo", "index.json", {})
+        
+        result = mod.strixdb_metrics(mock_agent_state)
+        
+        assert result["success"] is True
+        assert result["cache_hits"] == 1
+        assert result["etag_304"] == 1
+        assert result["counters"]["repo_file_fetches"] == 1
+        assert result["rate_limit_remaining"] == 4321
+
+
+class TestResponseJson:
+    """Tests for the optional orjson response parser."""
+    
+    def test_orjson_parses_raw_content(self):
+        """Test that orjson parses the raw body instead of response.json()."""
+        from strix.tools.strixdb import strixdb_repo_extract as mod
+        
+        fake_orjson = MagicMock()
+        fake_orjson.loads.side_effect = json.loads
+        response = MagicMock(content=b'{"items": []}')
+        
+        with patch.object(mod, "_orjson_available", True), \
+                patch.object(mod, "orjson", fake_orjson, create=True):
+            assert mod._response_json(response) == {"items": []}
+        
+        fake_orjson.loads.assert_called_once_with(b'{"items": []}')
+        response.json.assert_not_called()
 
 
 class TestRepoList:
     """Tests for strixdb_repo_list function."""
     
     @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
-    @patch('requests.get')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.post')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
     @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
     def test_list_repos_success(
         self,
         mock_get_file,
         mock_requests_get,
+        mock_requests_post,
         mock_config,
         mock_agent_state,
         mock_strixdb_config,
     ):
-        """Test listing all extracted repos."""
+        """Test listing all extracted repos (GraphQL unavailable, REST fallback)."""
         mock_config.return_value = mock_strixdb_config
+        mock_requests_post.return_value = MagicMock(status_code=401)
         
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -612,6 +1339,7 @@ class TestRepoList:
             {"type": "dir", "name": "owner_repo"},
             {"type": "dir", "name": "another_repo"},
         ]
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_requests_get.return_value = mock_response
         
         mock_get_file.return_value = ({
@@ -629,9 +1357,60 @@ class TestRepoList:
         
         assert result["success"] is True
         assert len(result["repositories"]) == 2
+        assert mock_get_file.call_count == 2
     
     @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
-    @patch('requests.get')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.post')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
+    def test_list_repos_graphql_batch(
+        self,
+        mock_get_file,
+        mock_requests_get,
+        mock_requests_post,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that all manifests are loaded with a single GraphQL request."""
+        mock_config.return_value = mock_strixdb_config
+        
+        mock_requests_get.return_value = MagicMock(status_code=200)
+        mock_requests_get.return_value.json.return_value = [
+            {"type": "dir", "name": "owner_repo"},
+            {"type": "file", "name": "README.md"},
+            {"type": "dir", "name": "another_repo"},
+        ]
+        mock_requests_get.return_value.content = json.dumps(
+            mock_requests_get.return_value.json.return_value
+        ).encode()
+        graphql_response = MagicMock(status_code=200)
+        graphql_response.json.return_value = {
+            "data": {
+                "repository": {
+                    "f0": {"text": json.dumps({"status": "completed", "tags": ["a"]})},
+                    "f1": None,
+                },
+            },
+        }
+        mock_requests_post.return_value = graphql_response
+        
+        from strix.tools.strixdb.strixdb_repo_extract import strixdb_repo_list
+        
+        result = strixdb_repo_list(mock_agent_state)
+        
+        assert result["success"] is True
+        assert [r["slug"] for r in result["repositories"]] == ["owner_repo", "another_repo"]
+        assert result["repositories"][0]["status"] == "completed"
+        assert result["repositories"][1]["status"] == "unknown"
+        assert mock_requests_post.call_count == 1
+        assert mock_requests_post.call_args.args[0] == "https://api.github.com/graphql"
+        query = mock_requests_post.call_args.kwargs["json"]["query"]
+        assert '"main:extracted_repos/another_repo/manifest.json"' in query
+        mock_get_file.assert_not_called()
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
     def test_list_repos_empty(
         self,
         mock_requests_get,
@@ -681,6 +1460,385 @@ class TestExtractAll:
         assert "not initialized" in result["error"].lower()
 
 
+class TestBulkCommit:
+    """Tests for the single-commit Git Data API upload path."""
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.patch')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.post')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
+    def test_bulk_commit_single_tree(
+        self,
+        mock_requests_get,
+        mock_requests_post,
+        mock_requests_patch,
+        mock_strixdb_config,
+    ):
+        """Test that many files land in one tree, one commit and one ref update."""
+        branch_response = MagicMock()
+        branch_response.status_code = 200
+        branch_response.json.return_value = {
+            "commit": {"sha": "base_commit", "commit": {"tree": {"sha": "base_tree"}}},
+        }
+        mock_requests_get.return_value = branch_response
+        
+        tree_response = MagicMock(status_code=201)
+        tree_response.json.return_value = {"sha": "new_tree"}
+        commit_response = MagicMock(status_code=201)
+        commit_response.json.return_value = {"sha": "new_commit"}
+        mock_requests_post.side_effect = [tree_response, commit_response]
+        mock_requests_patch.return_value = MagicMock(status_code=200)
+        
+        from strix.tools.strixdb.strixdb_repo_extract import _bulk_commit
+        
+        assert _bulk_commit(
+            mock_strixdb_config,
+            "owner_repo",
+            {"categories/scripts/a.json": {"id": "a"}, "index.json": {"files": []}},
+        ) is True
+        
+        tree_payload = mock_requests_post.call_args_list[0].kwargs["json"]
+        assert tree_payload["base_tree"] == "base_tree"
+        assert {e["path"] for e in tree_payload["tree"]} == {
+            "extracted_repos/owner_repo/categories/scripts/a.json",
+            "extracted_repos/owner_repo/index.json",
+        }
+        commit_payload = mock_requests_post.call_args_list[1].kwargs["json"]
+        assert commit_payload["parents"] == ["base_commit"]
+        assert mock_requests_patch.call_args.kwargs["json"] == {"sha": "new_commit"}
+
+
+class TestContentDedupe:
+    """Tests for content-addressed dedupe of extracted items."""
+    
+    @staticmethod
+    def _prepared(path, save_path, content_hash="abc123"):
+        return {
+            "success": True,
+            "item": {
+                "id": f"ext_{path}",
+                "original_path": path,
+                "hash": content_hash,
+                "content_length": 6,
+                "content": "admin\n",
+            },
+            "save_path": save_path,
+        }
+    
+    def test_duplicates_become_pointers(self):
+        """Test that identical content in a batch or session is stored as a pointer."""
+        from strix.tools.strixdb.strixdb_repo_extract import (
+            _ExtractionSessionCache,
+            _dedupe_prepared,
+        )
+        
+        with patch(
+            'strix.tools.strixdb.strixdb_repo_extract._SESSION_CACHE',
+            _ExtractionSessionCache(),
+        ) as cache, cache.session("owner_repo"):
+            batch: dict[str, str] = {}
+            first = self._prepared("a.txt", "categories/wordlists/a.json")
+            second = self._prepared("b/a.txt", "categories/wordlists/a_copy.json")
+            other = self._prepared("c.txt", "categories/wordlists/c.json", "ffffff")
+            
+            assert _dedupe_prepared("owner_repo", first, batch) is False
+            assert _dedupe_prepared("owner_repo", second, batch) is True
+            assert _dedupe_prepared("owner_repo", other, batch) is False
+            assert second["item"] == {
+                "id": "ext_b/a.txt",
+                "duplicate_of": "categories/wordlists/a.json",
+                "original_path": "b/a.txt",
+            }
+            
+            # Committed hashes carry over to later batches in the same session
+            cache.remember_hashes("owner_repo", batch)
+            later = self._prepared("d.txt", "categories/payloads/d.json")
+            assert _dedupe_prepared("owner_repo", later, {}) is True
+            assert later["item"]["duplicate_of"] == "categories/wordlists/a.json"
+
+
+class TestConditionalGet:
+    """Tests for ETag-based conditional reads of repo files."""
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
+    def test_not_modified_served_from_cache(self, mock_session_get, mock_strixdb_config):
+        """Test that a 304 returns the cached content and sha."""
+        import base64
+        
+        from strix.tools.strixdb.strixdb_repo_extract import (
+            _ETAG_CACHE,
+            _get_or_create_repo_file,
+        )
+        
+        _ETAG_CACHE.clear()
+        
+        first = MagicMock(status_code=200, headers={"ETag": '"abc"'})
+        first.json.return_value = {
+            "content": base64.b64encode(json.dumps({"files": [1]}).encode()).decode(),
+            "sha": "sha1",
+        }
+        second = MagicMock(status_code=304, headers={})
+        mock_session_get.side_effect = [first, second]
+        
+        content, sha = _get_or_create_repo_file(mock_strixdb_config, "owner_repo", "index.json", {})
+        content["files"].append(2)
+        cached_content, cached_sha = _get_or_create_repo_file(
+            mock_strixdb_config, "owner_repo", "index.json", {}
+        )
+        
+        assert mock_session_get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+        assert cached_content == {"files": [1]}
+        assert cached_sha == sha == "sha1"
+        _ETAG_CACHE.clear()
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
+    def test_use_cache_skips_request_within_ttl(self, mock_session_get, mock_strixdb_config):
+        """Test that read-only callers reuse a fresh entry without a request."""
+        import base64
+        
+        from strix.tools.strixdb.strixdb_repo_extract import (
+            _ETAG_CACHE,
+            _get_or_create_repo_file,
+        )
+        
+        _ETAG_CACHE.clear()
+        
+        first = MagicMock(status_code=200, headers={"ETag": '"abc"'})
+        first.json.return_value = {
+            "content": base64.b64encode(b'{"status": "scanned"}').decode(),
+            "sha": "sha1",
+        }
+        mock_session_get.return_value = first
+        
+        _get_or_create_repo_file(mock_strixdb_config, "owner_repo", "manifest.json", {})
+        content, sha = _get_or_create_repo_file(
+            mock_strixdb_config, "owner_repo", "manifest.json", {}, use_cache=True
+        )
+        
+        assert mock_session_get.call_count == 1
+        assert content == {"status": "scanned"}
+        assert sha == "sha1"
+        
+        with patch(
+            'strix.tools.strixdb.strixdb_repo_extract.REPO_FILE_CACHE_TTL', 0.0
+        ):
+            _get_or_create_repo_file(
+                mock_strixdb_config, "owner_repo", "manifest.json", {}, use_cache=True
+            )
+        assert mock_session_get.call_count == 2
+        _ETAG_CACHE.clear()
+    
+    def test_etags_persist_across_processes(self, tmp_path, monkeypatch):
+        """Test that persisted ETags are restored but never served without validation."""
+        from strix.tools.strixdb import strixdb_repo_extract as mod
+        
+        cache_file = tmp_path / "etags.json"
+        monkeypatch.setattr(mod, "ETAG_CACHE_PATH", str(cache_file))
+        mod._ETAG_CACHE[("testuser/StrixDB", "owner_repo", "index.json")] = (
+            '"abc"', '{"files": []}', "sha1", 123.0
+        )
+        mod._ETAG_CACHE[("testuser/StrixDB", "owner_repo", "payloads/xss.json")] = (
+            '"def"', '{"content": "secret"}', "sha2", 123.0
+        )
+        mod._persist_etags()
+        
+        mod._ETAG_CACHE.clear()
+        monkeypatch.setattr(mod, "_etag_cache_loaded", False)
+        mod._load_persisted_etags()
+        
+        assert mod._ETAG_CACHE[("testuser/StrixDB", "owner_repo", "index.json")] == (
+            '"abc"', '{"files": []}', "sha1", 0.0
+        )
+        # Item bodies stay in memory only
+        assert len(mod._ETAG_CACHE) == 1
+        assert "secret" not in cache_file.read_text()
+        assert cache_file.stat().st_mode & 0o077 == 0
+    
+    def test_repo_file_cache_is_bounded(self, monkeypatch):
+        """Test that the least recently used entries are evicted past the size limit."""
+        from strix.tools.strixdb import strixdb_repo_extract as mod
+        
+        monkeypatch.setattr(mod, "REPO_FILE_CACHE_SIZE", 2)
+        for name in ("a.json", "b.json"):
+            mod._repo_cache_put(("repo", "slug", name), ('"e"', "{}", None, 0.0))
+        mod._repo_cache_get(("repo", "slug", "a.json"))
+        mod._repo_cache_put(("repo", "slug", "c.json"), ('"e"', "{}", None, 0.0))
+        
+        assert list(mod._ETAG_CACHE) == [("repo", "slug", "a.json"), ("repo", "slug", "c.json")]
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._SESSION.get')
+    def test_large_file_read_from_raw_blob(self, mock_session_get, mock_strixdb_config):
+        """Test that a Contents response without inline content falls back to the raw blob."""
+        from strix.tools.strixdb.strixdb_repo_extract import (
+            _ETAG_CACHE,
+            _get_or_create_repo_file,
+        )
+        
+        _ETAG_CACHE.clear()
+        
+        contents = MagicMock(status_code=200, headers={})
+        contents.json.return_value = {"content": "", "encoding": "none", "sha": "bigsha"}
+        blob = MagicMock(status_code=200, content=b'{"files": [1, 2]}')
+        mock_session_get.side_effect = [contents, blob]
+        
+        content, sha = _get_or_create_repo_file(mock_strixdb_config, "owner_repo", "index.json", {})
+        
+        assert content == {"files": [1, 2]}
+        assert sha == "bigsha"
+        blob_call = mock_session_get.call_args
+        assert blob_call.args[0].endswith("/git/blobs/bigsha")
+        assert blob_call.kwargs["headers"]["Accept"] == "application/vnd.github.raw"
+        _ETAG_CACHE.clear()
+
+
+class TestExtractionSessionCache:
+    """Tests for the per-session manifest/index cache."""
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._save_repo_file')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
+    def test_nested_sessions_share_and_flush_once(
+        self,
+        mock_get_file,
+        mock_save,
+        mock_strixdb_config,
+    ):
+        """Test that nested sessions read once and only dirty files are flushed."""
+        mock_get_file.side_effect = lambda config, slug, name, default: ({"files": []}, "sha1")
+        mock_save.return_value = True
+        
+        from strix.tools.strixdb.strixdb_repo_extract import _ExtractionSessionCache
+        
+        cache = _ExtractionSessionCache()
+        
+        with cache.session("owner_repo") as outer_owner:
+            index, _ = cache.load(mock_strixdb_config, "owner_repo", "index.json", {})
+            with cache.session("owner_repo") as inner_owner:
+                inner_index, _ = cache.load(mock_strixdb_config, "owner_repo", "index.json", {})
+                inner_index["files"].append({"path": "a.py"})
+                cache.mark_dirty("owner_repo", "index.json")
+            manifest, _ = cache.load(mock_strixdb_config, "owner_repo", "manifest.json", {})
+            cache.load(mock_strixdb_config, "owner_repo", "notes.json", {})
+            assert cache.flush(mock_strixdb_config, "owner_repo") is True
+        
+        assert outer_owner is True
+        assert inner_owner is False
+        assert index is inner_index
+        assert mock_get_file.call_count == 3
+        # The dirty index is written and its stats mirrored into the manifest;
+        # files that were only read are left alone
+        saved = {call.args[2]: call.kwargs["sha"] for call in mock_save.call_args_list}
+        assert saved == {"index.json": "sha1", "manifest.json": "sha1"}
+        assert manifest["index_stats"] == {"total": 1, "extracted": 0, "pending": 1}
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract._save_repo_file')
+    @patch('strix.tools.strixdb.strixdb_repo_extract._get_or_create_repo_file')
+    def test_failed_write_stays_dirty(
+        self,
+        mock_get_file,
+        mock_save,
+        mock_strixdb_config,
+    ):
+        """Test that a file whose write fails keeps its cached copy and dirty mark."""
+        mock_get_file.side_effect = lambda config, slug, name, default: ({"files": []}, "sha1")
+        mock_save.side_effect = lambda config, slug, name, content, **kwargs: (
+            name != "index.json"
+        )
+        
+        from strix.tools.strixdb.strixdb_repo_extract import _ExtractionSessionCache
+        
+        cache = _ExtractionSessionCache()
+        
+        with cache.session("owner_repo"):
+            index, _ = cache.load(mock_strixdb_config, "owner_repo", "index.json", {})
+            index["files"].append({"path": "a.py"})
+            cache.mark_dirty("owner_repo", "index.json")
+            cache.load(mock_strixdb_config, "owner_repo", "manifest.json", {})
+            assert cache.flush(mock_strixdb_config, "owner_repo") is False
+            
+            mock_save.reset_mock()
+            mock_save.side_effect = None
+            mock_save.return_value = True
+            cached, _ = cache.load(mock_strixdb_config, "owner_repo", "index.json", {})
+            assert cached is index
+            assert cache.flush(mock_strixdb_config, "owner_repo") is True
+        
+        # Only the index is retried; the manifest was written the first time but
+        # is re-summarized alongside the dirty index
+        saved = {call.args[2]: call.args[3] for call in mock_save.call_args_list}
+        assert saved["index.json"]["files"] == [{"path": "a.py"}]
+        assert mock_get_file.call_count == 3
+
+
+class TestRateBudget:
+    """Tests for proactive GitHub rate-limit pacing."""
+    
+    def test_delay_spreads_remaining_budget(self):
+        """Test that a low budget spreads calls over the time until reset."""
+        import time
+        
+        from strix.tools.strixdb.strixdb_repo_extract import _RateBudget
+        
+        from strix.tools.strixdb.strixdb_repo_extract import RATE_LIMIT_MAX_DELAY
+        
+        budget = _RateBudget()
+        assert budget.delay() == 0.0
+        
+        budget.update({"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": str(time.time() + 60)})
+        assert budget.delay() == 0.0
+        
+        budget.update({"X-RateLimit-Remaining": "80", "X-RateLimit-Reset": str(time.time() + 100)})
+        assert 1.0 < budget.delay() <= 1.25
+        
+        # Long pauses are capped
+        budget.update({"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": str(time.time() + 100)})
+        assert budget.delay() == RATE_LIMIT_MAX_DELAY
+    
+    def test_budget_tracked_per_resource(self):
+        """Test that a search window near its small limit does not pace other resources."""
+        import time
+        
+        from strix.tools.strixdb.strixdb_repo_extract import _RateBudget
+        
+        budget = _RateBudget()
+        budget.update({
+            "X-RateLimit-Resource": "search",
+            "X-RateLimit-Limit": "30",
+            "X-RateLimit-Remaining": "28",
+            "X-RateLimit-Reset": str(time.time() + 55),
+        })
+        
+        assert budget.delay("search") == 0.0
+        assert budget.delay() == 0.0
+        assert budget.remaining("search") == 28
+        assert budget.remaining() is None
+        
+        budget.update({
+            "X-RateLimit-Resource": "search",
+            "X-RateLimit-Limit": "30",
+            "X-RateLimit-Remaining": "2",
+            "X-RateLimit-Reset": str(time.time() + 55),
+        })
+        assert budget.delay("search") > 0.0
+        assert budget.delay("graphql") == 0.0
+    
+    @patch('strix.tools.strixdb.strixdb_repo_extract.time.sleep')
+    def test_long_reset_returns_rate_limit_error(self, mock_sleep, monkeypatch):
+        """Test that an exhausted window resetting beyond the cap is not waited out."""
+        import time
+        
+        from strix.tools.strixdb import strixdb_repo_extract as mod
+        
+        monkeypatch.setattr(mod, "_RATE_BUDGET", mod._RateBudget())
+        response = MagicMock(status_code=403, headers={
+            "X-RateLimit-Resource": "core",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(time.time() + 600),
+        })
+        
+        assert mod._rate_limit_hook(response) is response
+        assert not mock_sleep.called
+        assert not response.connection.send.called
+
+
 class TestFileTypeMappings:
     """Tests for file type mappings configuration."""
     
@@ -12,6 +12,7 @@ Tests all target tracking functionality including:
 
 import json
 import os
+import threading
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
@@ -24,6 +25,16 @@ def mock_agent_state():
     return MagicMock()
 
 
+@pytest.fixture(autouse=True)
+def clear_target_cache():
+    """Start each test without target files cached by earlier tests."""
+    from strix.tools.strixdb import strixdb_targets
+    
+    strixdb_targets._ETAG_CACHE.clear()
+    yield
+    strixdb_targets._ETAG_CACHE.clear()
+
+
 @pytest.fixture
 def mock_strixdb_config():
     """Mock StrixDB configuration."""
@@ -66,12 +77,64 @@ class TestTargetSlugGeneration:
         
         # Test simple domain
         assert _sanitize_target_slug("example.com") == "example.com"
+        # Memoized, and the cache hands back the same result
+        assert _sanitize_target_slug("example.com") == "example.com"
+        assert _sanitize_target_slug.cache_info().hits >= 1
         
         # Test subdomain
         result = _sanitize_target_slug("api.staging.example.com")
         assert "api" in result or "example" in result
 
 
+class TestStrixDBConfig:
+    """Tests for the memoized StrixDB configuration."""
+    
+    @pytest.fixture(autouse=True)
+    def _clear_config_cache(self):
+        from strix.tools.strixdb.strixdb_targets import _invalidate_config_cache
+        
+        _invalidate_config_cache()
+        yield
+        _invalidate_config_cache()
+    
+    @patch('strix.tools.strixdb.strixdb_actions._get_strixdb_config')
+    def test_config_resolved_once(self, mock_get_config, mock_strixdb_config):
+        """Test that a configured result is reused across calls."""
+        from strix.tools.strixdb.strixdb_targets import _get_strixdb_config
+        
+        mock_get_config.return_value = mock_strixdb_config
+        
+        assert _get_strixdb_config() == mock_strixdb_config
+        assert _get_strixdb_config() == mock_strixdb_config
+        assert mock_get_config.call_count == 1
+    
+    @patch('strix.tools.strixdb.strixdb_actions._get_strixdb_config')
+    def test_unconfigured_result_not_cached(self, mock_get_config, mock_strixdb_config):
+        """Test that a missing repo is looked up again on the next call."""
+        from strix.tools.strixdb.strixdb_targets import _get_strixdb_config
+        
+        mock_get_config.side_effect = [{**mock_strixdb_config, "repo": ""}, mock_strixdb_config]
+        
+        assert _get_strixdb_config()["repo"] == ""
+        assert _get_strixdb_config() == mock_strixdb_config
+        assert mock_get_config.call_count == 2
+    
+    @patch('strix.tools.strixdb.strixdb_actions._get_strixdb_config')
+    def test_invalidate_config_cache(self, mock_get_config, mock_strixdb_config):
+        """Test that invalidating the cache re-resolves the configuration."""
+        from strix.tools.strixdb.strixdb_targets import (
+            _get_strixdb_config,
+            _invalidate_config_cache,
+        )
+        
+        mock_get_config.return_value = mock_strixdb_config
+        _get_strixdb_config()
+        _invalidate_config_cache()
+        _get_strixdb_config()
+        
+        assert mock_get_config.call_count == 2
+
+
 class TestTargetProfileCreation:
     """Tests for target profile creation."""
     
@@ -129,6 +192,20 @@ class TestTargetProfileCreation:
         assert "reconnaissance" in tested
         assert "vulnerability_types" in tested
         assert "endpoints_tested" in tested
+    
+    def test_profile_uses_given_slug(self):
+        """Test that a precomputed slug is used without re-sanitizing the target."""
+        from strix.tools.strixdb.strixdb_targets import _create_initial_target_profile
+        
+        with patch('strix.tools.strixdb.strixdb_targets._sanitize_target_slug') as mock_sanitize:
+            profile = _create_initial_target_profile(
+                target="https://example.com",
+                target_type="web_app",
+                slug="example.com",
+            )
+        
+        assert profile["slug"] == "example.com"
+        assert not mock_sanitize.called
 
 
 class TestSessionDataCreation:
@@ -153,6 +230,21 @@ class TestSessionDataCreation:
         assert "started_at" in session
         assert session["ended_at"] is None
     
+    def test_session_id_and_start_share_timestamp(self):
+        """Test that a given start time stamps both the session id and started_at."""
+        from strix.tools.strixdb.strixdb_targets import (
+            _create_session_data,
+            _generate_session_id,
+        )
+        
+        now = datetime(2024, 5, 1, 12, 30, 45, tzinfo=timezone.utc)
+        session_id = _generate_session_id(now)
+        session = _create_session_data(session_id=session_id, target_slug="example.com", now=now)
+        
+        assert session_id.startswith("session_20240501_123045_")
+        assert session["started_at"] == now.isoformat()
+        assert session["started_at_epoch"] == now.timestamp()
+    
     def test_session_endpoints_structure(self):
         """Test session endpoints structure."""
         from strix.tools.strixdb.strixdb_targets import _create_session_data
@@ -183,6 +275,343 @@ class TestSessionDataCreation:
         assert "recommendations" in notes
 
 
+class TestTargetFileEncoding:
+    """Tests for target file serialization."""
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.put')
+    def test_save_writes_compact_json(self, mock_put, mock_strixdb_config):
+        """Test that saved target files are compact JSON that reads back unchanged."""
+        import base64
+        
+        from strix.tools.strixdb.strixdb_targets import _save_target_file
+        
+        mock_put.return_value = MagicMock(status_code=201)
+        content = {"findings": [{"title": "XSS", "severity": "high"}], "note": "ünïcode"}
+        
+        assert _save_target_file(mock_strixdb_config, "example.com", "findings.json", content)
+        
+        assert isinstance(mock_put.call_args.kwargs["data"], bytes)
+        assert mock_put.call_args.kwargs["headers"]["Content-Type"] == "application/json"
+        raw = base64.b64decode(json.loads(mock_put.call_args.kwargs["data"])["content"])
+        assert b"\n" not in raw
+        assert json.loads(raw) == content
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.get')
+    def test_get_decodes_content_bytes(self, mock_get, mock_strixdb_config):
+        """Test that target files are parsed straight from the decoded bytes."""
+        import base64
+        
+        from strix.tools.strixdb.strixdb_targets import _get_or_create_target_file
+        
+        mock_response = MagicMock(status_code=200)
+        mock_response.json.return_value = {
+            "sha": "abc",
+            "content": base64.b64encode('{"note": "ünïcode"}'.encode()).decode(),
+        }
+        mock_get.return_value = mock_response
+        
+        content, sha = _get_or_create_target_file(
+            mock_strixdb_config, "example.com", "notes.json", {}
+        )
+        
+        assert content == {"note": "ünïcode"}
+        assert sha == "abc"
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.put')
+    def test_jsonl_index_round_trip(self, mock_put, mock_strixdb_config):
+        """Test that .jsonl target files hold one JSON entry per line."""
+        import base64
+        
+        from strix.tools.strixdb.strixdb_targets import _decode_target_file, _save_target_file
+        
+        mock_put.return_value = MagicMock(status_code=201)
+        entries = [{"id": "finding_1", "title": "XSS"}, {"id": "finding_2", "title": "SQLi"}]
+        
+        assert _save_target_file(
+            mock_strixdb_config, "example.com", "findings/_index.jsonl", entries
+        )
+        
+        raw = base64.b64decode(json.loads(mock_put.call_args.kwargs["data"])["content"])
+        assert raw.count(b"\n") == 2
+        assert _decode_target_file("findings/_index.jsonl", raw) == entries
+        assert _decode_target_file("findings/_index.jsonl", b"") == []
+
+
+class TestTargetSession:
+    """Tests for the shared HTTP session."""
+    
+    def test_session_paced_by_shared_rate_budget(self):
+        """Test that target calls feed and honor the same rate-limit budget as extraction."""
+        from strix.tools.strixdb import strixdb_repo_extract, strixdb_targets
+        
+        assert strixdb_repo_extract._rate_limit_hook in strixdb_targets._SESSION.hooks["response"]
+        retry = strixdb_targets._SESSION.get_adapter("https://api.github.com").max_retries
+        assert 429 in retry.status_forcelist
+        assert retry.respect_retry_after_header
+
+
+class TestTargetConditionalGet:
+    """Tests for ETag revalidation and caching of target files."""
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.get')
+    def test_not_modified_served_from_cache(self, mock_get, mock_strixdb_config):
+        """Test that a 304 returns the cached content and sha."""
+        import base64
+        
+        from strix.tools.strixdb.strixdb_targets import _get_or_create_target_file
+        
+        ok = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+        ok.json.return_value = {
+            "sha": "abc",
+            "content": base64.b64encode(b'{"status": "active"}').decode(),
+        }
+        mock_get.side_effect = [ok, MagicMock(status_code=304, headers={})]
+        
+        first, _ = _get_or_create_target_file(
+            mock_strixdb_config, "example.com", "profile.json", {}
+        )
+        first["status"] = "mutated"
+        second, sha = _get_or_create_target_file(
+            mock_strixdb_config, "example.com", "profile.json", {}
+        )
+        
+        assert second == {"status": "active"}
+        assert sha == "abc"
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.get')
+    def test_known_sha_read_as_raw_blob(self, mock_get, mock_strixdb_config):
+        """Test that a known blob sha is fetched raw, without the Contents API."""
+        from strix.tools.strixdb.strixdb_targets import _get_or_create_target_file
+        
+        mock_get.return_value = MagicMock(status_code=200, content=b'{"id": "f1"}')
+        
+        content, sha = _get_or_create_target_file(
+            mock_strixdb_config, "example.com", "findings/f1.json", {}, sha="b1"
+        )
+        
+        assert content == {"id": "f1"}
+        assert sha == "b1"
+        assert mock_get.call_args.args[0].endswith("/git/blobs/b1")
+        assert mock_get.call_args.kwargs["headers"]["Accept"] == "application/vnd.github.raw"
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.get')
+    def test_raw_blob_cached_by_sha(self, mock_get, mock_strixdb_config):
+        """Test that a blob read is reused for its sha but not trusted without one."""
+        from strix.tools.strixdb.strixdb_targets import _get_or_create_target_file
+        
+        missing = MagicMock(status_code=404, headers={})
+        mock_get.side_effect = [MagicMock(status_code=200, content=b'{"id": "f1"}'), missing]
+        
+        for _ in range(2):
+            content, sha = _get_or_create_target_file(
+                mock_strixdb_config, "example.com", "findings/f1.json", {}, sha="b1"
+            )
+            assert content == {"id": "f1"}
+            assert sha == "b1"
+        assert mock_get.call_count == 1
+        
+        # Without a sha the Contents API is asked, unconditionally
+        _get_or_create_target_file(mock_strixdb_config, "example.com", "findings/f1.json", {})
+        assert mock_get.call_count == 2
+        assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.get')
+    def test_large_file_read_as_raw_blob(self, mock_get, mock_strixdb_config):
+        """Test that files without inline content (over 1MB) are read from the blob."""
+        from strix.tools.strixdb.strixdb_targets import _get_or_create_target_file
+        
+        listing = MagicMock(status_code=200, headers={})
+        listing.json.return_value = {"sha": "big", "encoding": "none", "content": ""}
+        mock_get.side_effect = [listing, MagicMock(status_code=200, content=b'{"discovered": []}')]
+        
+        content, sha = _get_or_create_target_file(
+            mock_strixdb_config, "example.com", "endpoints.json", {}
+        )
+        
+        assert content == {"discovered": []}
+        assert sha == "big"
+        assert mock_get.call_args.args[0].endswith("/git/blobs/big")
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.get')
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.put')
+    def test_save_writes_through_cache(self, mock_put, mock_get, mock_strixdb_config):
+        """Test that a file this process wrote is read back without a request."""
+        from strix.tools.strixdb import strixdb_targets
+        
+        key = ("testuser/StrixDB", "example.com", "profile.json")
+        strixdb_targets._cache_put(key, ('"v1"', b"{}", "abc"))
+        mock_put.return_value = MagicMock(status_code=200)
+        
+        strixdb_targets._save_target_file(
+            mock_strixdb_config, "example.com", "profile.json", {"status": "active"}, "abc"
+        )
+        content, sha = strixdb_targets._get_or_create_target_file(
+            mock_strixdb_config, "example.com", "profile.json", {}
+        )
+        
+        assert content == {"status": "active"}
+        assert sha == strixdb_targets._git_blob_sha(
+            strixdb_targets._encode_target_file("profile.json", {"status": "active"})
+        )
+        assert not mock_get.called
+        
+        # Past the TTL the written entry is read again so other writers show up
+        mock_get.return_value = MagicMock(status_code=404)
+        with patch('strix.tools.strixdb.strixdb_targets.TARGET_WRITE_CACHE_TTL', 0.0):
+            content, sha = strixdb_targets._get_or_create_target_file(
+                mock_strixdb_config, "example.com", "profile.json", {}
+            )
+        assert mock_get.call_count == 1
+        assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+        assert (content, sha) == ({}, None)
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.put')
+    def test_failed_save_drops_cache(self, mock_put, mock_strixdb_config):
+        """Test that a rejected save (e.g. stale sha) forgets the cached file."""
+        from strix.tools.strixdb import strixdb_targets
+        
+        key = ("testuser/StrixDB", "example.com", "profile.json")
+        strixdb_targets._cache_put(key, (None, b"{}", "stale"))
+        mock_put.return_value = MagicMock(status_code=409)
+        
+        assert not strixdb_targets._save_target_file(
+            mock_strixdb_config, "example.com", "profile.json", {"status": "active"}, "stale"
+        )
+        assert key not in strixdb_targets._ETAG_CACHE
+    
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test that the least recently used entry is evicted past the size limit."""
+        from strix.tools.strixdb import strixdb_targets
+        
+        monkeypatch.setattr(strixdb_targets, "TARGET_CACHE_SIZE", 2)
+        strixdb_targets._cache_put(("r", "a", "profile.json"), ('"1"', b"{}", "1"))
+        strixdb_targets._cache_put(("r", "b", "profile.json"), ('"2"', b"{}", "2"))
+        strixdb_targets._cache_get(("r", "a", "profile.json"))
+        strixdb_targets._cache_put(("r", "c", "profile.json"), ('"3"', b"{}", "3"))
+        
+        assert list(strixdb_targets._ETAG_CACHE) == [
+            ("r", "a", "profile.json"),
+            ("r", "c", "profile.json"),
+        ]
+
+
+class TestTargetBatch:
+    """Tests for committing a tool call's writes together."""
+    
+    @staticmethod
+    def _graphql_response(profile_oid):
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"data": {"repository": {
+            "ref": {"target": {"oid": "head", "tree": {"oid": "t0"}}},
+            "f0": {"oid": profile_oid},
+            "f1": None,
+        }}}
+        return response
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.post')
+    def test_branch_state_when_files_unchanged(self, mock_post, mock_strixdb_config):
+        """Test that head and tree come back when every file is still at its read sha."""
+        from strix.tools.strixdb.strixdb_targets import _resolve_branch_state
+        
+        mock_post.return_value = self._graphql_response("p1")
+        
+        state = _resolve_branch_state(
+            mock_strixdb_config, "example.com", {"profile.json": "p1", "notes.json": None}
+        )
+        
+        assert state == ("head", "t0")
+        query = mock_post.call_args.kwargs["json"]["query"]
+        assert '"main:targets/example.com/profile.json"' in query
+        assert mock_post.call_args.args[0] == "https://api.github.com/graphql"
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.post')
+    def test_branch_state_detects_concurrent_write(self, mock_post, mock_strixdb_config):
+        """Test that a file changed since it was read blocks the batch commit."""
+        from strix.tools.strixdb.strixdb_targets import _resolve_branch_state
+        
+        mock_post.return_value = self._graphql_response("p2")
+        
+        assert _resolve_branch_state(
+            mock_strixdb_config, "example.com", {"profile.json": "p1", "notes.json": None}
+        ) is None
+    
+    @patch('strix.tools.strixdb.strixdb_targets._save_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._batch_create_target_files')
+    def test_fallback_reports_failed_files(self, mock_batch, mock_save, mock_strixdb_config):
+        """Test that per-file fallback writes keep their shas and report failures."""
+        from strix.tools.strixdb.strixdb_targets import _TargetBatch
+        
+        mock_batch.return_value = False
+        mock_save.side_effect = lambda config, slug, name, content, sha, commit_message: (
+            name != "profile.json"
+        )
+        
+        with _TargetBatch(mock_strixdb_config, "example.com", "[StrixDB] test") as batch:
+            batch.stage("notes.json", {"entries": []}, "n1")
+            batch.stage("profile.json", {}, "p1")
+        
+        assert batch.failed == {"profile.json"}
+        assert {c.kwargs["sha"] for c in mock_save.call_args_list} == {"n1", "p1"}
+    
+    @patch('strix.tools.strixdb.strixdb_targets._save_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._batch_create_target_files')
+    def test_fallback_stops_when_main_file_fails(self, mock_batch, mock_save, mock_strixdb_config):
+        """Test that dependent files are not written once the main file fails."""
+        from strix.tools.strixdb.strixdb_targets import _TargetBatch
+        
+        mock_batch.return_value = False
+        mock_save.return_value = False
+        
+        with _TargetBatch(
+            mock_strixdb_config, "example.com", "[StrixDB] test", "endpoints.json"
+        ) as batch:
+            batch.stage("profile.json", {}, "p1")
+            batch.stage("endpoints.json", {"discovered": []}, "e1")
+        
+        assert batch.failed == {"endpoints.json", "profile.json"}
+        mock_save.assert_called_once()
+        assert mock_save.call_args.args[2] == "endpoints.json"
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION')
+    def test_unchanged_files_not_committed(self, mock_session, mock_strixdb_config):
+        """Test that files identical to their read version cost no request."""
+        from strix.tools.strixdb.strixdb_targets import (
+            _batch_create_target_files,
+            _encode_target_file,
+            _git_blob_sha,
+            _save_target_file,
+        )
+        
+        profile = {"stats": {"total_findings": 2}}
+        sha = _git_blob_sha(_encode_target_file("profile.json", profile))
+        build_message = MagicMock(return_value="[StrixDB] test")
+        
+        assert _save_target_file(
+            mock_strixdb_config, "example.com", "profile.json", profile,
+            sha=sha, commit_message=build_message,
+        )
+        assert _batch_create_target_files(
+            mock_strixdb_config, "example.com", {"profile.json": profile},
+            commit_message=build_message, expected_shas={"profile.json": sha},
+        )
+        assert not mock_session.method_calls
+        assert not build_message.called
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.put')
+    def test_commit_message_built_on_write(self, mock_put, mock_strixdb_config):
+        """Test that a callable commit message is resolved for the PUT."""
+        from strix.tools.strixdb.strixdb_targets import _save_target_file
+        
+        mock_put.return_value = MagicMock(status_code=200)
+        
+        assert _save_target_file(
+            mock_strixdb_config, "example.com", "profile.json", {"status": "active"},
+            sha="old", commit_message=lambda: "[StrixDB] lazy",
+        )
+        assert json.loads(mock_put.call_args.kwargs["data"])["message"] == "[StrixDB] lazy"
+
+
 class TestTargetInit:
     """Tests for strixdb_target_init function."""
     
@@ -203,20 +632,23 @@ class TestTargetInit:
     
     @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
     @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._batch_create_target_files')
     @patch('strix.tools.strixdb.strixdb_targets._ensure_target_directory')
     @patch('strix.tools.strixdb.strixdb_targets._save_target_file')
     def test_init_new_target(
         self,
         mock_save,
         mock_ensure_dir,
+        mock_batch,
         mock_get_file,
         mock_config,
         mock_agent_state,
         mock_strixdb_config,
     ):
-        """Test initializing a new target."""
+        """Test initializing a new target when files must be written one by one."""
         mock_config.return_value = mock_strixdb_config
         mock_get_file.return_value = ({}, None)  # No existing profile
+        mock_batch.return_value = False
         mock_ensure_dir.return_value = True
         mock_save.return_value = True
         
@@ -234,6 +666,54 @@ class TestTargetInit:
         assert "target" in result
         assert mock_save.called
     
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._save_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.patch')
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.post')
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.get')
+    def test_init_new_target_single_commit(
+        self,
+        mock_get,
+        mock_post,
+        mock_patch,
+        mock_save,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that a new target's files are written in one Git Data API commit."""
+        mock_config.return_value = mock_strixdb_config
+        mock_get_file.return_value = ({}, None)
+        
+        branch = MagicMock(status_code=200)
+        branch.json.return_value = {"commit": {"sha": "head", "commit": {"tree": {"sha": "t0"}}}}
+        mock_get.return_value = branch
+        created = MagicMock(status_code=201)
+        created.json.return_value = {"sha": "new"}
+        mock_post.return_value = created
+        mock_patch.return_value = MagicMock(status_code=200)
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_init
+        
+        result = strixdb_target_init(mock_agent_state, target="https://example.com")
+        
+        assert result["success"] is True
+        assert result["is_new"] is True
+        assert not mock_save.called
+        tree = json.loads(mock_post.call_args_list[0].kwargs["data"])["tree"]
+        assert {entry["path"] for entry in tree} == {
+            f"targets/example.com/{name}"
+            for name in (
+                "README.md", "profile.json", "endpoints.json",
+                "technologies.json", "notes/index.json", "findings/_index.jsonl",
+            )
+        }
+        profile = json.loads(next(e for e in tree if e["path"].endswith("profile.json"))["content"])
+        assert profile["slug"] == "example.com"
+        assert mock_patch.call_args.kwargs["json"] == {"sha": "new"}
+    
     @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
     @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
     def test_init_existing_target(
@@ -316,6 +796,109 @@ class TestTargetSessionStart:
         assert "session_id" in result["session"]
         assert "target_summary" in result
         assert "continuation_guidance" in result
+    
+    @patch('strix.tools.strixdb.strixdb_targets.time.sleep')
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._save_target_file')
+    def test_session_start_merges_profile_update(
+        self,
+        mock_save,
+        mock_get_file,
+        mock_config,
+        mock_sleep,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that a stale profile sha is re-read rather than losing the session count."""
+        mock_config.return_value = mock_strixdb_config
+        profiles = iter([
+            ({"total_sessions": 2, "stats": {}}, "sha1"),  # initial load
+            ({"total_sessions": 2, "stats": {}}, "sha1"),  # merge read, stale by the PUT
+            ({"total_sessions": 3, "stats": {}, "status": "paused"}, "sha2"),
+        ])
+        
+        def get_file_side_effect(config, slug, filename, default):
+            if filename == "profile.json":
+                return next(profiles)
+            return (default, None)
+        
+        mock_get_file.side_effect = get_file_side_effect
+        mock_save.side_effect = lambda config, slug, name, content, sha=None, commit_message="": (
+            name != "profile.json" or sha == "sha2"
+        )
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_session_start
+        
+        result = strixdb_target_session_start(mock_agent_state, target="https://example.com")
+        
+        assert result["success"] is True
+        assert result["target_summary"]["previous_sessions"] == 3
+        saved = mock_save.call_args_list[-1]
+        assert saved.kwargs["sha"] == "sha2"
+        assert saved.args[3]["total_sessions"] == 4
+        assert saved.args[3]["status"] == "active"
+    
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._save_target_file')
+    def test_session_start_summary_from_profile_stats(
+        self,
+        mock_save,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that the endpoint count comes from the profile instead of endpoints.json."""
+        mock_config.return_value = mock_strixdb_config
+        mock_save.return_value = True
+        
+        def get_file_side_effect(config, slug, filename, default):
+            if filename == "profile.json":
+                return ({"stats": {"endpoints_discovered": 42, "total_findings": 3}}, "sha1")
+            if filename == "technologies.json":
+                return ({"identified": [{"technology": "nginx"}], "versions": {}}, "sha2")
+            raise AssertionError(f"unexpected read of {filename}")
+        
+        mock_get_file.side_effect = get_file_side_effect
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_session_start
+        
+        result = strixdb_target_session_start(mock_agent_state, target="https://example.com")
+        
+        assert result["target_summary"]["endpoints_discovered"] == 42
+        assert result["target_summary"]["total_findings"] == 3
+        assert result["target_summary"]["technologies"] == [{"technology": "nginx"}]
+    
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    def test_session_start_loads_files_concurrently(
+        self,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that the profile and technologies are fetched in parallel."""
+        mock_config.return_value = mock_strixdb_config
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def get_file_side_effect(config, slug, filename, default):
+            barrier.wait()  # only passes once both reads are in flight
+            return (default, None)
+        
+        mock_get_file.side_effect = get_file_side_effect
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_session_start
+        
+        result = strixdb_target_session_start(mock_agent_state, target="https://example.com")
+        
+        assert result["success"] is False
+        assert "not found" in result["error"]
+        assert {call.args[2] for call in mock_get_file.call_args_list} == {
+            "profile.json", "technologies.json",
+        }
 
 
 class TestTargetAddFinding:
@@ -324,8 +907,10 @@ class TestTargetAddFinding:
     @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
     @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
     @patch('strix.tools.strixdb.strixdb_targets._save_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._batch_create_target_files')
     def test_add_critical_finding(
         self,
+        mock_batch,
         mock_save,
         mock_get_file,
         mock_config,
@@ -335,10 +920,11 @@ class TestTargetAddFinding:
         """Test adding a critical finding."""
         mock_config.return_value = mock_strixdb_config
         mock_save.return_value = True
+        mock_batch.return_value = True
         
         def get_file_side_effect(config, slug, filename, default):
-            if filename == "findings.json":
-                return ({"vulnerabilities": [], "informational": []}, "sha1")
+            if filename == "findings/_index.jsonl":
+                return ([{"id": "finding_old", "severity": "low"}], "sha1")
             elif filename == "profile.json":
                 return ({"stats": {"total_findings": 0, "critical": 0}, "quick_info": {}, "tested_areas": {}}, "sha2")
             elif "session_" in filename:
@@ -347,7 +933,11 @@ class TestTargetAddFinding:
         
         mock_get_file.side_effect = get_file_side_effect
         
-        from strix.tools.strixdb.strixdb_targets import strixdb_target_add_finding
+        from strix.tools.strixdb.strixdb_targets import (
+            _encode_target_file,
+            _git_blob_sha,
+            strixdb_target_add_finding,
+        )
         
         result = strixdb_target_add_finding(
             mock_agent_state,
@@ -365,6 +955,84 @@ class TestTargetAddFinding:
         assert "finding" in result
         assert result["finding"]["severity"] == "critical"
         assert result["finding"]["vulnerability_type"] == "sqli"
+        
+        # Body, index entry, profile and session land in one commit; of the
+        # findings only the index was read
+        finding_id = result["finding"]["id"]
+        mock_batch.assert_called_once()
+        (_, slug, files), kwargs = mock_batch.call_args
+        assert kwargs["expected_shas"] == {
+            f"findings/{finding_id}.json": None,
+            "findings/_index.jsonl": "sha1",
+            "profile.json": "sha2",
+            "sessions/session_test_123.json": "sha3",
+        }
+        assert files["profile.json"]["stats"] == {"total_findings": 1, "critical": 1}
+        assert files["profile.json"]["tested_areas"]["vulnerability_types"] == ["sqli"]
+        assert files["sessions/session_test_123.json"]["metrics"]["findings_count"] == 1
+        assert not mock_save.called
+        assert files[f"findings/{finding_id}.json"]["proof_of_concept"] == "' OR '1'='1'--"
+        assert [e["id"] for e in files["findings/_index.jsonl"]] == ["finding_old", finding_id]
+        assert files["findings/_index.jsonl"][-1]["severity"] == "critical"
+        assert files["findings/_index.jsonl"][-1]["sha"] == _git_blob_sha(
+            _encode_target_file(f"findings/{finding_id}.json", files[f"findings/{finding_id}.json"])
+        )
+        read = [c.args[2] for c in mock_get_file.call_args_list]
+        assert "findings.json" not in read
+
+    @patch('strix.tools.strixdb.strixdb_targets.time.sleep')
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._save_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._batch_create_target_files')
+    def test_add_finding_reapplies_after_conflict(
+        self,
+        mock_batch,
+        mock_save,
+        mock_get_file,
+        mock_config,
+        mock_sleep,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """A rejected index write is re-read and merged onto the newer version."""
+        mock_config.return_value = mock_strixdb_config
+        mock_batch.return_value = False
+        index_versions = iter([
+            ([], "sha1"),
+            ([], "sha1"),
+            ([], "sha1"),
+            ([{"id": "other"}], "sha1b"),
+        ])
+        
+        def get_file_side_effect(config, slug, filename, default):
+            if filename == "findings/_index.jsonl":
+                return next(index_versions)
+            return (default, None)
+        
+        mock_get_file.side_effect = get_file_side_effect
+        # Body PUT succeeds, first index PUT loses the race, everything after succeeds
+        mock_save.side_effect = [True, False, True, True]
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_add_finding
+        
+        result = strixdb_target_add_finding(
+            mock_agent_state,
+            target="https://example.com",
+            session_id="session_test_123",
+            title="Reflected XSS",
+            severity="medium",
+            vulnerability_type="xss",
+            description="Reflected XSS in search",
+        )
+        
+        assert result["success"] is True
+        mock_sleep.assert_called_once()
+        body_args, _ = mock_save.call_args_list[0]
+        assert body_args[2] == f"findings/{result['finding']['id']}.json"
+        retry_args, retry_kwargs = mock_save.call_args_list[2]
+        assert retry_kwargs["sha"] == "sha1b"
+        assert [e["id"] for e in retry_args[3]] == ["other", result["finding"]["id"]]
 
 
 class TestTargetAddEndpoint:
@@ -373,8 +1041,10 @@ class TestTargetAddEndpoint:
     @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
     @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
     @patch('strix.tools.strixdb.strixdb_targets._save_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._batch_create_target_files')
     def test_add_new_endpoint(
         self,
+        mock_batch,
         mock_save,
         mock_get_file,
         mock_config,
@@ -384,6 +1054,7 @@ class TestTargetAddEndpoint:
         """Test adding a new endpoint."""
         mock_config.return_value = mock_strixdb_config
         mock_save.return_value = True
+        mock_batch.return_value = True
         
         def get_file_side_effect(config, slug, filename, default):
             if filename == "endpoints.json":
@@ -411,16 +1082,188 @@ class TestTargetAddEndpoint:
         assert result["success"] is True
         assert result["is_new"] is True
         assert result["endpoint"]["endpoint"] == "/api/v1/users"
+        
+        # Endpoints, profile and session land in one sha-checked commit
+        (_, _, files), kwargs = mock_batch.call_args
+        assert kwargs["expected_shas"] == {
+            "endpoints.json": "sha1",
+            "profile.json": "sha2",
+            "sessions/session_test_123.json": "sha3",
+        }
+        assert files["profile.json"]["stats"]["endpoints_discovered"] == 1
+        assert files["profile.json"]["quick_info"]["key_endpoints"] == ["POST /api/v1/users"]
+        assert not mock_save.called
+        
+        # When neither the batch nor the endpoints PUT goes through, profile and
+        # session are left alone so a retry does not count the endpoint twice
+        mock_batch.return_value = False
+        mock_save.return_value = False
+        result = strixdb_target_add_endpoint(
+            mock_agent_state,
+            target="https://example.com",
+            session_id="session_test_123",
+            endpoint="/api/v1/users",
+            method="POST",
+        )
+        assert result == {"success": False, "error": "Failed to save endpoint"}
+        assert [c.args[2] for c in mock_save.call_args_list] == ["endpoints.json"]
+    
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._batch_create_target_files')
+    def test_existing_endpoint_keeps_counter(
+        self,
+        mock_batch,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that re-adding a known endpoint does not bump the profile counter."""
+        mock_config.return_value = mock_strixdb_config
+        mock_batch.return_value = True
+        
+        def get_file_side_effect(config, slug, filename, default):
+            if filename == "endpoints.json":
+                discovered = [
+                    {"endpoint": "/login", "method": "POST"},
+                    {"endpoint": "/login", "method": "GET"},
+                ]
+                return ({"discovered": discovered, "tested": [], "vulnerable": []}, "sha1")
+            elif filename == "profile.json":
+                # Counter is authoritative even when it differs from the list length
+                return ({"stats": {"endpoints_discovered": 7}, "quick_info": {}}, "sha2")
+            elif "session_" in filename:
+                return ({"endpoints": {"discovered": ["GET /login"]}, "metrics": {}}, "sha3")
+            return (default, None)
+        
+        mock_get_file.side_effect = get_file_side_effect
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_add_endpoint
+        
+        result = strixdb_target_add_endpoint(
+            mock_agent_state,
+            target="https://example.com",
+            session_id="session_test_123",
+            endpoint="/login",
+            notes="login form",
+        )
+        
+        assert result["is_new"] is False
+        (_, _, files), _ = mock_batch.call_args
+        assert files["profile.json"]["stats"]["endpoints_discovered"] == 7
+        # Nothing new for the session, so it is not rewritten
+        assert "sessions/session_test_123.json" not in files
+        # Merged into the matching (method, endpoint) entry, nothing appended
+        post, get = files["endpoints.json"]["discovered"]
+        assert get["notes"] == "login form"
+        assert "notes" not in post
+
+
+class TestTargetAddNote:
+    """Tests for strixdb_target_add_note function."""
+    
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._batch_create_target_files')
+    def test_add_note_appends_to_current_chunk(
+        self,
+        mock_batch,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that a note is appended to the chunk named by the notes index."""
+        mock_config.return_value = mock_strixdb_config
+        mock_batch.return_value = True
+        
+        def get_file_side_effect(config, slug, filename, default):
+            if filename == "notes/index.json":
+                return ({"current_chunk": 3, "chunk_entries": 1}, "idx")
+            elif filename == "notes/0003.json":
+                return ({"entries": [{"id": "note_old"}]}, "c3")
+            return (default, None)
+        
+        mock_get_file.side_effect = get_file_side_effect
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_add_note
+        
+        result = strixdb_target_add_note(
+            mock_agent_state,
+            target="example.com",
+            session_id="session_test_123",
+            note="Rate limiting disabled on /login",
+        )
+        
+        assert result["success"] is True
+        (_, _, files), kwargs = mock_batch.call_args
+        assert [e["id"] for e in files["notes/0003.json"]["entries"]] == [
+            "note_old", result["note_id"],
+        ]
+        assert files["notes/index.json"] == {"current_chunk": 3, "chunk_entries": 2}
+        assert kwargs["expected_shas"] == {"notes/0003.json": "c3", "notes/index.json": "idx"}
+        assert "notes.json" not in files
+    
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._batch_create_target_files')
+    def test_add_note_starts_new_chunk_when_full(
+        self,
+        mock_batch,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that a full chunk is left alone and the next one is started."""
+        from strix.tools.strixdb.strixdb_targets import (
+            NOTES_CHUNK_SIZE,
+            strixdb_target_add_note,
+        )
+        
+        mock_config.return_value = mock_strixdb_config
+        mock_batch.return_value = True
+        
+        def get_file_side_effect(config, slug, filename, default):
+            if filename == "notes/index.json":
+                return ({"current_chunk": 0, "chunk_entries": NOTES_CHUNK_SIZE}, "idx")
+            return (default, None)
+        
+        mock_get_file.side_effect = get_file_side_effect
+        
+        result = strixdb_target_add_note(
+            mock_agent_state,
+            target="example.com",
+            session_id="session_test_123",
+            note="Second chunk",
+        )
+        
+        assert result["success"] is True
+        read = [c.args[2] for c in mock_get_file.call_args_list]
+        assert "notes/0000.json" not in read
+        (_, _, files), _ = mock_batch.call_args
+        assert len(files["notes/0001.json"]["entries"]) == 1
+        assert files["notes/index.json"] == {"current_chunk": 1, "chunk_entries": 1}
 
 
 class TestTargetUpdateProgress:
     """Tests for strixdb_target_update_progress function."""
     
+    def test_merge_unique_keeps_order(self):
+        """Test that merged lists keep first-seen order and drop repeats."""
+        from strix.tools.strixdb.strixdb_targets import _merge_unique
+        
+        assert _merge_unique(["b", "a"], ["c", "a", "b", "d"]) == ["b", "a", "c", "d"]
+        assert _merge_unique([], []) == []
+    
     @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
     @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
     @patch('strix.tools.strixdb.strixdb_targets._save_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._batch_create_target_files')
     def test_update_progress(
         self,
+        mock_batch,
         mock_save,
         mock_get_file,
         mock_config,
@@ -430,6 +1273,8 @@ class TestTargetUpdateProgress:
         """Test updating progress tracking."""
         mock_config.return_value = mock_strixdb_config
         mock_save.return_value = True
+        # Batch commit unavailable: falls back to one sha-checked PUT per file
+        mock_batch.return_value = False
         
         def get_file_side_effect(config, slug, filename, default):
             if filename == "profile.json":
@@ -459,22 +1304,217 @@ class TestTargetUpdateProgress:
         assert "tested_areas" in result
         assert "subdomain_enum" in result["tested_areas"]["reconnaissance"]
         assert "sqli" in result["tested_areas"]["vulnerability_types"]
+        saved = {c.args[2]: c.kwargs["sha"] for c in mock_save.call_args_list}
+        assert saved == {"profile.json": "sha1", "sessions/session_test_123.json": "sha2"}
+
+
+class TestTargetGet:
+    """Tests for strixdb_target_get function."""
+    
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._batch_create_target_files')
+    def test_get_merges_legacy_and_indexed_findings(
+        self,
+        mock_batch,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that findings come from findings.json and the per-finding files."""
+        mock_config.return_value = mock_strixdb_config
+        mock_batch.return_value = False
+        
+        files = {
+            "profile.json": {"target": "example.com"},
+            "findings.json": {"vulnerabilities": [{"id": "old"}], "informational": []},
+            "findings/_index.jsonl": [{"id": "f1"}, {"id": "f2"}],
+            "findings/f1.json": {"id": "f1", "severity": "high"},
+            "findings/f2.json": {"id": "f2", "severity": "info"},
+        }
+        
+        def get_file_side_effect(config, slug, filename, default, sha=None):
+            if filename in files:
+                return (files[filename], "sha")
+            return (default, None)
+        
+        mock_get_file.side_effect = get_file_side_effect
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_get
+        
+        result = strixdb_target_get(mock_agent_state, target="example.com")
+        
+        findings = result["target"]["findings"]
+        assert [f["id"] for f in findings["vulnerabilities"]] == ["old", "f1"]
+        assert [f["id"] for f in findings["informational"]] == ["f2"]
+    
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._batch_create_target_files')
+    def test_get_migrates_legacy_findings(
+        self,
+        mock_batch,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that a legacy findings.json is split into findings/ in one commit."""
+        mock_config.return_value = mock_strixdb_config
+        mock_batch.return_value = True
+        
+        legacy = {"id": "old", "severity": "high", "title": "IDOR", "created_at": "t0"}
+        files = {
+            "profile.json": {"target": "example.com"},
+            "findings.json": {"vulnerabilities": [legacy], "informational": []},
+            "findings/_index.jsonl": [{"id": "f1"}],
+            "findings/f1.json": {"id": "f1", "severity": "low"},
+        }
+        
+        def get_file_side_effect(config, slug, filename, default, sha=None):
+            if filename in files:
+                return (files[filename], "sha")
+            return (default, None)
+        
+        mock_get_file.side_effect = get_file_side_effect
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_get
+        
+        result = strixdb_target_get(mock_agent_state, target="example.com")
+        
+        (_, slug, written), _ = mock_batch.call_args
+        assert written["findings/old.json"] == legacy
+        assert [e["id"] for e in written["findings/_index.jsonl"]] == ["old", "f1"]
+        assert written["findings.json"] is None
+        read = [c.args[2] for c in mock_get_file.call_args_list]
+        assert "findings/old.json" not in read
+        assert [f["id"] for f in result["target"]["findings"]["vulnerabilities"]] == ["old", "f1"]
+    
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.patch')
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.post')
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.get')
+    def test_batch_none_content_deletes_file(
+        self, mock_get, mock_post, mock_patch, mock_strixdb_config
+    ):
+        """Test that a None entry becomes a tree deletion."""
+        from strix.tools.strixdb.strixdb_targets import _batch_create_target_files
+        
+        branch = MagicMock(status_code=200)
+        branch.json.return_value = {"commit": {"sha": "head", "commit": {"tree": {"sha": "t0"}}}}
+        mock_get.return_value = branch
+        created = MagicMock(status_code=201)
+        created.json.return_value = {"sha": "new"}
+        mock_post.return_value = created
+        mock_patch.return_value = MagicMock(status_code=200)
+        
+        assert _batch_create_target_files(
+            mock_strixdb_config, "example.com", {"notes.json": {}, "findings.json": None}
+        )
+        
+        tree = json.loads(mock_post.call_args_list[0].kwargs["data"])["tree"]
+        deleted = next(e for e in tree if e["path"] == "targets/example.com/findings.json")
+        assert deleted["sha"] is None
+        assert "content" not in deleted
+
+
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    def test_get_loads_sections_concurrently(
+        self,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that the profile and endpoints are read at the same time."""
+        mock_config.return_value = mock_strixdb_config
+        # Both reads must be in flight together to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def get_file_side_effect(config, slug, filename, default, sha=None):
+            barrier.wait()
+            if filename == "profile.json":
+                return ({"target": "example.com"}, "p1")
+            return ({"discovered": ["/api"], "tested": [], "vulnerable": []}, "e1")
+        
+        mock_get_file.side_effect = get_file_side_effect
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_get
+        
+        result = strixdb_target_get(
+            mock_agent_state,
+            target="example.com",
+            include_findings=False,
+        )
+        
+        assert result["success"] is True
+        assert result["target"]["profile"] == {"target": "example.com"}
+        assert result["target"]["endpoints"]["discovered"] == ["/api"]
+        assert "findings" not in result["target"]
+    
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    def test_get_reads_recent_note_chunks(
+        self,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that notes come from notes.json first, then the last chunk files."""
+        from strix.tools.strixdb.strixdb_targets import NOTES_READ_CHUNKS
+        
+        mock_config.return_value = mock_strixdb_config
+        current = NOTES_READ_CHUNKS + 1
+        files = {
+            "profile.json": {"target": "example.com"},
+            "notes.json": {"entries": [{"id": "legacy"}]},
+            "notes/index.json": {"current_chunk": current, "chunk_entries": 1},
+            **{
+                f"notes/{chunk:04d}.json": {"entries": [{"id": f"n{chunk}"}]}
+                for chunk in range(current + 1)
+            },
+        }
+        
+        def get_file_side_effect(config, slug, filename, default, sha=None):
+            if filename in files:
+                return (files[filename], "sha")
+            return (default, None)
+        
+        mock_get_file.side_effect = get_file_side_effect
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_get
+        
+        result = strixdb_target_get(
+            mock_agent_state,
+            target="example.com",
+            include_findings=False,
+            include_endpoints=False,
+            include_notes=True,
+        )
+        
+        ids = [e["id"] for e in result["target"]["notes"]["entries"]]
+        assert ids == ["legacy", *(f"n{c}" for c in range(current - NOTES_READ_CHUNKS + 1, current + 1))]
 
 
 class TestTargetList:
     """Tests for strixdb_target_list function."""
     
     @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
-    @patch('requests.get')
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.post')
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.get')
     def test_list_targets(
         self,
         mock_requests_get,
+        mock_post,
         mock_config,
         mock_agent_state,
         mock_strixdb_config,
     ):
         """Test listing all targets."""
         mock_config.return_value = mock_strixdb_config
+        mock_post.return_value = MagicMock(status_code=502)  # GraphQL unavailable
         
         # Mock directory listing
         mock_response = MagicMock()
@@ -501,6 +1541,51 @@ class TestTargetList:
         
         assert result["success"] is True
         assert len(result["targets"]) == 2
+        assert mock_get.call_count == 2
+    
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.post')
+    @patch('strix.tools.strixdb.strixdb_targets._SESSION.get')
+    def test_list_targets_loads_profiles_in_one_query(
+        self,
+        mock_requests_get,
+        mock_post,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Profiles come from one GraphQL query; blobs without text are read by sha."""
+        mock_config.return_value = mock_strixdb_config
+        mock_requests_get.return_value = MagicMock(status_code=200)
+        mock_requests_get.return_value.json.return_value = [
+            {"type": "dir", "name": "example.com"},
+            {"type": "file", "name": "README.md"},
+            {"type": "dir", "name": "packed.com"},
+            {"type": "dir", "name": "empty.com"},
+        ]
+        mock_post.return_value = MagicMock(status_code=200)
+        mock_post.return_value.json.return_value = {"data": {"repository": {
+            "f0": {"oid": "a1", "text": json.dumps({"target": "example.com", "status": "active"})},
+            "f1": {"oid": "b2", "text": None},
+            "f2": None,
+        }}}
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_list
+        
+        with patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file') as mock_get:
+            mock_get.return_value = ({"target": "packed.com", "status": "paused"}, "b2")
+            result = strixdb_target_list(mock_agent_state, include_stats=True)
+        
+        assert result["success"] is True
+        assert [t["slug"] for t in result["targets"]] == ["example.com", "packed.com", "empty.com"]
+        assert result["targets"][0]["status"] == "active"
+        assert result["targets"][1]["status"] == "paused"
+        assert "status" not in result["targets"][2]
+        assert mock_requests_get.call_count == 1
+        assert mock_post.call_count == 1
+        mock_get.assert_called_once_with(
+            mock_strixdb_config, "packed.com", "profile.json", {}, sha="b2"
+        )
 
 
 class TestTargetSessionEnd:
@@ -553,3 +1638,84 @@ class TestTargetSessionEnd:
         assert result["success"] is True
         assert "session_summary" in result
         assert "continuation_saved" in result
+    
+    @pytest.mark.parametrize("started", [
+        {"started_at_epoch": 1_000.0, "started_at": "not parsed when the epoch is stored"},
+        {"started_at": "1970-01-01T00:16:40Z"},  # sessions saved before started_at_epoch
+    ])
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._save_target_file')
+    def test_session_end_duration(
+        self,
+        mock_save,
+        mock_get_file,
+        mock_config,
+        started,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that the duration comes from started_at_epoch, else started_at."""
+        mock_config.return_value = mock_strixdb_config
+        mock_save.return_value = True
+        mock_get_file.side_effect = lambda config, slug, filename, default: (
+            ({**started, "metrics": {}}, "sha1") if "session_" in filename else (default, None)
+        )
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_session_end
+        
+        with patch('strix.tools.strixdb.strixdb_targets.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime.fromtimestamp(1_000 + 90 * 60, timezone.utc)
+            mock_datetime.fromisoformat = datetime.fromisoformat
+            result = strixdb_target_session_end(
+                mock_agent_state,
+                target="https://example.com",
+                session_id="session_test_123",
+                summary="Done",
+            )
+        
+        assert result["success"] is True
+        session_saved = mock_save.call_args_list[0].args[3]
+        assert session_saved["duration_minutes"] == 90
+    
+    @patch('strix.tools.strixdb.strixdb_targets._get_strixdb_config')
+    @patch('strix.tools.strixdb.strixdb_targets._get_or_create_target_file')
+    @patch('strix.tools.strixdb.strixdb_targets._save_target_file')
+    def test_session_end_merges_pending_work_in_order(
+        self,
+        mock_save,
+        mock_get_file,
+        mock_config,
+        mock_agent_state,
+        mock_strixdb_config,
+    ):
+        """Test that merged follow-ups are de-duplicated and keep their order."""
+        mock_config.return_value = mock_strixdb_config
+        mock_save.return_value = True
+        profile = {
+            "status": "active",
+            "pending_work": {"high_priority": ["a", "b"], "medium_priority": [], "follow_ups": []},
+            "session_history": [],
+            "quick_info": {},
+        }
+        
+        def get_file_side_effect(config, slug, filename, default):
+            if "session_" in filename:
+                return ({"started_at": "2024-01-01T10:00:00+00:00", "metrics": {}}, "sha1")
+            if filename == "profile.json":
+                return (profile, "sha2")
+            return (default, None)
+        
+        mock_get_file.side_effect = get_file_side_effect
+        
+        from strix.tools.strixdb.strixdb_targets import strixdb_target_session_end
+        
+        strixdb_target_session_end(
+            mock_agent_state,
+            target="https://example.com",
+            session_id="session_test_123",
+            summary="Done",
+            immediate_follow_ups=["c", "a", "d"],
+        )
+        
+        assert profile["pending_work"]["high_priority"] == ["a", "b", "c", "d"]
@@ -0,0 +1,98 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from strix.tools.finish.finish_actions import (
+    _check_active_agents,
+    _check_minimum_time_elapsed,
+    finish_scan,
+)
+
+
+def _timed_state(elapsed, remaining=0.0, total=100.0):
+    return SimpleNamespace(
+        parent_id=None,
+        agent_id="root",
+        session_start_time=datetime.now(timezone.utc),
+        session_duration_minutes=total,
+        get_elapsed_session_minutes=elapsed,
+        get_remaining_session_minutes=lambda: remaining,
+    )
+
+
+class TestCheckMinimumTimeElapsed:
+    """Tests for the minimum time usage check."""
+
+    def test_enough_time_used_passes(self) -> None:
+        state = _timed_state(lambda: 85.0, remaining=15.0)
+
+        assert _check_minimum_time_elapsed(state, _min_pct=80) is None
+
+    def test_too_early_is_rejected(self) -> None:
+        state = _timed_state(lambda: 20.0, remaining=80.0)
+
+        result = _check_minimum_time_elapsed(state, _min_pct=80)
+
+        assert result is not None
+        assert result["success"] is False
+        assert result["time_stats"]["usage_percent"] == 20.0
+        assert result["time_stats"]["additional_minutes_needed"] == 60.0
+
+    def test_no_timer_passes(self) -> None:
+        assert _check_minimum_time_elapsed(None, _min_pct=80) is None
+        assert _check_minimum_time_elapsed(SimpleNamespace(), _min_pct=80) is None
+
+    def test_timer_error_allows_finish(self) -> None:
+        def naive_minus_aware() -> float:
+            return (datetime.now() - datetime.now(timezone.utc)).total_seconds()
+
+        state = _timed_state(naive_minus_aware)
+
+        with patch("strix.tools.finish.finish_actions.logger") as mock_logger:
+            assert _check_minimum_time_elapsed(state, _min_pct=80) is None
+
+        mock_logger.warning.assert_called_once()
+
+    def test_timer_attribute_error_allows_finish(self) -> None:
+        def broken() -> float:
+            raise AttributeError("session_start_time")
+
+        assert _check_minimum_time_elapsed(_timed_state(broken), _min_pct=80) is None
+
+
+class TestFinishScan:
+    """Tests for finish_scan validation."""
+
+    @patch.dict(
+        "strix.tools.agents_graph.agents_graph_actions._agent_graph", {"nodes": {}}
+    )
+    def test_timer_error_does_not_fail_finish(self) -> None:
+        def broken() -> float:
+            raise TypeError("can't subtract offset-naive and offset-aware datetimes")
+
+        with patch(
+            "strix.tools.finish.finish_actions._finalize_with_tracer",
+            return_value={"success": True, "scan_completed": True},
+        ) as mock_finalize:
+            result = finish_scan("report", agent_state=_timed_state(broken))
+
+        assert result["success"] is True
+        mock_finalize.assert_called_once_with("report", True)
+
+
+class TestCheckActiveAgents:
+    """Tests for the active subagent check."""
+
+    @patch.dict("strix.tools.agents_graph.agents_graph_actions._agent_graph", clear=True)
+    def test_graph_without_nodes_has_no_active_agents(self) -> None:
+        assert _check_active_agents(None) is None
+
+    @patch.dict(
+        "strix.tools.agents_graph.agents_graph_actions._agent_graph",
+        {"nodes": {"a1": {"status": "running", "name": "recon"}, "root": {"status": "running"}}},
+    )
+    def test_running_subagent_blocks_finish(self) -> None:
+        result = _check_active_agents(SimpleNamespace(agent_id="root"))
+
+        assert result is not None
+        assert result["active_agents"]["running"] == 1